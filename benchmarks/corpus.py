@@ -0,0 +1,245 @@
+"""
+Synthetic Corpus Generator for EU_GraphRAG benchmarks
+
+Produces realistic-looking LegalDocuments (German laws with amendment
+history, EU directives and regulations), article records in the shape
+emitted by GesetzImInternetAdapter, EuroVoc concepts, and SUPERSEDES /
+IMPLEMENTED_BY / CONCERNS edges. Generation is deterministic per seed.
+"""
+
+import hashlib
+import json
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from src.ingestion.pipeline import LegalDocument, LawSourceType
+
+_WORDS = (
+    "Anspruch Leistung Versicherte Träger Beitrag Rente Arbeitgeber Behörde Antrag "
+    "Verfahren Bescheid Frist Verordnung Richtlinie Mitgliedstaat Datenschutz Verarbeitung "
+    "personenbezogener Daten Einwilligung Aufsicht Bundesministerium Zuständigkeit Erstattung "
+    "Pflege Krankenversicherung Arbeitslosengeld Grundsicherung Kinder Jugendhilfe Teilhabe "
+    "Eingliederung Unfallversicherung Sozialgericht Widerspruch Auskunft Meldepflicht Nachweis "
+    "Zeitraum Bemessung Einkommen Vermögen Pflicht Recht Absatz Satz Nummer gilt entsprechend "
+    "soweit nicht anderes bestimmt ist sind hat wird nach der die das und oder"
+).split()
+
+_AUTHORITIES = (
+    "Bundesministerium für Arbeit und Soziales",
+    "Bundesministerium der Justiz",
+    "Bundesministerium für Gesundheit",
+    "Bundesministerium des Innern und für Heimat",
+    "Bundesministerium der Finanzen",
+)
+
+_POLICY_AREAS = ("social_affairs", "data_protection", "health", "justice", "employment", "taxation")
+
+_IMPLEMENTATION_STATUSES = ("complete", "partial", "partial", "complete", "pending")
+
+
+@dataclass
+class SyntheticCorpus:
+    """Generated documents, articles, concepts and edges"""
+    documents: List[LegalDocument] = field(default_factory=list)
+    articles: List[Dict] = field(default_factory=list)
+    concepts: List[Dict] = field(default_factory=list)
+    # (from_uri, to_uri, rel_type, props, from_label, to_label)
+    edges: List[Tuple] = field(default_factory=list)
+
+    # Lookups used by the fake driver to answer read queries
+    supersedes: Dict[str, List[str]] = field(default_factory=dict)
+    implementations: Dict[str, List[Tuple[str, Dict]]] = field(default_factory=dict)
+    concerns: Dict[str, List[str]] = field(default_factory=dict)
+
+    @property
+    def current_laws(self) -> List[str]:
+        """ELI URIs of the newest version of every German law"""
+        return list(self.supersedes)
+
+    @property
+    def directives(self) -> List[str]:
+        return list(self.implementations)
+
+    def edges_of_type(self, rel_type: str) -> List[Tuple]:
+        return [edge for edge in self.edges if edge[2] == rel_type]
+
+    def to_gii_xml(self, law_uri: str) -> bytes:
+        """Render a law and its articles in gesetze-im-internet XML"""
+        document = next(d for d in self.documents if d.eli_uri == law_uri)
+        abbreviation = law_uri.split(':')[2].upper()
+        periodikum, _, zitstelle = (document.bgbl_reference or "BGBl I 2000, 1").partition(' ')
+        parts = [
+            '<?xml version="1.0" encoding="UTF-8"?><dokumente>',
+            f'<norm><metadaten><jurabk>{abbreviation}</jurabk>'
+            f'<ausfertigung-datum>{document.date_document:%Y-%m-%d}</ausfertigung-datum>'
+            f'<fundstelle><periodikum>{escape(periodikum)}</periodikum>'
+            f'<zitstelle>{escape(zitstelle)}</zitstelle></fundstelle>'
+            f'<langue>{escape(document.title_de)}</langue></metadaten><textdaten/></norm>',
+        ]
+        for article in self.articles:
+            if article['law_uri'] != law_uri:
+                continue
+            paragraphs = ''.join(f'<P>{escape(p)}</P>' for p in article['text_content'].split('. '))
+            parts.append(
+                f'<norm><metadaten><jurabk>{abbreviation}</jurabk>'
+                f'<enbez>{escape(article["designation"])}</enbez>'
+                f'<titel>{escape(article["title"])}</titel></metadaten>'
+                f'<textdaten><text><Content>{paragraphs}</Content></text></textdaten></norm>'
+            )
+        parts.append('</dokumente>')
+        return ''.join(parts).encode('utf-8')
+
+
+def _sentence(rng: random.Random, min_words: int, max_words: int) -> str:
+    words = rng.choices(_WORDS, k=rng.randint(min_words, max_words))
+    return ' '.join(words).capitalize()
+
+
+def _article(rng: random.Random, law_uri: str, number: int) -> Dict:
+    text = '. '.join(_sentence(rng, 8, 30) for _ in range(rng.randint(2, 8))) + '.'
+    title = _sentence(rng, 2, 6)
+    article = {
+        'eli_uri': f"{law_uri}:art:{number}",
+        'law_uri': law_uri,
+        'article_number': str(number),
+        'designation': f"§ {number}",
+        'title': title,
+        'text_content': text,
+    }
+    content = json.dumps([str(number), title, text], ensure_ascii=False)
+    article['document_hash'] = hashlib.sha256(content.encode()).hexdigest()
+    return article
+
+
+def generate_corpus(n_laws: int = 1000, articles_per_law: int = 20,
+                    versions_per_law: int = 3, n_directives: Optional[int] = None,
+                    n_regulations: Optional[int] = None, n_concepts: int = 500,
+                    invalid_ratio: float = 0.05, seed: int = 42) -> SyntheticCorpus:
+    """
+    Generate a synthetic legal corpus
+
+    Args:
+        n_laws: German laws (each with versions_per_law versions)
+        articles_per_law: Average articles of the current version of a law
+        versions_per_law: Versions per law, chained by SUPERSEDES
+        n_directives: EU directives (default n_laws // 5)
+        n_regulations: EU regulations (default n_laws // 10)
+        n_concepts: EuroVoc concepts
+        invalid_ratio: Share of documents missing mandatory metadata
+        seed: Random seed
+
+    Returns:
+        SyntheticCorpus
+    """
+    rng = random.Random(seed)
+    corpus = SyntheticCorpus()
+    n_directives = n_laws // 5 if n_directives is None else n_directives
+    n_regulations = n_laws // 10 if n_regulations is None else n_regulations
+    base_date = datetime(1950, 1, 1)
+
+    corpus.concepts = [
+        {
+            'eurovoc_id': str(1000 + i),
+            'pref_label_de': _sentence(rng, 1, 3),
+            'pref_label_en': f"concept {i}",
+        }
+        for i in range(n_concepts)
+    ]
+
+    def incomplete() -> bool:
+        return rng.random() < invalid_ratio
+
+    # German laws with amendment history (newest version first)
+    for i in range(n_laws):
+        slug = f"g{i:05d}"
+        first = base_date + timedelta(days=rng.randint(0, 365 * 60))
+        dates = [first]
+        for _ in range(versions_per_law - 1):
+            dates.append(dates[-1] + timedelta(days=rng.randint(30, 365 * 10)))
+        dates.reverse()
+        chain = [f"eli:bund:{slug}:{d:%Y:%m:%d}" for d in dates]
+        corpus.supersedes[chain[0]] = chain
+
+        title = f"Gesetz über {_sentence(rng, 2, 5)}"
+        for version, (uri, issued) in enumerate(zip(chain, dates)):
+            corpus.documents.append(LegalDocument(
+                eli_uri=uri,
+                source_type=LawSourceType.GERMAN_LAW,
+                title_de=title,
+                bgbl_reference=None if incomplete() else f"BGBl I {issued.year}, {rng.randint(1, 3000)}",
+                responsible_authority=rng.choice(_AUTHORITIES),
+                date_document=issued,
+                first_date_entry_in_force=issued + timedelta(days=rng.randint(0, 180)),
+                policy_area=rng.choice(_POLICY_AREAS),
+                version_status="current" if version == 0 else "superseded",
+                ingestion_source="synthetic",
+            ))
+        for newer, older in zip(chain, chain[1:]):
+            corpus.edges.append((newer, older, 'SUPERSEDES',
+                                 {'amendment_type': rng.choice(('amendment', 'revision'))},
+                                 'ELIWork', 'ELIWork'))
+
+        for number in range(1, max(1, int(rng.gauss(articles_per_law, articles_per_law / 4))) + 1):
+            article = _article(rng, chain[0], number)
+            corpus.articles.append(article)
+            concept_ids = [c['eurovoc_id'] for c in rng.sample(corpus.concepts, k=min(3, n_concepts))] \
+                if n_concepts else []
+            corpus.concerns[article['eli_uri']] = concept_ids
+
+    current_laws = corpus.current_laws
+
+    # EU directives, transposed by one to three German laws
+    for i in range(n_directives):
+        year = rng.randint(1990, 2024)
+        issued = datetime(year, rng.randint(1, 12), rng.randint(1, 28))
+        uri = f"eli:eu:dir:{year}:{i}"
+        corpus.documents.append(LegalDocument(
+            eli_uri=uri,
+            celex_number=f"3{year}L{i:04d}",
+            ojeu_reference=f"OJ L {rng.randint(1, 400)}, {issued:%d.%m.%Y}",
+            source_type=LawSourceType.EU_DIRECTIVE,
+            title_de=f"Richtlinie über {_sentence(rng, 2, 5)}",
+            title_en=f"Directive on {_sentence(rng, 2, 5)}",
+            date_document=issued,
+            first_date_entry_in_force=issued + timedelta(days=20),
+            transposition_deadline=None if incomplete() else issued + timedelta(days=730),
+            policy_area=rng.choice(_POLICY_AREAS),
+            ingestion_source="synthetic",
+        ))
+        implementations = []
+        for law_uri in rng.sample(current_laws, k=min(rng.randint(1, 3), len(current_laws))):
+            props = {
+                'status': rng.choice(_IMPLEMENTATION_STATUSES),
+                'implementation_date': (issued + timedelta(days=rng.randint(200, 1200))).date().isoformat(),
+            }
+            implementations.append((law_uri, props))
+            corpus.edges.append((uri, law_uri, 'IMPLEMENTED_BY', props, 'ELIWork', 'ELIWork'))
+        corpus.implementations[uri] = implementations
+
+    # EU regulations
+    for i in range(n_regulations):
+        year = rng.randint(1990, 2024)
+        issued = datetime(year, rng.randint(1, 12), rng.randint(1, 28))
+        corpus.documents.append(LegalDocument(
+            eli_uri=f"eli:eu:reg:{year}:{i}",
+            celex_number=f"3{year}R{i:04d}",
+            ojeu_reference=None if incomplete() else f"OJ L {rng.randint(1, 400)}, {issued:%d.%m.%Y}",
+            source_type=LawSourceType.EU_REGULATION,
+            title_de=f"Verordnung über {_sentence(rng, 2, 5)}",
+            title_en=f"Regulation on {_sentence(rng, 2, 5)}",
+            date_document=issued,
+            first_date_entry_in_force=issued + timedelta(days=20),
+            policy_area=rng.choice(_POLICY_AREAS),
+            ingestion_source="synthetic",
+        ))
+
+    for article_uri, concept_ids in corpus.concerns.items():
+        for concept_id in concept_ids:
+            corpus.edges.append((article_uri, concept_id, 'CONCERNS',
+                                 {'relevance_score': round(rng.random(), 3)},
+                                 'Article', 'LegalConcept'))
+
+    return corpus
@@ -0,0 +1,195 @@
+"""
+In-process Neo4j driver stand-in for benchmarks
+
+Implements the subset of the neo4j driver API used by Neo4jClient
+(sessions, managed and explicit transactions, result iteration) and
+answers the client's queries from a SyntheticCorpus. Write statements
+report every row as written. An optional per-statement latency models
+the network round trip, so batching and concurrency effects stay
+visible without a database.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from benchmarks.corpus import SyntheticCorpus
+
+
+class FakeResult:
+    """Materialized query result"""
+
+    def __init__(self, records: List[Dict]):
+        self._records = records
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self._records)
+
+    def single(self) -> Optional[Dict]:
+        return self._records[0] if self._records else None
+
+    def data(self) -> List[Dict]:
+        return list(self._records)
+
+    def consume(self):
+        return None
+
+
+class FakeTransaction:
+    def __init__(self, driver: "FakeDriver"):
+        self._driver = driver
+
+    def run(self, cypher: str, parameters: Optional[Dict] = None, **kwargs) -> FakeResult:
+        return self._driver.answer(cypher, {**(parameters or {}), **kwargs})
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class FakeSession(FakeTransaction):
+    def begin_transaction(self) -> FakeTransaction:
+        return FakeTransaction(self._driver)
+
+    def execute_read(self, work, *args, **kwargs):
+        return work(FakeTransaction(self._driver), *args, **kwargs)
+
+    execute_write = execute_read
+
+
+class FakeDriver:
+    """neo4j.Driver stand-in answering Neo4jClient queries from a corpus"""
+
+    def __init__(self, corpus: SyntheticCorpus, latency: float = 0.0):
+        """
+        Args:
+            corpus: Corpus the read queries are answered from
+            latency: Seconds slept per statement (simulated round trip)
+        """
+        self.corpus = corpus
+        self.latency = latency
+        self.statements = 0
+        self._lock = threading.Lock()
+        self._articles = {a['eli_uri']: a for a in corpus.articles}
+        self._documents = {d.eli_uri: d for d in corpus.documents}
+        self._concepts = {c['eurovoc_id']: c for c in corpus.concepts}
+        self._article_uris = list(self._articles)
+
+    def session(self, **config) -> FakeSession:
+        return FakeSession(self)
+
+    def verify_connectivity(self):
+        pass
+
+    def close(self):
+        pass
+
+    # ------------------------------------------------------------------
+    # Query answering
+    # ------------------------------------------------------------------
+
+    def answer(self, cypher: str, params: Dict[str, Any]) -> FakeResult:
+        with self._lock:
+            self.statements += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        if 'AS written' in cypher:
+            rows = next((v for v in params.values() if isinstance(v, list)), [])
+            return FakeResult([{'written': len(rows)}])
+        if 'queryNodes' in cypher:
+            return FakeResult(self._search(cypher, params))
+        if 'SUPERSEDES*' in cypher and 'uri' in params:
+            return FakeResult(self._amendments(params['uri']))
+        if 'SUPERSEDES*' in cypher and 'uris' in params:
+            return FakeResult([row for uri in params['uris'] for row in self._amendments(uri)])
+        if 'IMPLEMENTED_BY]->(law:GermanLaw)' in cypher:
+            return FakeResult(self._implementations(params['uri']))
+        if 'transposition_state as transposition_state' in cypher and 'uri' in params:
+            return FakeResult(self._transposition(params['uri']))
+        if 'CONCERNS]->(concept:LegalConcept)' in cypher and 'uri' in params:
+            return FakeResult(self._concepts_of(params['uri']))
+        return FakeResult([])
+
+    def _amendments(self, uri: str) -> List[Dict]:
+        chain = self.corpus.supersedes.get(uri)
+        if not chain or len(chain) < 2:
+            return []
+        return [{
+            'current_version': uri,
+            'version_chain': list(chain),
+            'amendment_types': ['amendment'] * (len(chain) - 1),
+            'truncated': False,
+        }]
+
+    def _implementations(self, uri: str) -> List[Dict]:
+        directive = self._documents.get(uri)
+        rows = []
+        for law_uri, props in self.corpus.implementations.get(uri, []):
+            rows.append({
+                'directive_celex': directive.celex_number if directive else None,
+                'directive_title': directive.title_en if directive else None,
+                'implementing_law': law_uri,
+                'law_title': self._documents[law_uri].title_de,
+                'implementation_status': props['status'],
+                'date_implemented': props['implementation_date'],
+            })
+        return sorted(rows, key=lambda row: row['date_implemented'])
+
+    def _transposition(self, uri: str) -> List[Dict]:
+        directive = self._documents.get(uri)
+        if directive is None:
+            return []
+        implementations = self.corpus.implementations.get(uri, [])
+        statuses = {props['status'] for _, props in implementations}
+        state = ('not_transposed' if not implementations
+                 else 'complete' if 'complete' in statuses else 'partial')
+        return [{
+            'directive_uri': uri,
+            'directive_celex': directive.celex_number,
+            'transposition_deadline': directive.transposition_deadline.isoformat()
+            if directive.transposition_deadline else None,
+            'transposition_state': state,
+            'implementation_count': len(implementations),
+            'implementing_laws': [law for law, _ in implementations],
+            'last_implementation_date': max((p['implementation_date'] for _, p in implementations),
+                                            default=None),
+        }]
+
+    def _concepts_of(self, uri: str) -> List[Dict]:
+        return [
+            {
+                'concept_id': concept_id,
+                'concept_de': self._concepts[concept_id]['pref_label_de'],
+                'concept_en': self._concepts[concept_id]['pref_label_en'],
+                'relevance': 1.0 / (rank + 1),
+            }
+            for rank, concept_id in enumerate(self.corpus.concerns.get(uri, []))
+        ]
+
+    def _search(self, cypher: str, params: Dict) -> List[Dict]:
+        """Deterministic pseudo-ranking of articles for index queries"""
+        if not self._article_uris:
+            return []
+        key = params.get('query') or repr(params.get('embedding', [])[:4])
+        offset = int(hashlib.md5(key.encode()).hexdigest(), 16) % len(self._article_uris)
+        rows = []
+        for rank in range(min(params.get('limit', 10), len(self._article_uris))):
+            uri = self._article_uris[(offset + rank * 7) % len(self._article_uris)]
+            row = {'uri': uri, 'title': self._articles[uri]['title'], 'score': 1.0 / (rank + 1)}
+            if 'AS concepts' in cypher:
+                row['concepts'] = self._concepts_of(uri)
+            rows.append(row)
+        return rows
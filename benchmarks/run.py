@@ -0,0 +1,491 @@
+"""
+Offline benchmark suite for EU_GraphRAG ingestion and query hot paths
+
+Times validation, serialization, parsing, the batch write paths of
+Neo4jClient and its query_* / search methods against a synthetic corpus.
+By default the client talks to an in-process FakeDriver; pass --uri and
+--database to run the same suite against a scratch database of a local
+Neo4j instance. The database must be empty and is emptied again when the
+run ends.
+
+Against the FakeDriver the write benchmarks time Cypher and parameter
+building only, unless --latency-ms adds a simulated round trip.
+
+Results are written as JSON and compared with a baseline: throughput
+drops or latency increases beyond --tolerance are flagged and make the
+run exit with status 1. A fixed pure-Python calibration workload is
+timed before every benchmark; the median of these speeds is stored as
+the run's calibration and baseline values are scaled by the ratio of
+the two runs' calibrations before comparing, so a baseline recorded on
+a faster or less busy machine does not report every benchmark as
+changed.
+
+Usage:
+  python -m benchmarks.run                       # compare with benchmarks/baseline.json
+  python -m benchmarks.run --update-baseline     # record a new baseline (after intended
+                                                 # performance changes, with default options)
+  python -m benchmarks.run --laws 5000 --latency-ms 1
+  python -m benchmarks.run --uri bolt://localhost:7687 --database bench
+"""
+
+import argparse
+import io
+import json
+import logging
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.corpus import SyntheticCorpus, generate_corpus
+from benchmarks.fake_driver import FakeDriver
+from src.graph.neo4j_client import Neo4jClient
+from src.ingestion.pipeline import DocumentValidator, GesetzImInternetAdapter
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCHMARK_DIR / "results" / "latest.json"
+
+# Databases --database may never name: the suite empties the database it ran in
+PROTECTED_DATABASES = {"neo4j", "system"}
+
+# Benchmarks whose time is spent in Neo4j writes
+WRITE_BENCHMARKS = {
+    'ingest_documents_bulk', 'ingest_articles_bulk',
+    'ingest_concepts_bulk', 'create_relationships_batch',
+}
+
+
+# Shortest timed sample; fast benchmarks call fn repeatedly until it is reached
+MIN_SAMPLE_SECONDS = 0.1
+
+
+def measure_throughput(fn: Callable[[], int], repeat: int) -> Dict:
+    """
+    Best-of-repeat throughput of fn (which returns the number of items handled)
+
+    Each sample calls fn until MIN_SAMPLE_SECONDS have passed, so
+    millisecond-scale benchmarks are not dominated by timer and
+    scheduler noise; 'seconds' is the time of one call.
+    """
+    best, items = float('inf'), 0
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            items = fn()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= MIN_SAMPLE_SECONDS:
+                break
+        best = min(best, elapsed / calls)
+    return {
+        'kind': 'throughput',
+        'items': items,
+        'seconds': round(best, 6),
+        'per_sec': round(items / best, 2) if best > 0 else None,
+    }
+
+
+def calibrate(repeat: int, rounds: int = 20000) -> float:
+    """Best-of-repeat speed of a fixed interpreter workload (rounds per second)"""
+    def run():
+        data = {}
+        for i in range(rounds):
+            key = f"eli:bund:law{i % 997}:{i}"
+            data[key] = json.dumps({'id': i, 'parts': key.split(':')})
+        return len(sorted(data))
+    return measure_throughput(run, repeat)['per_sec']
+
+
+def measure_latency(fn: Callable[[object], object], args: List, repeat: int) -> Dict:
+    """Per-call latency percentiles of fn over args (repeated `repeat` times)"""
+    timings = []
+    for _ in range(repeat):
+        for arg in args:
+            start = time.perf_counter()
+            fn(arg)
+            timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        'kind': 'latency',
+        'calls': len(timings),
+        'mean_ms': round(statistics.fmean(timings) * 1000, 4),
+        'p50_ms': round(timings[len(timings) // 2] * 1000, 4),
+        'p95_ms': round(timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000, 4),
+    }
+
+
+class BenchmarkSuite:
+    """Benchmarks over one corpus and one client"""
+
+    def __init__(self, corpus: SyntheticCorpus, client: Neo4jClient,
+                 repeat: int = 3, queries: int = 200, seed: int = 42):
+        self.corpus = corpus
+        self.client = client
+        self.repeat = repeat
+        self.calibrations: List[float] = []
+        rng = random.Random(seed)
+        self.law_sample = rng.sample(corpus.current_laws, min(queries, len(corpus.current_laws)))
+        self.directive_sample = rng.sample(corpus.directives, min(queries, len(corpus.directives)))
+        self.article_sample = rng.sample([a['eli_uri'] for a in corpus.articles],
+                                         min(queries, len(corpus.articles)))
+
+    def _fresh_documents(self):
+        # Validation mutates documents; reset them so every repeat does the same work
+        for doc in self.corpus.documents:
+            doc.data_quality_issues = []
+        return self.corpus.documents
+
+    # ------------------------------------------------------------------
+    # Pipeline hot paths
+    # ------------------------------------------------------------------
+
+    def bench_validate(self) -> Dict:
+        validator = DocumentValidator()
+
+        def run():
+            for doc in self._fresh_documents():
+                validator.validate(doc)
+            return len(self.corpus.documents)
+        return measure_throughput(run, self.repeat)
+
+    def bench_validate_batch(self) -> Dict:
+        validator = DocumentValidator()
+
+        def run():
+            return validator.validate_batch(self._fresh_documents()).total
+        return measure_throughput(run, self.repeat)
+
+    def bench_to_dict(self) -> Dict:
+        docs = self.corpus.documents
+        return measure_throughput(lambda: len([d.to_dict() for d in docs]), self.repeat)
+
+    def bench_to_neo4j_params(self) -> Dict:
+        docs = self.corpus.documents
+        return measure_throughput(lambda: len([d.to_neo4j_params() for d in docs]), self.repeat)
+
+    def bench_document_hash(self) -> Dict:
+        docs = self.corpus.documents
+        return measure_throughput(lambda: len([d.generate_document_hash() for d in docs]), self.repeat)
+
+    def bench_parse_gii_xml(self) -> Dict:
+        adapter = GesetzImInternetAdapter()
+        sources = [self.corpus.to_gii_xml(uri) for uri in self.law_sample[:50]]
+
+        def run():
+            return sum(1 for xml in sources for _ in adapter.iter_parse_xml(io.BytesIO(xml)))
+        return measure_throughput(run, self.repeat)
+
+    # ------------------------------------------------------------------
+    # Neo4jClient write paths
+    # ------------------------------------------------------------------
+
+    def bench_ingest_documents_bulk(self) -> Dict:
+        params = [d.to_neo4j_params() for d in self.corpus.documents]
+        return measure_throughput(
+            lambda: self.client.ingest_documents_bulk(params, batch_size=1000)[0], self.repeat)
+
+    def bench_ingest_articles_bulk(self) -> Dict:
+        articles = self.corpus.articles
+        return measure_throughput(
+            lambda: self.client.ingest_articles_bulk(articles, batch_size=1000)[0], self.repeat)
+
+    def bench_create_relationships_batch(self) -> Dict:
+        edges = self.corpus.edges_of_type('SUPERSEDES') + self.corpus.edges_of_type('IMPLEMENTED_BY')
+        return measure_throughput(
+            lambda: self.client.create_relationships_batch(edges, batch_size=1000)[0], self.repeat)
+
+    def bench_ingest_concepts_bulk(self) -> Dict:
+        concepts = self.corpus.concepts
+        return measure_throughput(
+            lambda: self.client.ingest_concepts_bulk(concepts, batch_size=1000)[0], self.repeat)
+
+    def bench_concept_tagger(self) -> Dict:
+        from src.ingestion.concept_tagger import ConceptTagger
+        tagger = ConceptTagger(self.corpus.concepts)
+        articles = self.corpus.articles
+
+        def run():
+            for _ in tagger.iter_concern_batches(articles):
+                pass
+            return len(articles)
+        return measure_throughput(run, self.repeat)
+
+    def bench_citation_extractor(self) -> Dict:
+        from src.ingestion.citation_extractor import IdentifierIndex, iter_citation_edges
+        # Synthetic text carries no citations; append a § and an EU act reference
+        articles = [dict(a, text_content=f"{a['text_content']} Nach § 3 Abs. 2 gilt "
+                                         f"Richtlinie (EU) 2016/680 entsprechend.")
+                    for a in self.corpus.articles]
+        index = IdentifierIndex.from_documents(self.corpus.documents, articles)
+
+        def run():
+            for _ in iter_citation_edges(articles, index, processes=1):
+                pass
+            return len(articles)
+        return measure_throughput(run, self.repeat)
+
+    # ------------------------------------------------------------------
+    # Neo4jClient read paths
+    # ------------------------------------------------------------------
+
+    def bench_query_amendments(self) -> Dict:
+        return measure_latency(self.client.query_amendments, self.law_sample, self.repeat)
+
+    def bench_query_amendment_chains(self) -> Dict:
+        return measure_latency(self.client.query_amendment_chains, [self.law_sample], self.repeat)
+
+    def bench_query_implementations(self) -> Dict:
+        return measure_latency(self.client.query_implementations, self.directive_sample, self.repeat)
+
+    def bench_query_transposition_status(self) -> Dict:
+        return measure_latency(self.client.query_transposition_status, self.directive_sample, self.repeat)
+
+    def bench_query_concepts(self) -> Dict:
+        return measure_latency(self.client.query_concepts, self.article_sample, self.repeat)
+
+    def bench_hybrid_search(self) -> Dict:
+        from src.llm.embedding_generator import HashingEmbedder
+        embedder = HashingEmbedder()
+        queries = [(a['title'], embedder.embed([a['title']])[0])
+                   for a in self.corpus.articles[:50]]
+        return measure_latency(
+            lambda q: self.client.hybrid_search(q[0], top_k=10, query_embedding=q[1],
+                                                expand_concepts=True),
+            queries, self.repeat)
+
+    def bench_local_vector_search(self) -> Dict:
+        import numpy as np
+        from src.retrieval.vector_search import LocalVectorIndex
+        rng = np.random.default_rng(0)
+        matrix = rng.standard_normal((len(self.corpus.articles), 256), dtype=np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        index = LocalVectorIndex(matrix, [a['eli_uri'] for a in self.corpus.articles])
+        queries = rng.standard_normal((64, 256), dtype=np.float32)
+        return measure_throughput(lambda: len(index.search(queries, top_k=10)), self.repeat)
+
+    def run(self, only: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Run all bench_* methods (or the named subset)"""
+        results = {}
+        names = sorted(n[len('bench_'):] for n in dir(self) if n.startswith('bench_'))
+        for name in names:
+            if only and name not in only:
+                continue
+            self.calibrations.append(calibrate(self.repeat))
+            results[name] = getattr(self, f'bench_{name}')()
+            logger.info(f"✓ {name}: {_format(results[name])}")
+        return results
+
+
+def _format(result: Dict) -> str:
+    if result['kind'] == 'throughput':
+        return f"{result['per_sec']:.0f}/s ({result['items']} in {result['seconds']:.3f}s)"
+    return f"p50 {result['p50_ms']:.3f} ms, p95 {result['p95_ms']:.3f} ms ({result['calls']} calls)"
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float,
+            speedup: float = 1.0) -> Dict[str, str]:
+    """
+    Flag benchmarks that regressed against the baseline
+
+    Throughput regresses when per_sec drops by more than tolerance;
+    latency regresses when p50 rises by more than tolerance.
+
+    Args:
+        speedup: Calibration speed of this run relative to the baseline's;
+                 baseline values are scaled by it before comparing
+
+    Returns:
+        Benchmark name → description of its regression
+    """
+    regressions = {}
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or base.get('kind') != result['kind']:
+            continue
+        if result['kind'] == 'throughput':
+            old, new = base.get('per_sec'), result.get('per_sec')
+            if old and new:
+                old *= speedup
+                if new < old * (1 - tolerance):
+                    regressions[name] = (f"{name}: {new:.0f}/s vs baseline {old:.0f}/s "
+                                         f"({new / old - 1:+.0%}, calibrated)")
+        else:
+            old, new = base.get('p50_ms'), result.get('p50_ms')
+            if old and new:
+                old /= speedup
+                if new > old * (1 + tolerance):
+                    regressions[name] = (f"{name}: p50 {new:.3f} ms vs baseline {old:.3f} ms "
+                                         f"({new / old - 1:+.0%}, calibrated)")
+    return regressions
+
+
+def _best_result(first: Dict, second: Dict) -> Dict:
+    """The faster of two results of one benchmark"""
+    if first['kind'] == 'throughput':
+        return first if (first['per_sec'] or 0) >= (second['per_sec'] or 0) else second
+    return first if first['p50_ms'] <= second['p50_ms'] else second
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True, cwd=BENCHMARK_DIR).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _write_json(path: Path, data: Dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def _database_is_empty(client: Neo4jClient) -> bool:
+    return not client.execute_read("MATCH (n) RETURN n LIMIT 1")
+
+
+def _drop_benchmark_data(client: Neo4jClient, batch_size: int = 10000):
+    """Delete everything the suite wrote to the scratch database"""
+    # CALL { } IN TRANSACTIONS needs an implicit (auto-commit) transaction
+    with client.session_scope() as session:
+        session.run(
+            "MATCH (n) CALL { WITH n DETACH DELETE n } "
+            f"IN TRANSACTIONS OF {int(batch_size)} ROWS"
+        ).consume()
+    logger.info(f"✓ Benchmark data deleted from database {client.database}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="EU_GraphRAG offline benchmarks")
+    parser.add_argument('--laws', type=int, default=1000, help="German laws in the synthetic corpus")
+    parser.add_argument('--articles-per-law', type=int, default=20)
+    parser.add_argument('--versions-per-law', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=5, help="Repetitions per benchmark")
+    parser.add_argument('--queries', type=int, default=200, help="Distinct URIs per query benchmark")
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help="Simulated round trip per statement (fake driver only)")
+    parser.add_argument('--uri', help="Run against this Neo4j instead of the fake driver")
+    parser.add_argument('--database',
+                        help="Empty scratch database for --uri runs; emptied again afterwards")
+    parser.add_argument('--user', default="neo4j")
+    parser.add_argument('--password', default="password")
+    parser.add_argument('--only', nargs='*', help="Benchmark names to run")
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.35,
+                        help="Allowed relative regression before a benchmark is flagged")
+    args = parser.parse_args(argv)
+    if args.uri and not args.database:
+        parser.error("--uri requires --database naming an empty scratch database")
+    if args.database and args.database.lower() in PROTECTED_DATABASES:
+        parser.error(f"--database {args.database} is not a scratch database")
+
+    logging.getLogger('src').setLevel(logging.WARNING)
+    logger.setLevel(logging.INFO)
+
+    start = time.perf_counter()
+    corpus = generate_corpus(args.laws, args.articles_per_law, args.versions_per_law, seed=args.seed)
+    logger.info(f"Generated corpus in {time.perf_counter() - start:.1f}s: "
+                f"{len(corpus.documents)} documents, {len(corpus.articles)} articles, "
+                f"{len(corpus.edges)} edges")
+
+    if args.uri:
+        client = Neo4jClient(args.uri, args.user, args.password, database=args.database)
+        if not _database_is_empty(client):
+            client.close()
+            logger.error(f"✗ Database {args.database} is not empty; "
+                         f"the benchmarks only run in an empty scratch database")
+            return 2
+    else:
+        client = Neo4jClient("fake://", "", "", driver=FakeDriver(corpus, args.latency_ms / 1000))
+
+    baseline = None
+    if not args.update_baseline and args.baseline.exists():
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    suite = BenchmarkSuite(corpus, client, args.repeat, args.queries, args.seed)
+    regressions: Dict[str, str] = {}
+    try:
+        results = suite.run(args.only)
+        calibration = statistics.median(suite.calibrations) if suite.calibrations else None
+        if baseline is not None:
+            # Baselines recorded without calibration compare unscaled
+            base_calibration = baseline.get('meta', {}).get('calibration_per_sec')
+            speedup = calibration / base_calibration if calibration and base_calibration else 1.0
+            logger.info(f"Calibration: {speedup:.2f}x the speed of the baseline run")
+            regressions = compare(results, baseline.get('results', {}), args.tolerance, speedup)
+            if regressions:
+                # One slow sample on a shared machine is not a regression
+                logger.info(f"Re-running {len(regressions)} flagged benchmarks to confirm")
+                for name, result in suite.run(list(regressions)).items():
+                    results[name] = _best_result(results[name], result)
+                regressions = compare(results, baseline.get('results', {}), args.tolerance, speedup)
+    finally:
+        if args.uri:
+            _drop_benchmark_data(client)
+        client.close()
+
+    client_side = WRITE_BENCHMARKS.intersection(results)
+    if client_side and not args.uri and not args.latency_ms:
+        # Without a round trip these only time Cypher and parameter building
+        for name in client_side:
+            results[name]['scope'] = 'client-side only (fake driver, no latency)'
+        logger.info("⚠ Write benchmarks ran without simulated latency: "
+                    "they time Cypher and parameter building only")
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'backend': (f"{args.uri} (database {args.database})" if args.uri
+                        else f"fake (latency {args.latency_ms} ms)"),
+            'repeat': args.repeat,
+            'calibration_per_sec': round(calibration, 2) if calibration else None,
+            'corpus': {
+                'laws': args.laws, 'articles_per_law': args.articles_per_law,
+                'versions_per_law': args.versions_per_law, 'seed': args.seed,
+                'documents': len(corpus.documents), 'articles': len(corpus.articles),
+                'edges': len(corpus.edges),
+            },
+        },
+        'results': results,
+    }
+    _write_json(args.output, report)
+    logger.info(f"Results written to {args.output}")
+
+    if args.update_baseline:
+        _write_json(args.baseline, report)
+        logger.info(f"✓ Baseline updated: {args.baseline}")
+        return 0
+
+    if baseline is None:
+        logger.info(f"No baseline at {args.baseline}; run with --update-baseline to record one")
+        return 0
+
+    if baseline.get('meta', {}).get('corpus') != report['meta']['corpus']:
+        logger.warning("⚠ Baseline was recorded with a different corpus; comparison may be meaningless")
+    if baseline.get('meta', {}).get('backend') != report['meta']['backend']:
+        logger.warning("⚠ Baseline was recorded against a different backend; comparison may be meaningless")
+
+    for regression in regressions.values():
+        logger.warning(f"✗ Regression: {regression}")
+    if not regressions:
+        logger.info(f"✓ No regressions beyond {args.tolerance:.0%}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -45,6 +45,9 @@ FOR (a:Article) ON EACH [a.title, a.text_content];
 CREATE FULLTEXT INDEX decision_text IF NOT EXISTS
 FOR (d:CourtDecision) ON EACH [d.title, d.summary];
 
+CREATE FULLTEXT INDEX work_text IF NOT EXISTS
+FOR (w:ELIWork) ON EACH [w.title_de, w.title_en];
+
 // Property indexes for filtering
 CREATE INDEX article_date IF NOT EXISTS
 FOR (a:Article) ON (a.effective_date);
@@ -56,6 +59,9 @@ CREATE INDEX document_type IF NOT EXISTS
 FOR (w:ELIWork) ON (w.type_document);
 
 // Composite indexes for common queries
+CREATE INDEX directive_transposition IF NOT EXISTS
+FOR (d:EUDirective) ON (d.transposition_state, d.transposition_deadline);
+
 CREATE INDEX article_book_number IF NOT EXISTS
 FOR (a:Article) ON (a.sgb_book, a.article_number);
 
@@ -0,0 +1,79 @@
+"""
+Node Label Mapping for EU_GraphRAG
+
+Single source of truth for how documents map to Neo4j labels, shared by
+the transactional writer (Neo4jClient) and the offline bulk export
+(src.ingestion.bulk_export). Kept free of driver imports.
+"""
+
+from typing import Tuple
+
+# LegalDocument.source_type value → node label
+SOURCE_TYPE_LABELS = {
+    'german_law': 'GermanLaw',
+    'eu_regulation': 'EURegulation',
+    'eu_directive': 'EUDirective',
+    'case_law': 'CourtDecision',
+}
+
+DEFAULT_DOCUMENT_LABEL = 'LegalDocument'
+
+# Labels of ELI works; these nodes also carry :ELIWork so lookups by
+# eli_uri use the eli_work_uri uniqueness constraint index
+ELI_WORK_LABELS = frozenset({'GermanLaw', 'EURegulation', 'EUDirective'})
+
+
+def node_label(source_type: str) -> str:
+    """Map source type to Neo4j node label"""
+    return SOURCE_TYPE_LABELS.get(source_type, DEFAULT_DOCUMENT_LABEL)
+
+
+def node_labels(source_type: str) -> Tuple[str, ...]:
+    """All labels a document of this source type carries (ELIWork first)"""
+    label = node_label(source_type)
+    return ('ELIWork', label) if label in ELI_WORK_LABELS else (label,)
+
+
+def id_space(label: str) -> str:
+    """
+    Label whose key identifies nodes of `label`
+
+    All ELI works share the ELIWork eli_uri space (as in the MERGE on
+    :ELIWork), every other label is its own space.
+    """
+    if label in ELI_WORK_LABELS or label in ('ELIWork', DEFAULT_DOCUMENT_LABEL):
+        return 'ELIWork'
+    return label
+
+
+# Key property of labels not identified by eli_uri
+NODE_KEYS = {'LegalConcept': 'eurovoc_id'}
+
+# SKOS relation list on a concept dict → relationship type between LegalConcepts
+CONCEPT_RELATIONS = {
+    'broader': 'BROADER_CONCEPT',
+    'narrower': 'NARROWER_CONCEPT',
+    'related': 'RELATED_CONCEPT',
+}
+
+
+def key_property(label: str) -> str:
+    """Property MERGE/MATCH uses to identify nodes of `label`"""
+    return NODE_KEYS.get(label, 'eli_uri')
+
+
+def split_concept(concept: dict) -> Tuple[dict, list]:
+    """
+    Split a concept dict into node properties and hierarchy edges
+
+    Returns:
+        (properties without the SKOS relation lists,
+         (from_id, to_id, rel_type, None, 'LegalConcept', 'LegalConcept') tuples)
+    """
+    properties = {k: v for k, v in concept.items() if k not in CONCEPT_RELATIONS}
+    edges = [
+        (concept['eurovoc_id'], target, rel_type, None, 'LegalConcept', 'LegalConcept')
+        for key, rel_type in CONCEPT_RELATIONS.items()
+        for target in concept.get(key) or ()
+    ]
+    return properties, edges
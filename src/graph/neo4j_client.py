@@ -5,25 +5,404 @@ Manages connections and operations with Neo4j graph database.
 Handles document ingestion, schema initialization, and query execution.
 """
 
+import asyncio
+import copy
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple, Awaitable, Iterable, Iterator, Union
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from datetime import date
 import json
 
 try:
-    from neo4j import GraphDatabase, Session, Transaction, Result
+    from neo4j import GraphDatabase, AsyncGraphDatabase, Session, Transaction, Result
     from neo4j.exceptions import Neo4jError, AuthError, ServiceUnavailable
 except ImportError:
     raise ImportError("neo4j package required. Install: pip install neo4j")
 
+from src.graph.labels import id_space, key_property, node_label, node_labels, split_concept
+from src.graph.schema_manager import SchemaMigrator
+
 logger = logging.getLogger(__name__)
 
 
+# Upper bound on SUPERSEDES hops followed by amendment-chain queries
+DEFAULT_MAX_AMENDMENT_DEPTH = 50
+
+
+def _check_label(label: str, kind: str = "node label") -> str:
+    """Reject anything but a plain identifier before interpolating a label"""
+    if not isinstance(label, str) or not label.isidentifier():
+        raise ValueError(f"Invalid {kind}: {label!r}")
+    return label
+
+
+def _endpoint_label(label: str) -> str:
+    """Label to MATCH a relationship endpoint on (LegalDocument and ELI works → ELIWork)"""
+    return _check_label(id_space(label))
+
+
+def _longest_chain_match(max_depth: int) -> str:
+    """
+    MATCH fragment binding `path` to candidate amendment chains from `law`
+    
+    Only paths that end at the oldest version (or at max_depth) qualify,
+    so callers ordering by length and taking one row get the full chain
+    without every intermediate prefix.
+    """
+    max_depth = int(max_depth)
+    if max_depth < 1:
+        raise ValueError("max_depth must be >= 1")
+    return f"""
+    MATCH path = (law)-[:SUPERSEDES*1..{max_depth}]->(prev)
+    WHERE length(path) = {max_depth} OR NOT (prev)-[:SUPERSEDES]->()
+    """
+
+
+def build_amendments_query(label: str = "ELIWork",
+                           max_depth: int = DEFAULT_MAX_AMENDMENT_DEPTH) -> str:
+    """Longest amendment chain of one law, anchored on an indexed label"""
+    return f"""
+    MATCH (law:{_check_label(label)} {{eli_uri: $uri}})
+    {_longest_chain_match(max_depth)}
+    RETURN 
+        law.eli_uri as current_version,
+        [n in nodes(path) | n.eli_uri] as version_chain,
+        [r in relationships(path) | r.amendment_type] as amendment_types,
+        length(path) = {int(max_depth)} AND EXISTS {{ (prev)-[:SUPERSEDES]->() }} as truncated
+    ORDER BY length(path) DESC
+    LIMIT 1
+    """
+
+
+# Read queries shared by Neo4jClient and AsyncNeo4jClient
+IMPLEMENTATIONS_QUERY = """
+MATCH (directive:EUDirective {eli_uri: $uri})-[impl:IMPLEMENTED_BY]->(law:GermanLaw)
+RETURN 
+    directive.celex_number as directive_celex,
+    directive.title_en as directive_title,
+    law.eli_uri as implementing_law,
+    law.title_de as law_title,
+    impl.status as implementation_status,
+    impl.implementation_date as date_implemented
+ORDER BY impl.implementation_date
+"""
+
+# IMPLEMENTED_BY statuses that count as full transposition
+TRANSPOSITION_COMPLETE_STATUSES = ('complete', 'completed', 'transposed', 'implemented', 'full')
+TRANSPOSITION_STATES = ('not_transposed', 'partial', 'complete')
+
+# Materialized transposition index: summary properties on each EUDirective,
+# recomputed from its IMPLEMENTED_BY edges (directive -> law) and the
+# IMPLEMENTS edges found by the citation extractor (law -> directive)
+# whenever those are written. IMPLEMENTS edges carry no status, so on
+# their own they count as a partial transposition.
+REFRESH_TRANSPOSITION_QUERY = """
+UNWIND $uris AS uri
+MATCH (directive:ELIWork {eli_uri: uri})
+WHERE directive:EUDirective
+OPTIONAL MATCH (directive)-[impl:IMPLEMENTED_BY]->(law)
+WITH directive, collect(impl) AS impls, collect(law.eli_uri) AS laws
+OPTIONAL MATCH (citing)-[:IMPLEMENTS]->(directive)
+WITH directive, impls, laws, collect(DISTINCT citing.eli_uri) AS citing_laws
+WITH directive, impls, laws + [l IN citing_laws WHERE NOT l IN laws] AS laws
+SET directive.implementation_count = size(laws),
+    directive.implementing_laws = laws,
+    directive.last_implementation_date = reduce(latest = null, i IN impls |
+        CASE WHEN latest IS NULL OR i.implementation_date > latest
+             THEN i.implementation_date ELSE latest END),
+    directive.transposition_state = CASE
+        WHEN size(laws) = 0 THEN 'not_transposed'
+        WHEN any(i IN impls WHERE toLower(i.status) IN $complete) THEN 'complete'
+        ELSE 'partial' END,
+    directive.transposition_deadline = date(left(toString(directive.transposition_deadline), 10)),
+    directive.transposition_indexed_at = datetime()
+RETURN count(directive) AS written
+"""
+
+TRANSPOSITION_STATUS_QUERY = """
+MATCH (directive:ELIWork {eli_uri: $uri})
+WHERE directive:EUDirective
+RETURN
+    directive.eli_uri as directive_uri,
+    directive.celex_number as directive_celex,
+    directive.transposition_deadline as transposition_deadline,
+    directive.transposition_state as transposition_state,
+    directive.implementation_count as implementation_count,
+    directive.implementing_laws as implementing_laws,
+    directive.last_implementation_date as last_implementation_date
+"""
+
+TRANSPOSITION_OVERVIEW_QUERY = """
+MATCH (directive:EUDirective)
+WHERE directive.transposition_state IN $states
+  AND directive.transposition_deadline < date($as_of)
+RETURN
+    directive.eli_uri as directive_uri,
+    directive.celex_number as directive_celex,
+    directive.title_en as directive_title,
+    directive.transposition_deadline as transposition_deadline,
+    directive.transposition_state as transposition_state,
+    directive.implementation_count as implementation_count,
+    directive.last_implementation_date as last_implementation_date
+ORDER BY directive.transposition_deadline
+"""
+
+CONCEPTS_QUERY = """
+MATCH (article:Article {eli_uri: $uri})-[rel:CONCERNS]->(concept:LegalConcept)
+RETURN 
+    concept.eurovoc_id as concept_id,
+    concept.pref_label_de as concept_de,
+    concept.pref_label_en as concept_en,
+    rel.relevance_score as relevance
+ORDER BY rel.relevance_score DESC
+"""
+
+def build_concepts_batch_query(label: str) -> str:
+    """EuroVoc concepts of many nodes of one label, keyed by eli_uri"""
+    return f"""
+    UNWIND $uris AS uri
+    MATCH (node:{_check_label(label)} {{eli_uri: uri}})-[:CONCERNS]->(concept:LegalConcept)
+    WITH uri, collect(DISTINCT concept)[..$max_concepts] AS concepts
+    RETURN uri, [c IN concepts |
+        {{concept_id: c.eurovoc_id, concept_de: c.pref_label_de, concept_en: c.pref_label_en}}] AS concepts
+    """
+
+STATISTICS_QUERY = """
+RETURN 
+    count(n:GermanLaw) as german_laws,
+    count(n:EURegulation) as eu_regulations,
+    count(n:EUDirective) as eu_directives,
+    count(n:Article) as articles,
+    count(n:LegalConcept) as concepts
+"""
+
+# Fulltext and vector indexes per searchable node label
+# (see ontologies/graph-schema.cypher and metadata-schema.cypher)
+FULLTEXT_INDEXES = {
+    'Article': 'article_text',
+    'ELIWork': 'work_text',
+    'LegalDocument': 'law_search',
+    'LegalConcept': 'concept_search',
+    'CourtDecision': 'decision_text',
+}
+
+VECTOR_INDEXES = {
+    'Article': 'article_embeddings',
+    'LegalConcept': 'concept_embeddings',
+}
+
+# Default k of reciprocal-rank fusion (Cormack et al., 2009)
+RRF_K = 60
+
+_SEARCH_CALLS = {
+    'fulltext': "CALL db.index.fulltext.queryNodes($index, $query, {limit: $candidates}) YIELD node, score",
+    'vector': "CALL db.index.vector.queryNodes($index, $candidates, $embedding) YIELD node, score",
+}
+
+
+def build_search_query(procedure: str, expand_concepts: bool = False) -> str:
+    """
+    Index search query with optional filters and concept expansion
+    
+    Filters on source_type and date_document apply to the hit itself or,
+    for articles, to the law it belongs to; dates are compared as date
+    values, so date_to includes the whole day. With expand_concepts the
+    EuroVoc concepts of each hit are collected in the same query.
+    
+    Args:
+        procedure: 'fulltext' or 'vector'
+        expand_concepts: Add a `concepts` column (one hop over CONCERNS)
+    """
+    expansion = """
+    OPTIONAL MATCH (node)-[:CONCERNS]->(concept:LegalConcept)
+    WITH node, score, [c IN collect(DISTINCT concept)[..$max_concepts] |
+        {concept_id: c.eurovoc_id, concept_de: c.pref_label_de, concept_en: c.pref_label_en}] AS concepts
+    """ if expand_concepts else ""
+    return f"""
+    {_SEARCH_CALLS[procedure]}
+    OPTIONAL MATCH (node)-[:BELONGS_TO]->(law)
+    WITH node, score, head(collect(law)) AS law
+    WITH node, score,
+         coalesce(node.source_type, law.source_type) AS doc_type,
+         date(left(toString(coalesce(node.date_document, law.date_document)), 10)) AS doc_date
+    WHERE ($document_types IS NULL OR doc_type IN $document_types)
+      AND ($date_from IS NULL OR doc_date >= date($date_from))
+      AND ($date_to IS NULL OR doc_date <= date($date_to))
+    WITH node, score
+    ORDER BY score DESC
+    LIMIT $limit
+    {expansion}
+    RETURN 
+        node.eli_uri as uri,
+        coalesce(node.title_de, node.title, node.pref_label_de, node.ecli) as title,
+        score{", concepts" if expand_concepts else ""}
+    ORDER BY score DESC
+    """
+
+
+FULL_TEXT_QUERY = build_search_query('fulltext')
+
+
+def reciprocal_rank_fusion(rankings: Iterable[List[str]], k: int = RRF_K) -> Dict[str, float]:
+    """
+    Fuse ranked lists of URIs: score(d) = Σ 1 / (k + rank of d in each list)
+    
+    Args:
+        rankings: URI lists, best first
+        k: Smoothing constant; larger values flatten rank differences
+        
+    Returns:
+        Fused score per URI
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, uri in enumerate(ranking, start=1):
+            scores[uri] = scores.get(uri, 0.0) + 1.0 / (k + rank)
+    return scores
+
+
+def _search_params(node_type: str, indexes: Dict[str, str], limit: int,
+                   candidates: Optional[int] = None,
+                   document_types: Optional[Iterable[str]] = None,
+                   date_from: Union[str, date, None] = None,
+                   date_to: Union[str, date, None] = None,
+                   max_concepts: int = 10) -> Dict:
+    """Parameters shared by the fulltext and vector search queries"""
+    if node_type not in indexes:
+        raise ValueError(f"No search index for node type {node_type!r} "
+                         f"(available: {sorted(indexes)})")
+    return {
+        'index': indexes[node_type],
+        'limit': limit,
+        'candidates': max(candidates or limit, limit),
+        'document_types': list(document_types) if document_types else None,
+        'date_from': _iso_date(date_from),
+        'date_to': _iso_date(date_to),
+        'max_concepts': max_concepts,
+    }
+
+
+def _iso_date(value: Union[str, date, None]) -> Optional[str]:
+    """YYYY-MM-DD for a date filter (datetimes and ISO datetime strings are cut to the day)"""
+    if value is None:
+        return None
+    if isinstance(value, date):
+        return value.isoformat()[:10]
+    return str(value)[:10]
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache with TTL for read query results
+    
+    Entries are tagged with the ELI URIs they depend on so writes can
+    invalidate exactly the affected results. Entries tagged ALL (e.g.
+    full-text searches) are dropped on every write.
+    
+    get() returns a deep copy, so callers may mutate what they get back;
+    put() stores the value it is given, which the caller must not change
+    afterwards.
+    """
+    
+    ALL = '*'
+    
+    def __init__(self, max_size: int = 1024, ttl: float = 3600.0):
+        """
+        Args:
+            max_size: Maximum number of cached results
+            ttl: Seconds before an entry expires
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, Tuple[float, Any, frozenset]]" = OrderedDict()
+        self._tags: Dict[str, set] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    def get(self, key) -> Tuple[bool, Any]:
+        """Return (hit, copy of value) for key"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return True, copy.deepcopy(value)
+    
+    def put(self, key, value, tags: Iterable[str] = ()):
+        """Store value under key, tagged with the URIs it depends on"""
+        tags = frozenset(tags)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+    
+    def invalidate(self, uris: Iterable[str]) -> int:
+        """Drop entries depending on any of the URIs (and all ALL-tagged entries)"""
+        with self._lock:
+            keys = set(self._tags.get(self.ALL, ()))
+            for uri in uris:
+                keys.update(self._tags.get(uri, ()))
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+            return len(keys)
+    
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+    
+    def _remove(self, key):
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+    
+    def stats(self) -> Dict:
+        """Hit/miss counters for sizing the cache"""
+        with self._lock:
+            size, hits, misses = len(self._entries), self.hits, self.misses
+            evictions, invalidations = self.evictions, self.invalidations
+        lookups = hits + misses
+        return {
+            'size': size,
+            'max_size': self.max_size,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'evictions': evictions,
+            'invalidations': invalidations,
+        }
+
+
 class Neo4jClient:
     """Neo4j database client with connection pooling and transaction management"""
     
     def __init__(self, uri: str, user: str, password: str, 
-                 encrypted: bool = False, max_pool_size: int = 50):
+                 encrypted: bool = False, max_pool_size: int = 50,
+                 cache_size: int = 0, cache_ttl: float = 3600.0,
+                 driver=None, database: Optional[str] = None):
         """
         Initialize Neo4j client
         
@@ -33,14 +412,28 @@ class Neo4jClient:
             password: Database password
             encrypted: Use encrypted connection
             max_pool_size: Maximum connection pool size
+            cache_size: Cached query results (0 disables the query cache)
+            cache_ttl: Seconds a cached query result stays valid
+            driver: Already constructed driver (e.g. an in-process stand-in
+                    for benchmarks); no connection is opened if given
+            database: Database every session opens (None: the server default)
         """
         self.uri = uri
         self.user = user
         self.password = password
         self.encrypted = encrypted
+        self.database = database
         
         self.driver = None
         self.session = None
+        self.last_batch_stats: List[Dict] = []
+        self.cache = QueryCache(cache_size, cache_ttl) if cache_size else None
+        self._search_executor: Optional[ThreadPoolExecutor] = None
+        self.vector_backends: Dict[str, Any] = {}
+        
+        if driver is not None:
+            self.driver = driver
+            return
         
         try:
             self.connect(max_pool_size)
@@ -74,80 +467,176 @@ class Neo4jClient:
     
     def close(self):
         """Close database connection"""
+        if self._search_executor is not None:
+            self._search_executor.shutdown(wait=False)
+            self._search_executor = None
         if self.driver:
             self.driver.close()
             logger.info("Neo4j connection closed")
     
+    def _cached_query(self, name: str, params: Tuple, loader, uri_columns: Tuple[str, ...] = (),
+                      global_tag: bool = False) -> List[Dict]:
+        """
+        Serve a read query from the cache, loading and tagging it on a miss
+        
+        Args:
+            name: Query name (part of the cache key)
+            params: Hashable query parameters (part of the cache key)
+            loader: Callable running the query
+            uri_columns: Result columns holding URIs (str or list) to tag the entry with
+            global_tag: Invalidate this entry on every write
+        """
+        if self.cache is None:
+            return loader()
+        
+        key = (name, params)
+        hit, records = self.cache.get(key)
+        if not hit:
+            records = loader()
+            tags = {p for p in params if isinstance(p, str)}
+            for record in records:
+                for column in uri_columns:
+                    value = record.get(column)
+                    if isinstance(value, str):
+                        tags.add(value)
+                    elif isinstance(value, list):
+                        tags.update(v for v in value if isinstance(v, str))
+            if global_tag:
+                tags.add(QueryCache.ALL)
+            # The caller owns the loaded records; the cache keeps its own copy
+            self.cache.put(key, copy.deepcopy(records), tags)
+        return records
+    
+    def invalidate_cache(self, uris: Iterable[str]):
+        """Drop cached query results that depend on the given URIs"""
+        if self.cache is not None:
+            self.cache.invalidate(uris)
+    
+    def cache_stats(self) -> Dict:
+        """Query cache counters (empty if caching is disabled)"""
+        return self.cache.stats() if self.cache is not None else {}
+    
     @contextmanager
-    def session_scope(self):
+    def session_scope(self, **session_config):
         """Context manager for session"""
-        session = self.driver.session()
+        if self.database:
+            session_config.setdefault('database', self.database)
+        session = self.driver.session(**session_config)
         try:
             yield session
         finally:
             session.close()
     
-    def execute_query(self, cypher: str, parameters: Dict = None) -> Result:
+    def execute_query(self, cypher: str, parameters: Dict = None,
+                      access_mode: str = "write") -> List[Dict]:
         """
-        Execute Cypher query
+        Execute Cypher query in a managed transaction
+        
+        Records are fully materialized before the session closes, and
+        transient errors are retried by the driver.
         
         Args:
             cypher: Cypher query string
             parameters: Query parameters
+            access_mode: "read" or "write" (routes to the right cluster member)
             
         Returns:
-            Query result
+            List of record dicts
         """
         parameters = parameters or {}
         
+        def _work(tx):
+            return [dict(record) for record in tx.run(cypher, parameters)]
+        
         with self.session_scope() as session:
             try:
-                result = session.run(cypher, parameters)
-                return result
+                if access_mode == "read":
+                    return session.execute_read(_work)
+                return session.execute_write(_work)
             except Exception as e:
                 logger.error(f"Query execution error: {e}\nQuery: {cypher}")
                 raise
     
-    def execute_query_single(self, cypher: str, parameters: Dict = None) -> Optional[Dict]:
+    def execute_read(self, cypher: str, parameters: Dict = None) -> List[Dict]:
+        """Execute read query in a managed read transaction"""
+        return self.execute_query(cypher, parameters, access_mode="read")
+    
+    def execute_write(self, cypher: str, parameters: Dict = None) -> List[Dict]:
+        """Execute write query in a managed write transaction"""
+        return self.execute_query(cypher, parameters, access_mode="write")
+    
+    def execute_query_single(self, cypher: str, parameters: Dict = None,
+                             access_mode: str = "read") -> Optional[Dict]:
         """Execute query and return single result"""
-        result = self.execute_query(cypher, parameters)
-        record = result.single()
-        return dict(record) if record else None
+        records = self.execute_query(cypher, parameters, access_mode=access_mode)
+        return records[0] if records else None
     
-    def execute_query_list(self, cypher: str, parameters: Dict = None) -> List[Dict]:
+    def execute_query_list(self, cypher: str, parameters: Dict = None,
+                           access_mode: str = "read") -> List[Dict]:
         """Execute query and return all results as list"""
-        result = self.execute_query(cypher, parameters)
-        return [dict(record) for record in result]
+        return self.execute_query(cypher, parameters, access_mode=access_mode)
     
-    def load_schema(self, schema_file: str):
+    def stream_query(self, cypher: str, parameters: Dict = None,
+                     batch_size: Optional[int] = None,
+                     fetch_size: int = 1000) -> Iterator[Union[Dict, List[Dict]]]:
         """
-        Load Cypher schema file and execute
+        Stream query results while the session stays open
+        
+        Records are pulled from the server fetch_size at a time, so
+        exporting very large result sets uses constant memory. Stop
+        iterating (or close the generator) to release the session.
         
         Args:
-            schema_file: Path to .cypher schema file
+            cypher: Cypher query string
+            parameters: Query parameters
+            batch_size: Yield lists of this many records instead of single records
+            fetch_size: Records requested from the server per pull
+            
+        Yields:
+            Record dicts, or lists of record dicts when batch_size is set
         """
-        logger.info(f"Loading schema from: {schema_file}")
+        parameters = parameters or {}
         
-        try:
-            with open(schema_file, 'r', encoding='utf-8') as f:
-                schema_content = f.read()
-            
-            # Split by semicolons and execute each statement
-            statements = [s.strip() for s in schema_content.split(';') if s.strip()]
+        with self.session_scope(fetch_size=fetch_size) as session:
+            result = session.run(cypher, parameters)
+            if not batch_size:
+                for record in result:
+                    yield dict(record)
+                return
             
-            with self.session_scope() as session:
-                for stmt in statements:
-                    if stmt and not stmt.startswith('//'):
-                        try:
-                            session.run(stmt)
-                            logger.debug(f"✓ Executed: {stmt[:60]}...")
-                        except Exception as e:
-                            logger.warning(f"⚠ Statement failed (may be expected): {e}")
+            batch = []
+            for record in result:
+                batch.append(dict(record))
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+    
+    def load_schema(self, schema_file: Union[str, Iterable[str]], wait: bool = True,
+                    timeout: float = 600.0, dry_run: bool = False):
+        """
+        Apply the constraints and indexes of Cypher schema file(s)
+        
+        Only objects missing from the database are created (see
+        SchemaMigrator); sample-data statements in the files are skipped.
+        
+        Args:
+            schema_file: Path to .cypher schema file, or several paths
+            wait: Block until newly created indexes are ONLINE
+            timeout: Seconds to wait for index population
+            dry_run: Only log what would be created
             
-            logger.info(f"✓ Schema loaded ({len(statements)} statements)")
+        Returns:
+            MigrationPlan
+        """
+        schema_files = [schema_file] if isinstance(schema_file, str) else list(schema_file)
+        logger.info(f"Loading schema from: {', '.join(schema_files)}")
         
+        try:
+            return SchemaMigrator(self, schema_files).migrate(wait=wait, timeout=timeout,
+                                                              dry_run=dry_run)
         except FileNotFoundError:
-            logger.error(f"Schema file not found: {schema_file}")
             raise
         except Exception as e:
             logger.error(f"Error loading schema: {e}")
@@ -172,6 +661,7 @@ class Neo4jClient:
             
             cypher = self._build_document_insert_cypher(document, merge)
             self.execute_query(cypher, {'doc': document})
+            self.invalidate_cache([eli_uri])
             
             logger.debug(f"✓ Ingested: {eli_uri}")
             return True
@@ -182,44 +672,87 @@ class Neo4jClient:
     
     def _build_document_insert_cypher(self, document: Dict, merge: bool = True) -> str:
         """Build Cypher for document insertion"""
-        operation = "MERGE" if merge else "CREATE"
-        
-        # Determine node type based on source_type
-        source_type = document.get('source_type', 'german_law')
-        node_type = self._get_node_type(source_type)
-        
-        # Build properties string
-        props = ', '.join(f"{k}: ${k}" for k in document.keys())
+        labels = node_labels(document.get('source_type', 'german_law'))
+        node_clause = self._document_node_clause(labels, "$doc.eli_uri", merge)
         
         cypher = f"""
-        {operation} (doc:{node_type} {{eli_uri: $doc.eli_uri}})
-        SET doc += $doc
-        RETURN doc
+        {node_clause}
+        SET n += $doc{self._directive_clause(labels, "$doc")}
+        RETURN n
         """
         
         return cypher
     
     def _get_node_type(self, source_type: str) -> str:
-        """Map source type to Neo4j node label"""
-        type_mapping = {
-            'german_law': 'GermanLaw',
-            'eu_regulation': 'EURegulation',
-            'eu_directive': 'EUDirective',
-            'case_law': 'CourtDecision',
-        }
-        return type_mapping.get(source_type, 'LegalDocument')
+        """Map source type to Neo4j node label (see src.graph.labels)"""
+        return node_label(source_type)
+    
+    @staticmethod
+    def _document_node_clause(labels: Tuple[str, ...], eli_uri: str, merge: bool = True) -> str:
+        """
+        MERGE/CREATE clause binding `n` to a document node
+        
+        Args:
+            labels: node_labels() of the document; ELI works are matched on
+                    :ELIWork (backed by the eli_work_uri constraint) and get
+                    their specific label added, so the single and bulk
+                    writers address the same node
+            eli_uri: Cypher expression for the document's eli_uri
+            merge: Use MERGE (idempotent) vs CREATE
+        """
+        operation = "MERGE" if merge else "CREATE"
+        clause = f"{operation} (n:{labels[0]} {{eli_uri: {eli_uri}}})"
+        for label in labels[1:]:
+            clause += f"\n        SET n:{label}"
+        return clause
     
-    def ingest_documents_batch(self, documents: List[Dict], batch_size: int = 100) -> Tuple[int, int]:
+    @staticmethod
+    def _directive_clause(labels: Tuple[str, ...], doc: str) -> str:
+        """
+        SET clause initialising the transposition index of a new EUDirective
+        
+        The deadline is stored as a DATE (documents carry it as an ISO
+        string) and a directive without implementing laws starts out as
+        'not_transposed', so it is listed by query_transposition_overview
+        before any IMPLEMENTED_BY / IMPLEMENTS edge is written.
+        """
+        if 'EUDirective' not in labels:
+            return ""
+        return (f"\n        SET n.transposition_deadline = "
+                f"date(left(toString({doc}.transposition_deadline), 10)),"
+                f"\n            n.transposition_state = coalesce(n.transposition_state, 'not_transposed'),"
+                f"\n            n.implementation_count = coalesce(n.implementation_count, 0)")
+    
+    def _build_bulk_insert_cypher(self, labels: Tuple[str, ...], merge: bool = True) -> str:
+        """Build parameterized UNWIND Cypher for a batch of same-label documents"""
+        node_clause = self._document_node_clause(labels, "doc.eli_uri", merge)
+        
+        cypher = f"""
+        UNWIND $docs AS doc
+        {node_clause}
+        SET n += doc{self._directive_clause(labels, "doc")}
+        RETURN count(n) AS written
+        """
+        
+        return cypher
+    
+    def ingest_documents_batch(self, documents: List[Dict], batch_size: int = 100,
+                               bulk: bool = False) -> Tuple[int, int]:
         """
         Ingest multiple documents in batches
         
         Args:
             documents: List of document dicts
             batch_size: Documents per transaction
+            bulk: Write each batch as a single UNWIND statement
+                  (see ingest_documents_bulk)
             
         Returns:
             (successfully_ingested, failed)
         """
+        if bulk:
+            return self.ingest_documents_bulk(documents, batch_size=batch_size)
+        
         success_count = 0
         failed_count = 0
         
@@ -242,8 +775,274 @@ class Neo4jClient:
             
             logger.info(f"✓ Batch {batch_num} complete ({success_count} ingested, {failed_count} failed)")
         
+        self.invalidate_cache(doc.get('eli_uri') for doc in documents)
+        return success_count, failed_count
+    
+    def ingest_documents_bulk(self, documents: List[Dict], batch_size: int = 1000,
+                              merge: bool = True, max_retries: int = 2,
+                              retry_backoff: float = 1.0) -> Tuple[int, int]:
+        """
+        Ingest documents with one UNWIND statement per batch
+        
+        Documents are grouped by node label (see src.graph.labels.node_labels) so every
+        batch is a single parameterized round trip. Failed batches are
+        retried on their own; batches that already committed are not resent.
+        Per-batch timings are kept in self.last_batch_stats.
+        
+        Args:
+            documents: List of document dicts
+            batch_size: Documents per UNWIND statement
+            merge: Use MERGE (idempotent) vs CREATE
+            max_retries: Retry attempts for a failed batch
+            retry_backoff: Base delay in seconds between retry rounds
+            
+        Returns:
+            (successfully_ingested, failed)
+        """
+        success_count = 0
+        failed_count = 0
+        self.last_batch_stats = []
+        
+        groups: Dict[str, List[Dict]] = {}
+        for doc in documents:
+            if not doc.get('eli_uri'):
+                logger.error("Document missing eli_uri")
+                failed_count += 1
+                continue
+            groups.setdefault(node_labels(doc.get('source_type', 'german_law')), []).append(doc)
+        
+        batches = [
+            (labels[-1], self._build_bulk_insert_cypher(labels, merge), docs[i:i+batch_size])
+            for labels, docs in groups.items()
+            for i in range(0, len(docs), batch_size)
+        ]
+        
+        logger.info(f"Starting bulk ingest of {len(documents)} documents "
+                    f"({len(batches)} batches, {len(groups)} labels)")
+        
+        success_count, failed = self._write_unwind_batches(batches, 'docs', max_retries, retry_backoff)
+        failed_count += failed
+        self.invalidate_cache(doc['eli_uri'] for docs in groups.values() for doc in docs)
+        
+        logger.info(f"✓ Bulk ingest complete ({success_count} ingested, {failed_count} failed)")
         return success_count, failed_count
     
+    def _write_unwind_batches(self, batches: List[Tuple[str, str, List[Dict]]], param: str,
+                              max_retries: int = 2, retry_backoff: float = 1.0) -> Tuple[int, int]:
+        """
+        Run UNWIND write batches, retrying only the batches that failed
+        
+        Args:
+            batches: (label, cypher, rows) per batch; cypher must UNWIND
+                     ${param} and RETURN a `written` count
+            param: Name of the list parameter
+            max_retries: Retry attempts for a failed batch
+            retry_backoff: Base delay in seconds between retry rounds
+            
+        Returns:
+            (rows written, rows in batches that failed every attempt)
+        """
+        written_count = 0
+        pending = batches
+        attempt = 0
+        while pending:
+            retry = []
+            for label, cypher, batch in pending:
+                start = time.perf_counter()
+                try:
+                    with self.session_scope() as session:
+                        with session.begin_transaction() as tx:
+                            record = tx.run(cypher, {param: batch}).single()
+                except Exception as e:
+                    logger.warning(f"⚠ {label} batch of {len(batch)} failed "
+                                   f"(attempt {attempt + 1}): {e}")
+                    retry.append((label, cypher, batch))
+                    continue
+                
+                elapsed = time.perf_counter() - start
+                written = record['written'] if record is not None else len(batch)
+                rate = len(batch) / elapsed if elapsed > 0 else float('inf')
+                written_count += written
+                self.last_batch_stats.append({
+                    'label': label,
+                    'size': len(batch),
+                    'written': written,
+                    'seconds': elapsed,
+                    'docs_per_sec': rate,
+                    'attempt': attempt + 1,
+                })
+                logger.info(f"✓ {label} batch: {len(batch)} rows in "
+                            f"{elapsed:.2f}s ({rate:.0f} rows/s)")
+            
+            pending = retry
+            attempt += 1
+            if pending and attempt > max_retries:
+                break
+            if pending:
+                time.sleep(retry_backoff * attempt)
+        
+        failed_count = 0
+        for label, _, batch in pending:
+            logger.error(f"✗ {label} batch of {len(batch)} failed after "
+                         f"{max_retries + 1} attempts")
+            failed_count += len(batch)
+        
+        return written_count, failed_count
+    
+    def ingest_articles_bulk(self, articles: List[Dict], batch_size: int = 1000,
+                             law_label: str = "ELIWork", max_retries: int = 2) -> Tuple[int, int]:
+        """
+        Ingest Article nodes and link each to its law via BELONGS_TO
+        
+        Args:
+            articles: Article dicts with eli_uri and law_uri
+            batch_size: Articles per UNWIND statement
+            law_label: Label of the parent law nodes
+            max_retries: Retry attempts for a failed batch
+            
+        Returns:
+            (successfully_ingested, failed)
+        """
+        self.last_batch_stats = []
+        cypher = f"""
+        UNWIND $articles AS art
+        MERGE (a:Article {{eli_uri: art.eli_uri}})
+        SET a += art
+        WITH a, art
+        OPTIONAL MATCH (law:{law_label} {{eli_uri: art.law_uri}})
+        FOREACH (_ IN CASE WHEN law IS NULL THEN [] ELSE [1] END |
+            MERGE (a)-[:BELONGS_TO]->(law))
+        RETURN count(a) AS written
+        """
+        batches = [
+            ('Article', cypher, articles[i:i+batch_size])
+            for i in range(0, len(articles), batch_size)
+        ]
+        
+        success_count, failed_count = self._write_unwind_batches(batches, 'articles', max_retries)
+        self.invalidate_cache({uri for art in articles for uri in (art['eli_uri'], art.get('law_uri'))})
+        logger.info(f"✓ Article ingest complete ({success_count} ingested, {failed_count} failed)")
+        return success_count, failed_count
+    
+    def ingest_concepts_bulk(self, concepts: Iterable[Dict], batch_size: int = 1000,
+                             hierarchy: bool = True, max_retries: int = 2) -> Tuple[int, int]:
+        """
+        Ingest EuroVoc concepts and their thesaurus hierarchy
+        
+        Concept nodes are merged on eurovoc_id first; BROADER_CONCEPT /
+        NARROWER_CONCEPT / RELATED_CONCEPT edges from the concepts'
+        broader/narrower/related id lists are written afterwards, so
+        edges to concepts later in the input resolve.
+        
+        Args:
+            concepts: Concept dicts (see EuroVocAdapter.iter_skos_concepts)
+            batch_size: Concepts (and edges) per UNWIND statement
+            hierarchy: Also write the thesaurus relationships
+            max_retries: Retry attempts for a failed batch
+            
+        Returns:
+            (concepts ingested, failed)
+        """
+        self.last_batch_stats = []
+        cypher = """
+        UNWIND $concepts AS concept
+        MERGE (c:LegalConcept {eurovoc_id: concept.eurovoc_id})
+        SET c:EuroVocConcept, c += concept
+        RETURN count(c) AS written
+        """
+        
+        rows, edges = [], []
+        for concept in concepts:
+            properties, concept_edges = split_concept(concept)
+            rows.append(properties)
+            edges.extend(concept_edges)
+        
+        batches = [
+            ('LegalConcept', cypher, rows[i:i+batch_size])
+            for i in range(0, len(rows), batch_size)
+        ]
+        success_count, failed_count = self._write_unwind_batches(batches, 'concepts', max_retries)
+        stats = self.last_batch_stats
+        
+        if hierarchy and edges:
+            created, missing, _ = self.create_relationships_batch(edges, batch_size=batch_size)
+            if missing:
+                logger.warning(f"⚠ {missing} thesaurus edges point to unknown concepts")
+            stats = stats + self.last_batch_stats
+        self.last_batch_stats = stats
+        # Cached concept lists are keyed by article, not by concept
+        if self.cache is not None:
+            self.cache.clear()
+        
+        logger.info(f"✓ Concept ingest complete ({success_count} ingested, {failed_count} failed)")
+        return success_count, failed_count
+    
+    def get_document_hashes(self, labels: Optional[List[str]] = None) -> Dict[str, str]:
+        """
+        Load the stored eli_uri → document_hash map in a single query
+        
+        Args:
+            labels: Restrict to nodes carrying one of these labels
+            
+        Returns:
+            Dict of eli_uri to document_hash
+        """
+        label_filter = "AND any(label IN labels(n) WHERE label IN $labels)" if labels else ""
+        cypher = f"""
+        MATCH (n)
+        WHERE n.eli_uri IS NOT NULL AND n.document_hash IS NOT NULL {label_filter}
+        RETURN n.eli_uri AS eli_uri, n.document_hash AS document_hash
+        """
+        
+        rows = self.execute_query_list(cypher, {'labels': labels or []})
+        logger.info(f"Loaded {len(rows)} stored document hashes")
+        return {row['eli_uri']: row['document_hash'] for row in rows}
+    
+    def get_embedding_hashes(self, label: str = "Article") -> Dict[str, str]:
+        """Load eli_uri → embedding_text_hash for nodes that already have a vector"""
+        cypher = f"""
+        MATCH (n:{label})
+        WHERE n.embedding_text_hash IS NOT NULL
+        RETURN n.eli_uri AS eli_uri, n.embedding_text_hash AS text_hash
+        """
+        
+        rows = self.execute_query_list(cypher)
+        return {row['eli_uri']: row['text_hash'] for row in rows}
+    
+    def write_embeddings_bulk(self, rows: List[Dict], label: str = "Article",
+                              property_name: str = "embedding", batch_size: int = 500,
+                              max_retries: int = 2) -> Tuple[int, int]:
+        """
+        Write vectors with one UNWIND statement per batch
+        
+        Vectors are stored with db.create.setNodeVectorProperty, which
+        keeps them as float32 arrays usable by the vector indexes.
+        
+        Args:
+            rows: Dicts with eli_uri, embedding (list of floats) and text_hash
+            label: Label of the embedded nodes
+            property_name: Vector property covered by the vector index
+            batch_size: Vectors per UNWIND statement
+            max_retries: Retry attempts for a failed batch
+            
+        Returns:
+            (written, failed)
+        """
+        self.last_batch_stats = []
+        cypher = f"""
+        UNWIND $rows AS row
+        MATCH (n:{label} {{eli_uri: row.eli_uri}})
+        CALL db.create.setNodeVectorProperty(n, '{property_name}', row.embedding)
+        SET n.embedding_text_hash = row.text_hash
+        RETURN count(n) AS written
+        """
+        batches = [
+            (f"{label}.{property_name}", cypher, rows[i:i+batch_size])
+            for i in range(0, len(rows), batch_size)
+        ]
+        
+        return self._write_unwind_batches(batches, 'rows', max_retries)
+    
     def create_relationship(self, from_uri: str, to_uri: str, rel_type: str, 
                           from_label: str = "LegalDocument", 
                           to_label: str = "LegalDocument",
@@ -255,8 +1054,8 @@ class Neo4jClient:
             from_uri: Source document ELI URI
             to_uri: Target document ELI URI
             rel_type: Relationship type (e.g., IMPLEMENTS, SUPERSEDES)
-            from_label: Source node label
-            to_label: Target node label
+            from_label: Source node label (resolved with id_space)
+            to_label: Target node label (resolved with id_space)
             properties: Relationship properties
             
         Returns:
@@ -267,9 +1066,11 @@ class Neo4jClient:
             props_str = ', '.join(f"{k}: ${k}" for k in properties.keys())
             props_str = f" {{{props_str}}}" if props_str else ""
             
+            from_label, to_label = _endpoint_label(from_label), _endpoint_label(to_label)
+            rel_type = _check_label(rel_type, "relationship type")
             cypher = f"""
-            MATCH (from:{from_label} {{eli_uri: $from_uri}})
-            MATCH (to:{to_label} {{eli_uri: $to_uri}})
+            MATCH (from:{from_label} {{{key_property(from_label)}: $from_uri}})
+            MATCH (to:{to_label} {{{key_property(to_label)}: $to_uri}})
             MERGE (from)-[r:{rel_type}{props_str}]->(to)
             SET r += $props
             RETURN r
@@ -282,84 +1083,437 @@ class Neo4jClient:
             }
             params['props'] = properties
             
-            result = self.execute_query_single(cypher, params)
+            result = self.execute_query_single(cypher, params, access_mode="write")
+            self.invalidate_cache([from_uri, to_uri])
+            if rel_type == 'IMPLEMENTED_BY' and result is not None:
+                self.refresh_transposition_index([from_uri])
+            elif rel_type == 'IMPLEMENTS' and result is not None:
+                self.refresh_transposition_index([to_uri])
             return result is not None
         
         except Exception as e:
             logger.error(f"Error creating relationship: {e}")
             return False
     
-    def query_amendments(self, law_uri: str) -> List[Dict]:
-        """Query amendment chain for a law"""
-        cypher = """
-        MATCH path = (law:LegalDocument {eli_uri: $uri})-[:SUPERSEDES*]->(prev:LegalDocument)
+    def create_relationships_batch(self, relationships: Iterable[Tuple], batch_size: int = 1000,
+                                   from_label: str = "ELIWork",
+                                   to_label: str = "ELIWork",
+                                   max_retries: int = 2) -> Tuple[int, int, int]:
+        """
+        Create many relationships with one UNWIND statement per batch
+        
+        Relationships are grouped by (rel_type, from_label, to_label) since
+        those cannot be parameterized; each group is written in batches.
+        
+        Args:
+            relationships: (from_uri, to_uri, rel_type, props) tuples, or
+                           (from_uri, to_uri, rel_type, props, from_label, to_label)
+                           to override the default labels per edge; labels are
+                           resolved with id_space (LegalDocument and ELI work
+                           labels → ELIWork, as in the bulk export) and endpoints
+                           are matched on key_property(label) (eurovoc_id for
+                           LegalConcept, eli_uri otherwise)
+            batch_size: Relationships per UNWIND statement
+            from_label: Default source node label
+            to_label: Default target node label
+            max_retries: Retry attempts for a failed batch
+            
+        Returns:
+            (created, missing_endpoint, failed)
+        """
+        self.last_batch_stats = []
+        groups: Dict[Tuple[str, str, str], List[Dict]] = {}
+        endpoint_labels: Dict[str, str] = {}
+        for rel in relationships:
+            from_uri, to_uri, rel_type, props = rel[:4]
+            labels = rel[4:6] if len(rel) >= 6 else (from_label, to_label)
+            for label in labels:
+                if label not in endpoint_labels:
+                    endpoint_labels[label] = _endpoint_label(label)
+            key = (rel_type, endpoint_labels[labels[0]], endpoint_labels[labels[1]])
+            groups.setdefault(key, []).append({
+                'from_uri': from_uri,
+                'to_uri': to_uri,
+                'props': props or {},
+            })
+        
+        batches = []
+        for (rel_type, src_label, dst_label), rows in groups.items():
+            _check_label(rel_type, "relationship type")
+            cypher = f"""
+            UNWIND $rels AS rel
+            MATCH (from:{src_label} {{{key_property(src_label)}: rel.from_uri}})
+            MATCH (to:{dst_label} {{{key_property(dst_label)}: rel.to_uri}})
+            MERGE (from)-[r:{rel_type}]->(to)
+            SET r += rel.props
+            RETURN count(r) AS written
+            """
+            batches.extend(
+                (rel_type, cypher, rows[i:i+batch_size])
+                for i in range(0, len(rows), batch_size)
+            )
+        
+        total = sum(len(rows) for rows in groups.values())
+        logger.info(f"Starting bulk relationship write of {total} edges "
+                    f"({len(batches)} batches, {len(groups)} groups)")
+        
+        created, failed = self._write_unwind_batches(batches, 'rels', max_retries)
+        self.invalidate_cache({uri for rows in groups.values() for row in rows
+                               for uri in (row['from_uri'], row['to_uri'])})
+        missing = total - created - failed
+        
+        directive_uris = {row['from_uri'] for (rel_type, _, _), rows in groups.items()
+                          if rel_type == 'IMPLEMENTED_BY' for row in rows}
+        directive_uris.update(row['to_uri'] for (rel_type, _, _), rows in groups.items()
+                              if rel_type == 'IMPLEMENTS' for row in rows)
+        if directive_uris:
+            self.refresh_transposition_index(directive_uris, batch_size)
+        
+        logger.info(f"✓ Relationships: {created} created, {missing} missing endpoint, {failed} failed")
+        return created, missing, failed
+    
+    def query_amendments(self, law_uri: str, max_depth: int = DEFAULT_MAX_AMENDMENT_DEPTH,
+                         label: str = "ELIWork") -> List[Dict]:
+        """
+        Query amendment chain for a law
+        
+        Returns only the longest chain (at most one row), following at
+        most max_depth SUPERSEDES hops; `truncated` is set when the
+        history goes deeper than that.
+        
+        Args:
+            law_uri: ELI URI of the current version
+            max_depth: Maximum SUPERSEDES hops to follow
+            label: Anchor label with an eli_uri index (ELIWork by default)
+        """
+        cypher = build_amendments_query(label, max_depth)
+        return self._cached_query(
+            'amendments', (law_uri, max_depth, label),
+            lambda: self.execute_query_list(cypher, {'uri': law_uri}),
+            uri_columns=('version_chain',),
+        )
+    
+    def query_amendment_versions(self, law_uri: str, skip: int = 0, limit: int = 50,
+                                 max_depth: int = DEFAULT_MAX_AMENDMENT_DEPTH,
+                                 label: str = "ELIWork") -> List[Dict]:
+        """
+        Page through a law's version history, newest first
+        
+        Args:
+            law_uri: ELI URI of the current version
+            skip: Versions to skip (position 0 is the law itself)
+            limit: Versions per page
+            max_depth: Maximum SUPERSEDES hops to follow
+            label: Anchor label with an eli_uri index
+            
+        Returns:
+            Rows with position, eli_uri, date_document and the
+            amendment_type of the edge leading to that version
+        """
+        cypher = f"""
+        MATCH (law:{_check_label(label)} {{eli_uri: $uri}})
+        {_longest_chain_match(max_depth)}
+        WITH path
+        ORDER BY length(path) DESC
+        LIMIT 1
+        UNWIND range(0, length(path)) AS position
+        WITH position,
+             nodes(path)[position] AS version,
+             CASE WHEN position > 0 THEN relationships(path)[position - 1] END AS amendment
+        RETURN 
+            position,
+            version.eli_uri as eli_uri,
+            version.date_document as date_document,
+            amendment.amendment_type as amendment_type
+        ORDER BY position
+        SKIP $skip
+        LIMIT $limit
+        """
+        
+        return self.execute_query_list(cypher, {'uri': law_uri, 'skip': skip, 'limit': limit})
+    
+    def query_amendment_chains(self, law_uris: List[str],
+                               max_depth: int = DEFAULT_MAX_AMENDMENT_DEPTH,
+                               label: str = "ELIWork") -> Dict[str, Dict]:
+        """
+        Longest amendment chain for many laws in one query
+        
+        Args:
+            law_uris: ELI URIs of current versions
+            max_depth: Maximum SUPERSEDES hops to follow
+            label: Anchor label with an eli_uri index
+            
+        Returns:
+            Dict of law URI to chain row (laws without amendments are omitted),
+            with `truncated` set as by query_amendments
+        """
+        max_depth = int(max_depth)
+        cypher = f"""
+        UNWIND $uris AS uri
+        MATCH (law:{_check_label(label)} {{eli_uri: uri}})
+        CALL {{
+            WITH law
+            {_longest_chain_match(max_depth)}
+            RETURN path, prev
+            ORDER BY length(path) DESC
+            LIMIT 1
+        }}
         RETURN 
             law.eli_uri as current_version,
             [n in nodes(path) | n.eli_uri] as version_chain,
-            [r in relationships(path) | r.amendment_type] as amendment_types
+            [r in relationships(path) | r.amendment_type] as amendment_types,
+            length(path) = {max_depth} AND EXISTS {{ (prev)-[:SUPERSEDES]->() }} as truncated
         """
         
-        return self.execute_query_list(cypher, {'uri': law_uri})
+        rows = self.execute_query_list(cypher, {'uris': list(law_uris)})
+        return {row['current_version']: row for row in rows}
     
     def query_implementations(self, directive_uri: str) -> List[Dict]:
         """Query implementation mapping (EU → National)"""
-        cypher = """
-        MATCH (directive:EUDirective {eli_uri: $uri})-[impl:IMPLEMENTED_BY]->(law:GermanLaw)
-        RETURN 
-            directive.celex_number as directive_celex,
-            directive.title_en as directive_title,
-            law.eli_uri as implementing_law,
-            law.title_de as law_title,
-            impl.status as implementation_status,
-            impl.implementation_date as date_implemented
-        ORDER BY impl.implementation_date
+        return self._cached_query(
+            'implementations', (directive_uri,),
+            lambda: self.execute_query_list(IMPLEMENTATIONS_QUERY, {'uri': directive_uri}),
+            uri_columns=('implementing_law',),
+        )
+    
+    def refresh_transposition_index(self, directive_uris: Iterable[str],
+                                    batch_size: int = 1000) -> int:
         """
+        Recompute the materialized transposition summary of directives
+        
+        Sets implementation_count, implementing_laws, last_implementation_date
+        and transposition_state ('not_transposed', 'partial' or 'complete')
+        on each EUDirective from its IMPLEMENTED_BY edges and incoming
+        IMPLEMENTS edges, and converts a deadline stored as a string to a
+        DATE. Called automatically whenever either edge type is written
+        through this client.
         
-        return self.execute_query_list(cypher, {'uri': directive_uri})
+        Args:
+            directive_uris: ELI URIs of directives whose edges changed
+            batch_size: Directives per UNWIND statement
+            
+        Returns:
+            Number of directives refreshed
+        """
+        uris = list(dict.fromkeys(directive_uris))
+        refreshed = 0
+        for i in range(0, len(uris), batch_size):
+            batch = uris[i:i+batch_size]
+            result = self.execute_query_single(
+                REFRESH_TRANSPOSITION_QUERY,
+                {'uris': batch, 'complete': list(TRANSPOSITION_COMPLETE_STATUSES)},
+                access_mode="write",
+            )
+            refreshed += result['written'] if result else 0
+        self.invalidate_cache(uris)
+        
+        logger.info(f"✓ Refreshed transposition index for {refreshed} directives")
+        return refreshed
     
-    def query_concepts(self, article_uri: str) -> List[Dict]:
-        """Query EuroVoc concepts related to article"""
-        cypher = """
-        MATCH (article:Article {eli_uri: $uri})-[rel:CONCERNS]->(concept:LegalConcept)
-        RETURN 
-            concept.eurovoc_id as concept_id,
-            concept.pref_label_de as concept_de,
-            concept.pref_label_en as concept_en,
-            rel.relevance_score as relevance
-        ORDER BY rel.relevance_score DESC
+    def rebuild_transposition_index(self, batch_size: int = 1000) -> int:
+        """Recompute the transposition summary of every EUDirective"""
+        uris = [row['uri'] for row in self.stream_query(
+            "MATCH (d:EUDirective) RETURN d.eli_uri AS uri")]
+        return self.refresh_transposition_index(uris, batch_size)
+    
+    def query_transposition_status(self, directive_uri: str) -> Optional[Dict]:
+        """Look up a directive's materialized transposition summary"""
+        rows = self._cached_query(
+            'transposition_status', (directive_uri,),
+            lambda: self.execute_query_list(TRANSPOSITION_STATUS_QUERY, {'uri': directive_uri}),
+        )
+        return rows[0] if rows else None
+    
+    def query_transposition_overview(self, as_of: Union[str, date, None] = None,
+                                     states: Iterable[str] = ('not_transposed', 'partial')
+                                     ) -> List[Dict]:
         """
+        Directives past their transposition deadline in the given states
+        
+        Served from the transposition_state/transposition_deadline index;
+        no IMPLEMENTED_BY edges are traversed.
         
-        return self.execute_query_list(cypher, {'uri': article_uri})
+        Args:
+            as_of: Reference date (date or ISO string, default today)
+            states: Transposition states to include
+            
+        Returns:
+            Directives ordered by transposition deadline
+        """
+        as_of = _iso_date(as_of or date.today())
+        states = tuple(states)
+        unknown = set(states) - set(TRANSPOSITION_STATES)
+        if unknown:
+            raise ValueError(f"Unknown transposition states: {sorted(unknown)}")
+        
+        return self._cached_query(
+            'transposition_overview', (as_of, states),
+            lambda: self.execute_query_list(
+                TRANSPOSITION_OVERVIEW_QUERY, {'as_of': as_of, 'states': list(states)}),
+            global_tag=True,
+        )
+    
+    def query_concepts(self, article_uri: str) -> List[Dict]:
+        """Query EuroVoc concepts related to article"""
+        return self._cached_query(
+            'concepts', (article_uri,),
+            lambda: self.execute_query_list(CONCEPTS_QUERY, {'uri': article_uri}),
+        )
     
     def get_statistics(self) -> Dict:
         """Get database statistics"""
-        cypher = """
-        RETURN 
-            count(n:GermanLaw) as german_laws,
-            count(n:EURegulation) as eu_regulations,
-            count(n:EUDirective) as eu_directives,
-            count(n:Article) as articles,
-            count(n:LegalConcept) as concepts
+        return self.execute_query_single(STATISTICS_QUERY) or {}
+    
+    def search_full_text(self, query: str, node_type: str = "ELIWork",
+                         limit: int = 50, **filters) -> List[Dict]:
         """
+        Full-text search on the fulltext index of a node type
         
-        return self.execute_query_single(cypher) or {}
+        Args:
+            query: Lucene query string
+            node_type: One of FULLTEXT_INDEXES
+            limit: Maximum number of hits
+            **filters: document_types, date_from, date_to (see hybrid_search)
+            
+        Returns:
+            Hits with uri, title and score, best first
+        """
+        params = _search_params(node_type, FULLTEXT_INDEXES, limit, **filters)
+        params['query'] = query
+        return self._cached_query(
+            'search_full_text', (query, node_type, limit, repr(sorted(filters.items()))),
+            lambda: self.execute_query_list(FULL_TEXT_QUERY, params),
+            global_tag=True,
+        )
     
-    def search_full_text(self, query: str, node_type: str = "LegalDocument") -> List[Dict]:
-        """Full-text search across documents"""
-        cypher = f"""
-        CALL db.index.fulltext.queryNodes(
-            "articles_index",
-            $query
-        ) YIELD node, score
-        RETURN 
-            node.eli_uri as uri,
-            node.title_de as title,
-            score
-        ORDER BY score DESC
-        LIMIT 50
+    def vector_search(self, embedding, node_type: str = "Article", limit: int = 10,
+                      candidates: Optional[int] = None, expand_concepts: bool = False,
+                      **filters) -> List[Dict]:
         """
+        Approximate kNN search on the vector index of a node type
         
-        return self.execute_query_list(cypher, {'query': query})
+        Args:
+            embedding: Query vector (list or 1-D array)
+            node_type: One of VECTOR_INDEXES
+            limit: Maximum number of hits
+            candidates: Neighbours fetched from the index before filtering
+            expand_concepts: Also return the EuroVoc concepts of each hit
+            **filters: document_types, date_from, date_to (see hybrid_search)
+            
+        Returns:
+            Hits with uri, title and score ((1 + cosine) / 2 on both
+            backends), best first
+        """
+        backend = self.vector_backends.get(node_type)
+        if backend is not None:
+            max_concepts = filters.pop('max_concepts', 10)
+            hits = backend.vector_search(embedding, limit, candidates, **filters)
+            if expand_concepts and hits:
+                concepts = {row['uri']: row['concepts'] for row in self.execute_query_list(
+                    build_concepts_batch_query(node_type),
+                    {'uris': [hit['uri'] for hit in hits], 'max_concepts': max_concepts})}
+                for hit in hits:
+                    hit['concepts'] = concepts.get(hit['uri'], [])
+            return hits
+        
+        params = _search_params(node_type, VECTOR_INDEXES, limit, candidates, **filters)
+        params['embedding'] = [float(x) for x in embedding]
+        return self.execute_query_list(build_search_query('vector', expand_concepts), params)
+    
+    def set_vector_backend(self, node_type: str, backend):
+        """
+        Serve vector_search (and hybrid_search) for a node type from a local index
+        
+        Args:
+            node_type: Node type whose Neo4j vector index is replaced
+            backend: Object with a vector_search(embedding, limit, candidates, **filters)
+                     method, e.g. src.retrieval.vector_search.LocalVectorIndex;
+                     None restores db.index.vector.queryNodes
+        """
+        if backend is None:
+            self.vector_backends.pop(node_type, None)
+        else:
+            self.vector_backends[node_type] = backend
+    
+    def hybrid_search(self, query: str, top_k: int = 10, node_type: str = "Article",
+                      query_embedding=None, embedder=None,
+                      document_types: Optional[Iterable[str]] = None,
+                      date_from: Union[str, date, None] = None,
+                      date_to: Union[str, date, None] = None,
+                      expand_concepts: bool = False, max_concepts: int = 10,
+                      candidates: Optional[int] = None, rrf_k: int = RRF_K) -> List[Dict]:
+        """
+        Hybrid retrieval: fulltext and vector search fused by reciprocal rank
+        
+        Both index queries run concurrently in separate sessions. Without a
+        query embedding (or embedder) only the fulltext branch runs. With
+        expand_concepts each branch collects the EuroVoc concepts of its
+        hits, so no follow-up round trip is needed.
+        
+        Args:
+            query: Search text
+            top_k: Number of fused results
+            node_type: Node type to search (needs a fulltext and a vector index)
+            query_embedding: Precomputed query vector
+            embedder: Embedder used to embed `query` if no vector is given
+            document_types: Keep hits whose (parent) source_type is in this list (e.g. "german_law")
+            date_from: Keep hits whose (parent) date_document is on or after this date
+            date_to: Keep hits whose (parent) date_document is on or before this date
+            expand_concepts: Attach EuroVoc concepts (one hop over CONCERNS)
+            max_concepts: Concepts returned per hit
+            candidates: Hits fetched per branch before fusion (default 4 × top_k)
+            rrf_k: Reciprocal-rank fusion constant
+            
+        Returns:
+            Hits with uri, title, score (fused), fulltext_rank, vector_rank,
+            fulltext_score, vector_score and optionally concepts
+        """
+        if query_embedding is None and embedder is not None:
+            query_embedding = embedder.embed([query])[0]
+        
+        depth = candidates or top_k * 4
+        params = _search_params(node_type, FULLTEXT_INDEXES, depth, depth,
+                                document_types, date_from, date_to, max_concepts)
+        params['query'] = query
+        fulltext_cypher = build_search_query('fulltext', expand_concepts)
+        
+        if query_embedding is None:
+            branches = {'fulltext': self.execute_query_list(fulltext_cypher, params)}
+        else:
+            if self._search_executor is None:
+                self._search_executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="hybrid-search")
+            futures = {
+                'fulltext': self._search_executor.submit(
+                    self.execute_query_list, fulltext_cypher, params),
+                'vector': self._search_executor.submit(
+                    self.vector_search, query_embedding, node_type, depth, depth * 2,
+                    expand_concepts, document_types=document_types,
+                    date_from=date_from, date_to=date_to, max_concepts=max_concepts),
+            }
+            branches = {name: future.result() for name, future in futures.items()}
+        
+        fused = reciprocal_rank_fusion(
+            ([hit['uri'] for hit in hits] for hits in branches.values()), rrf_k)
+        
+        merged: Dict[str, Dict] = {}
+        for name, hits in branches.items():
+            for rank, hit in enumerate(hits, start=1):
+                row = merged.setdefault(hit['uri'], {
+                    'uri': hit['uri'],
+                    'title': hit['title'],
+                    'score': fused[hit['uri']],
+                    'fulltext_rank': None,
+                    'vector_rank': None,
+                    'fulltext_score': None,
+                    'vector_score': None,
+                })
+                row[f'{name}_rank'] = rank
+                row[f'{name}_score'] = hit['score']
+                if expand_concepts:
+                    row.setdefault('concepts', hit.get('concepts') or [])
+        
+        return sorted(merged.values(), key=lambda row: row['score'], reverse=True)[:top_k]
     
     def validate_schema(self) -> Tuple[bool, List[str]]:
         """Validate schema constraints and indexes"""
@@ -394,6 +1548,169 @@ class Neo4jClient:
         return len(issues) == 0, issues
 
 
+class AsyncNeo4jClient:
+    """
+    Asynchronous Neo4j client with the same query API as Neo4jClient
+    
+    Built on the neo4j async driver so GraphRAG retrieval can issue many
+    lookups at once; use gather() or query_many() to fan out under a
+    concurrency limit.
+    """
+    
+    def __init__(self, uri: str, user: str, password: str,
+                 encrypted: bool = False, max_pool_size: int = 50,
+                 max_concurrency: int = 16, database: Optional[str] = None):
+        """
+        Initialize async Neo4j client
+        
+        Args:
+            uri: Neo4j URI (bolt://host:port)
+            user: Database user
+            password: Database password
+            encrypted: Use encrypted connection
+            max_pool_size: Maximum connection pool size
+            max_concurrency: Default limit for concurrent queries in gather()
+            database: Database every session opens (None: the server default)
+        """
+        self.uri = uri
+        self.user = user
+        self.password = password
+        self.encrypted = encrypted
+        self.max_concurrency = max_concurrency
+        self.database = database
+        
+        logger.info(f"Connecting to Neo4j (async): {self.uri}")
+        self.driver = AsyncGraphDatabase.driver(
+            self.uri,
+            auth=(self.user, self.password),
+            encrypted=self.encrypted,
+            max_connection_pool_size=max_pool_size,
+        )
+    
+    async def verify_connectivity(self):
+        """Check that the database is reachable"""
+        try:
+            await self.driver.verify_connectivity()
+            logger.info("✓ Connected to Neo4j (async)")
+        except AuthError as e:
+            logger.error(f"Authentication failed: {e}")
+            raise
+        except ServiceUnavailable as e:
+            logger.error(f"Neo4j service unavailable: {e}")
+            raise
+    
+    async def close(self):
+        """Close database connection"""
+        if self.driver:
+            await self.driver.close()
+            logger.info("Neo4j async connection closed")
+    
+    async def __aenter__(self):
+        await self.verify_connectivity()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def execute_query_list(self, cypher: str, parameters: Dict = None) -> List[Dict]:
+        """Execute read query and return all results as list"""
+        parameters = parameters or {}
+        
+        async def _read(tx):
+            result = await tx.run(cypher, parameters)
+            return [dict(record) async for record in result]
+        
+        session_config = {'database': self.database} if self.database else {}
+        async with self.driver.session(**session_config) as session:
+            try:
+                return await session.execute_read(_read)
+            except Exception as e:
+                logger.error(f"Query execution error: {e}\nQuery: {cypher}")
+                raise
+    
+    async def execute_query_single(self, cypher: str, parameters: Dict = None) -> Optional[Dict]:
+        """Execute query and return single result"""
+        records = await self.execute_query_list(cypher, parameters)
+        return records[0] if records else None
+    
+    async def query_amendments(self, law_uri: str, max_depth: int = DEFAULT_MAX_AMENDMENT_DEPTH,
+                               label: str = "ELIWork") -> List[Dict]:
+        """Query longest amendment chain for a law (see Neo4jClient.query_amendments)"""
+        cypher = build_amendments_query(label, max_depth)
+        return await self.execute_query_list(cypher, {'uri': law_uri})
+    
+    async def query_implementations(self, directive_uri: str) -> List[Dict]:
+        """Query implementation mapping (EU → National)"""
+        return await self.execute_query_list(IMPLEMENTATIONS_QUERY, {'uri': directive_uri})
+    
+    async def query_transposition_status(self, directive_uri: str) -> Optional[Dict]:
+        """Look up a directive's materialized transposition summary"""
+        return await self.execute_query_single(TRANSPOSITION_STATUS_QUERY, {'uri': directive_uri})
+    
+    async def query_concepts(self, article_uri: str) -> List[Dict]:
+        """Query EuroVoc concepts related to article"""
+        return await self.execute_query_list(CONCEPTS_QUERY, {'uri': article_uri})
+    
+    async def get_statistics(self) -> Dict:
+        """Get database statistics"""
+        return await self.execute_query_single(STATISTICS_QUERY) or {}
+    
+    async def search_full_text(self, query: str, node_type: str = "ELIWork",
+                               limit: int = 50, **filters) -> List[Dict]:
+        """Full-text search on the fulltext index of a node type"""
+        params = _search_params(node_type, FULLTEXT_INDEXES, limit, **filters)
+        params['query'] = query
+        return await self.execute_query_list(FULL_TEXT_QUERY, params)
+    
+    async def gather(self, calls: Iterable[Awaitable], limit: Optional[int] = None,
+                     return_exceptions: bool = False) -> List[Any]:
+        """
+        Await many queries concurrently, at most `limit` in flight
+        
+        Args:
+            calls: Coroutines, e.g. [client.query_concepts(uri) for uri in uris]
+            limit: Concurrency limit (defaults to self.max_concurrency)
+            return_exceptions: Return failures in place instead of raising
+            
+        Returns:
+            Results in the order of `calls`
+        """
+        semaphore = asyncio.Semaphore(limit or self.max_concurrency)
+        
+        async def _limited(call):
+            async with semaphore:
+                return await call
+        
+        return await asyncio.gather(*(_limited(call) for call in calls),
+                                    return_exceptions=return_exceptions)
+    
+    async def query_many(self, query_name: str, uris: Iterable[str],
+                         limit: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """
+        Run one query_* method for many URIs concurrently
+        
+        Args:
+            query_name: 'amendments', 'implementations' or 'concepts'
+            uris: Document or article ELI URIs
+            limit: Concurrency limit
+            
+        Returns:
+            Dict of uri to query result; failed lookups map to []
+        """
+        query = getattr(self, f"query_{query_name}")
+        uris = list(uris)
+        results = await self.gather((query(uri) for uri in uris), limit=limit,
+                                    return_exceptions=True)
+        
+        mapped = {}
+        for uri, result in zip(uris, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error in query_{query_name} for {uri}: {result}")
+                result = []
+            mapped[uri] = result
+        return mapped
+
+
 # Example usage
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,457 @@
+"""
+Schema Migrator for EU_GraphRAG
+
+Parses the ontology .cypher files into statements (semicolons inside
+strings and comments do not split), diffs the named constraints and
+indexes against SHOW CONSTRAINTS / SHOW INDEXES, creates only what is
+missing and waits until new indexes are ONLINE.
+
+Usage:
+    migrator = SchemaMigrator(client)
+    plan = migrator.plan()          # dry run
+    migrator.migrate()              # apply + wait for population
+
+    python -m src.graph.schema_manager --dry-run
+"""
+
+import re
+import time
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCHEMA_FILES = (
+    "ontologies/graph-schema.cypher",
+    "ontologies/metadata-schema.cypher",
+)
+
+SHOW_CONSTRAINTS_QUERY = """
+SHOW CONSTRAINTS
+YIELD name, type, entityType, labelsOrTypes, properties
+"""
+
+SHOW_INDEXES_QUERY = """
+SHOW INDEXES
+YIELD name, type, entityType, labelsOrTypes, properties, state, populationPercent, owningConstraint
+"""
+
+INDEX_STATE_QUERY = """
+SHOW INDEXES
+YIELD name, state, populationPercent
+WHERE name IN $names
+RETURN name, state, populationPercent
+"""
+
+
+def split_statements(text: str) -> Iterator[str]:
+    """
+    Split Cypher source into statements on top-level semicolons
+
+    Single/double-quoted strings (with backslash escapes), backtick
+    identifiers, // line comments and /* */ block comments are honoured;
+    comments are dropped from the yielded statements.
+    """
+    current: List[str] = []
+    i, n = 0, len(text)
+    while i < n:
+        ch = text[i]
+        if ch in "'\"`":
+            end = i + 1
+            while end < n and text[end] != ch:
+                end += 2 if text[end] == '\\' and ch != '`' else 1
+            current.append(text[i:end + 1])
+            i = end + 1
+        elif text.startswith('//', i):
+            end = text.find('\n', i)
+            i = n if end == -1 else end
+        elif text.startswith('/*', i):
+            end = text.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+            current.append(' ')
+        elif ch == ';':
+            statement = ''.join(current).strip()
+            if statement:
+                yield statement
+            current = []
+            i += 1
+        else:
+            current.append(ch)
+            i += 1
+    statement = ''.join(current).strip()
+    if statement:
+        yield statement
+
+
+@dataclass(frozen=True)
+class SchemaObject:
+    """A named constraint or index, as declared or as reported by Neo4j"""
+    kind: str                      # 'constraint' or 'index'
+    name: str
+    type: str                      # UNIQUENESS/KEY/EXISTENCE or RANGE/FULLTEXT/VECTOR/TEXT/POINT
+    entity: str                    # 'NODE' or 'RELATIONSHIP'
+    labels: Tuple[str, ...]
+    properties: Tuple[str, ...]
+    statement: Optional[str] = None
+
+    @property
+    def signature(self) -> Tuple:
+        """Definition without the name (two objects with it are equivalent)"""
+        return (self.kind, self.type, self.entity, tuple(sorted(self.labels)), self.properties)
+
+
+_IDENT = r"`[^`]+`|\w+"
+
+_CONSTRAINT_RE = re.compile(
+    rf"^CREATE\s+CONSTRAINT\s+(?P<name>{_IDENT})(?:\s+IF\s+NOT\s+EXISTS)?\s+"
+    rf"FOR\s+(?P<pattern>\(\s*\w+\s*:\s*(?:{_IDENT})\s*\)|\(\s*\)\s*-\s*\[\s*\w+\s*:\s*(?:{_IDENT})\s*\]\s*-\s*>?\s*\(\s*\))\s+"
+    rf"REQUIRE\s+(?P<props>.+?)\s+IS\s+(?P<kind>UNIQUE|NOT\s+NULL|(?:NODE\s+|RELATIONSHIP\s+|REL\s+)?KEY|:{{1,2}}\s*\w+)\b",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_INDEX_RE = re.compile(
+    rf"^CREATE\s+(?:(?P<type>RANGE|FULLTEXT|VECTOR|TEXT|POINT|LOOKUP)\s+)?INDEX\s+(?P<name>{_IDENT})"
+    rf"(?:\s+IF\s+NOT\s+EXISTS)?\s+"
+    rf"FOR\s+(?P<pattern>\(\s*\w+\s*:\s*(?:{_IDENT})(?:\s*\|\s*(?:{_IDENT}))*\s*\)|"
+    rf"\(\s*\)\s*-\s*\[\s*\w+\s*:\s*(?:{_IDENT})(?:\s*\|\s*(?:{_IDENT}))*\s*\]\s*-\s*>?\s*\(\s*\))\s+"
+    rf"ON\s+(?:EACH\s+)?(?P<props>[\[(].*?[\])])",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_LABELS_RE = re.compile(rf":\s*((?:{_IDENT})(?:\s*\|\s*(?:{_IDENT}))*)")
+_PROPERTY_RE = re.compile(rf"\w+\s*\.\s*({_IDENT})")
+
+
+def _unquote(identifier: str) -> str:
+    return identifier.strip().strip('`')
+
+
+def _normalize_constraint_type(kind: str) -> str:
+    kind = kind.upper()
+    if 'UNIQUE' in kind:
+        return 'UNIQUENESS'
+    if 'KEY' in kind:
+        return 'KEY'
+    if 'NULL' in kind or 'EXIST' in kind:
+        return 'EXISTENCE'
+    return 'PROPERTY_TYPE'
+
+
+def _normalize_index_type(kind: Optional[str]) -> str:
+    kind = (kind or 'RANGE').upper()
+    # Neo4j 4.x reports range indexes as BTREE
+    return 'RANGE' if kind == 'BTREE' else kind
+
+
+def parse_ddl(statement: str) -> Optional[SchemaObject]:
+    """
+    Parse a CREATE CONSTRAINT / CREATE ... INDEX statement
+
+    Returns:
+        SchemaObject, or None for anything else (data statements,
+        unnamed DDL, queries)
+    """
+    match = _CONSTRAINT_RE.match(statement)
+    kind = 'constraint'
+    if match is None:
+        match = _INDEX_RE.match(statement)
+        kind = 'index'
+    if match is None:
+        return None
+
+    pattern = match.group('pattern')
+    labels = tuple(_unquote(label) for label in _LABELS_RE.search(pattern).group(1).split('|'))
+    properties = tuple(_unquote(p) for p in _PROPERTY_RE.findall(match.group('props')))
+    if kind == 'constraint':
+        object_type = _normalize_constraint_type(match.group('kind'))
+    else:
+        object_type = _normalize_index_type(match.group('type'))
+    return SchemaObject(
+        kind=kind,
+        name=_unquote(match.group('name')),
+        type=object_type,
+        entity='RELATIONSHIP' if '[' in pattern else 'NODE',
+        labels=labels,
+        properties=properties,
+        statement=statement,
+    )
+
+
+def load_schema_file(path: str) -> Tuple[List[SchemaObject], int]:
+    """
+    Named constraints and indexes declared in a .cypher file
+
+    Returns:
+        (schema objects in file order, number of non-DDL statements skipped)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    objects, skipped = [], 0
+    for statement in split_statements(text):
+        parsed = parse_ddl(statement)
+        if parsed is None:
+            skipped += 1
+            if re.match(r"^(CREATE|DROP)\s+(CONSTRAINT|(\w+\s+)?INDEX)\b", statement, re.IGNORECASE):
+                logger.warning(f"⚠ Unrecognized schema statement in {path}: {statement[:80]}")
+        else:
+            objects.append(parsed)
+    return objects, skipped
+
+
+@dataclass
+class MigrationPlan:
+    """Diff between the schema files and the database"""
+    to_create: List[SchemaObject] = field(default_factory=list)
+    up_to_date: List[str] = field(default_factory=list)
+    # declared name -> name of the existing object with the same definition
+    equivalent: Dict[str, str] = field(default_factory=dict)
+    # declared name -> reason (same name, different definition)
+    conflicts: Dict[str, str] = field(default_factory=dict)
+    # existing objects the schema files do not declare
+    undeclared: List[str] = field(default_factory=list)
+    skipped_statements: int = 0
+    created: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+    def summary(self) -> str:
+        return (f"{len(self.to_create)} to create, {len(self.up_to_date)} up to date, "
+                f"{len(self.equivalent)} equivalent, {len(self.conflicts)} conflicting, "
+                f"{len(self.undeclared)} undeclared, {self.skipped_statements} non-DDL statements skipped")
+
+
+class SchemaMigrator:
+    """Applies missing constraints and indexes from the ontology files"""
+
+    def __init__(self, client, schema_files: Sequence[str] = DEFAULT_SCHEMA_FILES):
+        """
+        Initialize migrator
+
+        Args:
+            client: Neo4jClient
+            schema_files: .cypher files, applied in order
+        """
+        self.client = client
+        self.schema_files = list(schema_files)
+
+    def declared(self) -> Tuple[List[SchemaObject], int]:
+        """Schema objects declared in the files (first declaration of a name wins)"""
+        objects: Dict[str, SchemaObject] = {}
+        skipped = 0
+        for path in self.schema_files:
+            if not Path(path).exists():
+                logger.error(f"Schema file not found: {path}")
+                raise FileNotFoundError(path)
+            file_objects, file_skipped = load_schema_file(path)
+            skipped += file_skipped
+            for obj in file_objects:
+                if obj.name in objects and objects[obj.name].signature != obj.signature:
+                    logger.warning(f"⚠ {obj.name} is declared twice with different definitions "
+                                   f"(keeping the first; {path} ignored)")
+                objects.setdefault(obj.name, obj)
+        return list(objects.values()), skipped
+
+    def existing(self) -> Tuple[Dict[str, SchemaObject], Dict[str, Dict]]:
+        """
+        Constraints and indexes in the database
+
+        Returns:
+            (schema objects by name, raw index rows by name)
+        """
+        objects: Dict[str, SchemaObject] = {}
+        for row in self.client.execute_query_list(SHOW_CONSTRAINTS_QUERY):
+            objects[row['name']] = SchemaObject(
+                kind='constraint', name=row['name'],
+                type=_normalize_constraint_type(row['type']),
+                entity=row['entityType'],
+                labels=tuple(row['labelsOrTypes'] or ()),
+                properties=tuple(row['properties'] or ()),
+            )
+        indexes = {}
+        for row in self.client.execute_query_list(SHOW_INDEXES_QUERY):
+            indexes[row['name']] = row
+            # Indexes backing a constraint are managed through the constraint
+            if row.get('owningConstraint') or row['type'] == 'LOOKUP':
+                continue
+            objects[row['name']] = SchemaObject(
+                kind='index', name=row['name'],
+                type=_normalize_index_type(row['type']),
+                entity=row['entityType'],
+                labels=tuple(row['labelsOrTypes'] or ()),
+                properties=tuple(row['properties'] or ()),
+            )
+        return objects, indexes
+
+    def plan(self) -> MigrationPlan:
+        """Diff the schema files against the database without changing anything"""
+        declared, skipped = self.declared()
+        existing, _ = self.existing()
+        by_signature = {obj.signature: obj.name for obj in existing.values()}
+
+        plan = MigrationPlan(skipped_statements=skipped)
+        planned_signatures = set()
+        for obj in declared:
+            current = existing.get(obj.name)
+            if current is not None:
+                if current.kind != obj.kind or current.signature != obj.signature:
+                    plan.conflicts[obj.name] = (
+                        f"exists as {current.type} {current.kind} on "
+                        f"{'|'.join(current.labels)}({', '.join(current.properties)})")
+                else:
+                    plan.up_to_date.append(obj.name)
+            elif obj.signature in by_signature:
+                plan.equivalent[obj.name] = by_signature[obj.signature]
+            elif obj.signature in planned_signatures:
+                # Same definition declared twice under different names
+                plan.equivalent[obj.name] = next(
+                    o.name for o in plan.to_create if o.signature == obj.signature)
+            else:
+                plan.to_create.append(obj)
+                planned_signatures.add(obj.signature)
+
+        declared_names = {obj.name for obj in declared}
+        referenced = set(plan.equivalent.values())
+        plan.undeclared = sorted(name for name in existing
+                                 if name not in declared_names and name not in referenced)
+        return plan
+
+    def apply(self, plan: MigrationPlan) -> MigrationPlan:
+        """
+        Create the plan's missing objects, one auto-commit statement each
+
+        Constraints are created before indexes so that an index never
+        blocks a constraint's backing index on the same properties.
+        """
+        ordered = sorted(plan.to_create, key=lambda obj: obj.kind != 'constraint')
+        with self.client.session_scope() as session:
+            for obj in ordered:
+                try:
+                    session.run(obj.statement).consume()
+                    plan.created.append(obj.name)
+                    logger.info(f"✓ Created {obj.kind} {obj.name}")
+                except Exception as e:
+                    plan.failed[obj.name] = str(e)
+                    logger.error(f"✗ Failed to create {obj.kind} {obj.name}: {e}")
+        return plan
+
+    def wait_for_indexes(self, names: Optional[Sequence[str]] = None, timeout: float = 600.0,
+                         poll_interval: float = 2.0,
+                         progress: Optional[Callable[[Dict[str, float]], None]] = None) -> Dict[str, str]:
+        """
+        Block until indexes are ONLINE
+
+        Args:
+            names: Index names to wait for (default: all indexes)
+            timeout: Seconds before giving up
+            poll_interval: Seconds between SHOW INDEXES polls
+            progress: Called with {name: populationPercent} of still-populating
+                      indexes on every poll (default: log changes)
+
+        Returns:
+            Final state per index
+
+        Raises:
+            TimeoutError: Indexes still populating after timeout
+            RuntimeError: An index population FAILED
+        """
+        if names is None:
+            names = [row['name'] for row in self.client.execute_query_list(SHOW_INDEXES_QUERY)]
+        names = list(names)
+        if not names:
+            return {}
+
+        deadline = time.monotonic() + timeout
+        reported = None
+        while True:
+            rows = self.client.execute_query_list(INDEX_STATE_QUERY, {'names': names})
+            states = {row['name']: row['state'] for row in rows}
+            failed = [name for name, state in states.items() if state == 'FAILED']
+            if failed:
+                raise RuntimeError(f"Index population failed: {', '.join(sorted(failed))}")
+
+            populating = {row['name']: float(row['populationPercent'] or 0.0)
+                          for row in rows if row['state'] != 'ONLINE'}
+            if not populating:
+                logger.info(f"✓ {len(states)} indexes online")
+                return states
+
+            if progress is not None:
+                progress(populating)
+            else:
+                overall = (sum(populating.values()) + 100.0 * (len(states) - len(populating))) / len(states)
+                if overall != reported:
+                    slowest = min(populating, key=populating.get)
+                    logger.info(f"  populating {len(populating)}/{len(states)} indexes: {overall:.1f}% "
+                                f"(slowest {slowest} {populating[slowest]:.1f}%)")
+                    reported = overall
+
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Indexes not online after {timeout:.0f}s: "
+                                   f"{', '.join(sorted(populating))}")
+            time.sleep(poll_interval)
+
+    def migrate(self, wait: bool = True, timeout: float = 600.0, poll_interval: float = 2.0,
+                dry_run: bool = False,
+                progress: Optional[Callable[[Dict[str, float]], None]] = None) -> MigrationPlan:
+        """
+        Plan, apply and wait for the schema
+
+        Args:
+            wait: Block until created indexes (and constraint-backing indexes) are ONLINE
+            timeout: Seconds to wait for index population
+            poll_interval: Seconds between progress polls
+            dry_run: Only compute and log the plan
+            progress: See wait_for_indexes
+
+        Returns:
+            MigrationPlan with created/failed filled in
+
+        Raises:
+            RuntimeError: A statement failed (after all others were attempted)
+        """
+        plan = self.plan()
+        logger.info(f"Schema plan: {plan.summary()}")
+        for name, reason in plan.conflicts.items():
+            logger.warning(f"⚠ {name} {reason}; not changed (drop it to recreate)")
+        for name, other in plan.equivalent.items():
+            logger.debug(f"{name} is covered by {other}")
+        if dry_run:
+            for obj in plan.to_create:
+                logger.info(f"  would create {obj.kind} {obj.name}")
+            return plan
+
+        self.apply(plan)
+        if wait and plan.created:
+            # Constraints populate a backing index of the same name
+            self.wait_for_indexes(plan.created, timeout=timeout,
+                                  poll_interval=poll_interval, progress=progress)
+        if plan.failed:
+            raise RuntimeError(f"Schema migration failed for: {', '.join(sorted(plan.failed))}")
+        logger.info(f"✓ Schema up to date ({len(plan.created)} created)")
+        return plan
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+
+    from src.graph.neo4j_client import Neo4jClient
+
+    parser = argparse.ArgumentParser(description="Apply missing EU_GraphRAG constraints and indexes")
+    parser.add_argument("schema_files", nargs="*", default=list(DEFAULT_SCHEMA_FILES))
+    parser.add_argument("--uri", default=os.environ.get("NEO4J_URI", "bolt://localhost:7687"))
+    parser.add_argument("--user", default=os.environ.get("NEO4J_USER", "neo4j"))
+    parser.add_argument("--password", default=os.environ.get("NEO4J_PASSWORD", "password"))
+    parser.add_argument("--dry-run", action="store_true", help="Only print the plan")
+    parser.add_argument("--no-wait", action="store_true", help="Do not wait for index population")
+    parser.add_argument("--timeout", type=float, default=600.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    client = Neo4jClient(uri=args.uri, user=args.user, password=args.password)
+    try:
+        SchemaMigrator(client, args.schema_files).migrate(
+            wait=not args.no_wait, timeout=args.timeout, dry_run=args.dry_run)
+    finally:
+        client.close()
@@ -0,0 +1,20 @@
+"""
+Batching Helpers for EU_GraphRAG
+
+Kept free of project imports so both the pipeline and the modules it
+drives (citation extraction, exports) can use them without import cycles.
+"""
+
+from typing import Any, Iterable, Iterator, List
+
+
+def iter_batches(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Group an iterable into lists of at most batch_size items"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,399 @@
+"""
+Bulk Import Export for EU_GraphRAG
+
+Streams validated documents, articles, concepts and relationships into
+header-plus-data CSV files for the offline `neo4j-admin database import`
+tool, so an initial load (or a full rebuild) is a single import instead
+of millions of transactional MERGEs.
+
+Layout (under data/processed/bulk_import):
+  nodes_<Label>_header.csv                       column header with types and ID space
+  nodes_<Label>_part0001.csv ...                 data, rotated every rows_per_file rows
+  relationships_<TYPE>_<From>_<To>_header.csv / _partNNNN.csv
+  neo4j-admin-import.sh                          import command for all files
+  import.report                                  rows neo4j-admin skipped (written by the import)
+
+Node IDs and relationship endpoints are tracked in a scratch SQLite
+file next to the CSVs, so counting repeated IDs and dangling endpoints
+needs neither an in-memory set of every ID nor a second read of the
+relationship files. The file is removed when the export closes.
+
+Labels come from src.graph.labels, the same mapping Neo4jClient uses.
+"""
+
+import os
+import csv
+import json
+import logging
+import sqlite3
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.graph.labels import id_space, node_labels, split_concept
+from src.ingestion.pipeline import LegalDocument, is_article_record
+
+logger = logging.getLogger(__name__)
+
+# Article properties, in the shape emitted by the source adapters
+ARTICLE_COLUMNS = ('law_uri', 'article_number', 'designation', 'title', 'text_content', 'document_hash')
+
+ARTICLE_HEADER = ["eli_uri:ID(Article)"] + list(ARTICLE_COLUMNS)
+
+# Labels of concept nodes (as set by Neo4jClient.ingest_concepts_bulk)
+CONCEPT_LABELS = ('LegalConcept', 'EuroVocConcept')
+
+# Scratch database of exported node IDs and relationship endpoints
+ID_DATABASE = ".export_ids.sqlite"
+
+# Node IDs / relationship endpoints buffered before an INSERT
+ID_BUFFER_ROWS = 10000
+
+def _document_columns() -> List[Tuple[str, str]]:
+    """(property, neo4j-admin type) for every LegalDocument field"""
+    columns = []
+    for f in fields(LegalDocument):
+        if f.type is int:
+            kind = 'int'
+        elif f.type is float:
+            kind = 'float'
+        elif f.name == 'data_quality_issues':
+            kind = 'string[]'
+        elif f.name == 'transposition_deadline':
+            # Compared as a DATE by the transposition overview
+            kind = 'date'
+        else:
+            kind = 'string'
+        columns.append((f.name, kind))
+    return columns
+
+
+def _value_type(value: Any) -> str:
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'long'
+    if isinstance(value, float):
+        return 'double'
+    if isinstance(value, (list, tuple)) and all(isinstance(v, str) for v in value):
+        return 'string[]'
+    return 'string'
+
+
+class _PartitionedCsv:
+    """Header file plus data files rotated every rows_per_file rows"""
+
+    def __init__(self, directory: Path, name: str, header: List[str], rows_per_file: int):
+        self.directory = directory
+        self.name = name
+        self.rows_per_file = rows_per_file
+        self.rows = 0
+        self.files: List[str] = []
+        self._file = None
+        self._writer = None
+
+        header_file = f"{name}_header.csv"
+        with open(directory / header_file, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerow(header)
+        self.header_file = header_file
+
+    def write(self, row: List[str]):
+        if self._writer is None or self.rows % self.rows_per_file == 0:
+            self._rotate()
+        self._writer.writerow(row)
+        self.rows += 1
+
+    def _rotate(self):
+        if self._file:
+            self._file.close()
+        part_file = f"{self.name}_part{len(self.files) + 1:04d}.csv"
+        self._file = open(self.directory / part_file, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self.files.append(part_file)
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    @property
+    def all_files(self) -> str:
+        return ",".join([self.header_file] + self.files)
+
+
+class BulkImportExporter:
+    """Streaming writer of neo4j-admin import CSV files"""
+
+    def __init__(self, output_dir: str = "data/processed/bulk_import",
+                 rows_per_file: int = 1_000_000, array_delimiter: str = ";"):
+        """
+        Initialize exporter
+
+        Existing nodes_*/relationships_* CSV files in output_dir are removed
+        so stale partitions of a previous export cannot leak into the import.
+
+        Args:
+            output_dir: Target directory
+            rows_per_file: Rows per data file before rotating to the next part
+            array_delimiter: Separator of array values (passed to neo4j-admin)
+        """
+        self.output_dir = Path(output_dir)
+        self.rows_per_file = rows_per_file
+        self.array_delimiter = array_delimiter
+        self._documents_columns = _document_columns()
+        self._nodes: Dict[Tuple[str, ...], _PartitionedCsv] = {}
+        self._relationships: Dict[Tuple[str, str, str], Tuple[_PartitionedCsv, List[str]]] = {}
+        self._concept_columns: Optional[List[str]] = None
+        self.dropped_properties = 0
+        self.duplicate_nodes = 0
+        self._summary: Optional[Dict] = None
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        for pattern in ("nodes_*.csv", "relationships_*.csv", ID_DATABASE):
+            for stale in self.output_dir.glob(pattern):
+                stale.unlink()
+
+        self._id_path = self.output_dir / ID_DATABASE
+        self._ids = sqlite3.connect(self._id_path)
+        # Scratch data: no journal, no fsync
+        self._ids.execute("PRAGMA journal_mode = OFF")
+        self._ids.execute("PRAGMA synchronous = OFF")
+        self._ids.execute("CREATE TABLE nodes (space TEXT, id TEXT, PRIMARY KEY (space, id)) WITHOUT ROWID")
+        self._ids.execute("CREATE TABLE endpoints (file TEXT, start_space TEXT, start_id TEXT, "
+                          "end_space TEXT, end_id TEXT)")
+        self._pending_nodes: List[Tuple[str, str]] = []
+        self._pending_endpoints: List[Tuple[str, str, str, str, str]] = []
+
+    def _format(self, value: Any) -> str:
+        if value is None:
+            return ''
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        if isinstance(value, (list, tuple)):
+            if all(isinstance(v, str) for v in value):
+                return self.array_delimiter.join(value)
+            return json.dumps(value, ensure_ascii=False)
+        if isinstance(value, dict):
+            return json.dumps(value, ensure_ascii=False)
+        return str(value)
+
+    def _node_file(self, labels: Tuple[str, ...], header: List[str],
+                   name: Optional[str] = None) -> _PartitionedCsv:
+        writer = self._nodes.get(labels)
+        if writer is None:
+            writer = _PartitionedCsv(self.output_dir, f"nodes_{name or labels[-1]}", header, self.rows_per_file)
+            self._nodes[labels] = writer
+        return writer
+
+    def _track_node(self, space: str, node_id: str):
+        self._pending_nodes.append((space, node_id))
+        if len(self._pending_nodes) >= ID_BUFFER_ROWS:
+            self._flush_ids()
+
+    def _flush_ids(self):
+        if self._pending_nodes:
+            # neo4j-admin drops a repeated ID (--skip-duplicate-nodes); count it
+            before = self._ids.total_changes
+            self._ids.executemany("INSERT OR IGNORE INTO nodes VALUES (?, ?)", self._pending_nodes)
+            self.duplicate_nodes += len(self._pending_nodes) - (self._ids.total_changes - before)
+            self._pending_nodes.clear()
+        if self._pending_endpoints:
+            self._ids.executemany("INSERT INTO endpoints VALUES (?, ?, ?, ?, ?)", self._pending_endpoints)
+            self._pending_endpoints.clear()
+
+    # ------------------------------------------------------------------
+    # Nodes
+    # ------------------------------------------------------------------
+
+    def add_document(self, document: LegalDocument):
+        """Write a document to the node file of its label"""
+        labels = node_labels(document.source_type.value)
+        space = id_space(labels[-1])
+        writer = self._nodes.get(labels)
+        if writer is None:
+            header = [
+                f"{name}:ID({space})" if name == 'eli_uri' else f"{name}:{kind}"
+                for name, kind in self._documents_columns
+            ]
+            writer = self._node_file(labels, header)
+        params = document.to_neo4j_params()
+        if params.get('transposition_deadline'):
+            params['transposition_deadline'] = params['transposition_deadline'][:10]
+        self._track_node(space, params['eli_uri'])
+        writer.write([self._format(params.get(name)) for name, _ in self._documents_columns])
+
+    def add_article(self, article: Dict):
+        """Write an article node and its BELONGS_TO edge to the law"""
+        self._track_node('Article', article['eli_uri'])
+        self._node_file(('Article',), ARTICLE_HEADER).write(
+            [self._format(article.get('eli_uri'))] + [self._format(article.get(c)) for c in ARTICLE_COLUMNS])
+        self.add_relationship((article['eli_uri'], article['law_uri'], 'BELONGS_TO', None,
+                               'Article', 'ELIWork'))
+
+    def add_concept(self, concept: Dict):
+        """Write a EuroVoc concept (keyed by eurovoc_id) and its thesaurus edges"""
+        concept, edges = split_concept(concept)
+        if self._concept_columns is None:
+            self._concept_columns = [k for k in concept if k != 'eurovoc_id']
+            header = ["eurovoc_id:ID(LegalConcept)"] + [
+                f"{name}:{_value_type(concept[name])}" for name in self._concept_columns]
+            self._node_file(CONCEPT_LABELS, header, 'LegalConcept')
+        elif not concept.keys() <= {'eurovoc_id', *self._concept_columns}:
+            self.dropped_properties += 1
+        self._track_node('LegalConcept', str(concept['eurovoc_id']))
+        self._nodes[CONCEPT_LABELS].write(
+            [self._format(concept['eurovoc_id'])] + [self._format(concept.get(k)) for k in self._concept_columns])
+        for edge in edges:
+            self.add_relationship(edge)
+
+    def add(self, item: Any):
+        """Write a LegalDocument or an article record"""
+        if isinstance(item, LegalDocument):
+            self.add_document(item)
+        elif is_article_record(item):
+            self.add_article(item)
+        else:
+            raise TypeError(f"Cannot export {type(item).__name__}")
+
+    # ------------------------------------------------------------------
+    # Relationships
+    # ------------------------------------------------------------------
+
+    def add_relationship(self, relationship: Tuple):
+        """
+        Write a relationship
+
+        Args:
+            relationship: (from_key, to_key, rel_type, props), or with
+                          (from_label, to_label) appended as accepted by
+                          Neo4jClient.create_relationships_batch
+        """
+        from_key, to_key, rel_type, props = relationship[:4]
+        labels = relationship[4:6] if len(relationship) >= 6 else ('ELIWork', 'ELIWork')
+        key = (rel_type, id_space(labels[0]), id_space(labels[1]))
+        props = props or {}
+
+        entry = self._relationships.get(key)
+        if entry is None:
+            columns = sorted(props)
+            header = [f":START_ID({key[1]})", f":END_ID({key[2]})"] + [
+                f"{name}:{_value_type(props[name])}" for name in columns]
+            writer = _PartitionedCsv(self.output_dir, f"relationships_{rel_type}_{key[1]}_{key[2]}",
+                                     header, self.rows_per_file)
+            entry = self._relationships[key] = (writer, columns)
+        writer, columns = entry
+        if not props.keys() <= set(columns):
+            self.dropped_properties += 1
+        writer.write([from_key, to_key] + [self._format(props.get(name)) for name in columns])
+        self._pending_endpoints.append((writer.name, key[1], str(from_key), key[2], str(to_key)))
+        if len(self._pending_endpoints) >= ID_BUFFER_ROWS:
+            self._flush_ids()
+
+    # ------------------------------------------------------------------
+    # Finish
+    # ------------------------------------------------------------------
+
+    def import_command(self, database: str = "neo4j", bad_tolerance: int = 0) -> str:
+        """
+        neo4j-admin command importing every file written so far
+
+        Skipped duplicate nodes and dangling relationships are listed in
+        import.report; the import aborts once more than bad_tolerance rows
+        were skipped.
+        """
+        lines = [
+            "neo4j-admin database import full",
+            "--overwrite-destination",
+            "--skip-duplicate-nodes=true",
+            "--skip-bad-relationships=true",
+            "--report-file=import.report",
+            f"--bad-tolerance={int(bad_tolerance)}",
+            f'--array-delimiter="{self.array_delimiter}"',
+        ]
+        for labels, writer in self._nodes.items():
+            lines.append(f"--nodes={':'.join(labels)}={writer.all_files}")
+        for (rel_type, _, _), (writer, _) in self._relationships.items():
+            lines.append(f"--relationships={rel_type}={writer.all_files}")
+        lines.append(database)
+        return " \\\n  ".join(lines)
+
+    def _close_files(self):
+        for writer in self._nodes.values():
+            writer.close()
+        for writer, _ in self._relationships.values():
+            writer.close()
+        if self._ids is not None:
+            self._ids.close()
+            self._ids = None
+            self._id_path.unlink(missing_ok=True)
+
+    def _dangling_relationships(self) -> Dict[str, int]:
+        """Relationship rows per file whose start or end ID was never exported"""
+        self._flush_ids()
+        counts = dict(self._ids.execute("""
+            SELECT e.file, count(*) FROM endpoints e
+            WHERE NOT EXISTS (SELECT 1 FROM nodes n WHERE n.space = e.start_space AND n.id = e.start_id)
+               OR NOT EXISTS (SELECT 1 FROM nodes n WHERE n.space = e.end_space AND n.id = e.end_id)
+            GROUP BY e.file
+        """))
+        return {
+            f"{rel_type}({start}->{end})": counts[writer.name]
+            for (rel_type, start, end), (writer, _) in self._relationships.items()
+            if counts.get(writer.name)
+        }
+
+    def close(self, database: str = "neo4j") -> Dict:
+        """
+        Close all files and write neo4j-admin-import.sh (idempotent)
+
+        The rows neo4j-admin will skip (repeated node IDs, relationships to
+        nodes that were not exported) are counted here and become the
+        script's --bad-tolerance, so an import that would skip anything
+        else aborts.
+
+        Returns:
+            Row counts per node label and relationship type, skipped rows
+            and the command
+        """
+        if self._summary is not None:
+            return self._summary
+        dangling = self._dangling_relationships()
+        self._close_files()
+
+        skipped = self.duplicate_nodes + sum(dangling.values())
+        command = self.import_command(database, bad_tolerance=skipped)
+        script = self.output_dir / "neo4j-admin-import.sh"
+        with open(script, 'w', encoding='utf-8') as f:
+            f.write('#!/bin/sh\n# Generated by src.ingestion.bulk_export; stop the database first\n')
+            f.write('cd "$(dirname "$0")"\n')
+            f.write(command + "\n")
+        os.chmod(script, 0o755)
+
+        if self.dropped_properties:
+            logger.warning(f"⚠ {self.dropped_properties} rows had properties missing from their file header")
+        if self.duplicate_nodes:
+            logger.warning(f"⚠ {self.duplicate_nodes} nodes repeat an exported ID and will be skipped")
+        for name, count in dangling.items():
+            logger.warning(f"⚠ {count} {name} relationships point to nodes that were not exported "
+                           f"and will be skipped")
+
+        self._summary = summary = {
+            'nodes': {':'.join(labels): w.rows for labels, w in self._nodes.items()},
+            'relationships': {f"{t}({a}->{b})": w.rows for (t, a, b), (w, _) in self._relationships.items()},
+            'skipped': {'duplicate_nodes': self.duplicate_nodes, 'relationships': dangling},
+            'command': command,
+        }
+        logger.info(f"✓ Bulk import files written to {self.output_dir}: "
+                    f"{sum(summary['nodes'].values())} nodes, "
+                    f"{sum(summary['relationships'].values())} relationships, "
+                    f"{skipped} rows to be skipped")
+        return summary
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._close_files()
@@ -0,0 +1,294 @@
+"""
+Pipeline Checkpoints and Dead Letters for EU_GraphRAG
+
+Durable progress of a DataIngestionPipeline run, so a crashed run can
+resume instead of starting over, and a record of every item that failed
+to parse, validate or write.
+
+Layout:
+  data/processed/checkpoints/checkpoint.json     completed stages, per-adapter
+                                                 position of the last committed record
+  data/processed/checkpoints/written_uris.txt    append-only eli_uris written to Neo4j
+  data/processed/checkpoints/dead_letters.jsonl  failed records with stage and error
+
+Raw records that are bytes (e.g. gesetze-im-internet.de XML) are stored
+base64-encoded as {"__bytes__": "..."} and decoded again on read, so
+parse failures can be replayed.
+
+written_uris.txt is appended and fsynced after every committed batch
+before checkpoint.json is replaced, so a crash never records a position
+whose URIs are not on disk.
+
+Usage:
+    python -m src.ingestion.checkpoint status
+    python -m src.ingestion.checkpoint dead-letters --stage validate
+"""
+
+import os
+import json
+import base64
+import logging
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = "data/processed/checkpoints"
+
+
+class CheckpointStore:
+    """Per-stage checkpoints, written eli_uris and dead letters under data/processed"""
+
+    def __init__(self, directory: str = DEFAULT_CHECKPOINT_DIR):
+        """
+        Args:
+            directory: Checkpoint directory (created on first write)
+        """
+        self.directory = Path(directory)
+        self.state_path = self.directory / "checkpoint.json"
+        self.written_path = self.directory / "written_uris.txt"
+        self.dead_letter_path = self.directory / "dead_letters.jsonl"
+        self.replay_path = self.directory / "dead_letters.replay.jsonl"
+
+        self.state: Dict[str, Any] = {'stages': {}, 'adapters': {}}
+        self.written: Set[str] = set()
+        self._dead_letter_keys: Set[Tuple] = set()
+        self._written_file = None
+
+    def __getstate__(self):
+        # Open file handles cannot cross process boundaries
+        state = self.__dict__.copy()
+        state['_written_file'] = None
+        return state
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    def load(self) -> "CheckpointStore":
+        """Load stage state and the written URI set (empty if there is no checkpoint)"""
+        if self.state_path.exists():
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+        if self.written_path.exists():
+            with open(self.written_path, 'r', encoding='utf-8') as f:
+                self.written = {line.rstrip('\n') for line in f if line.strip()}
+        self._dead_letter_keys = {self._dead_letter_key(entry) for entry in self.iter_dead_letters()}
+        logger.info(f"Loaded checkpoint from {self.directory}: "
+                    f"{len(self.written)} written URIs, "
+                    f"stages done: {', '.join(self.completed_stages()) or 'none'}")
+        return self
+
+    def reset(self):
+        """Start a fresh run: drop stage state, written URIs and dead letters, replay included"""
+        self.close()
+        for path in (self.state_path, self.written_path, self.dead_letter_path, self.replay_path):
+            if path.exists():
+                path.unlink()
+        self.state = {'stages': {}, 'adapters': {}}
+        self.written = set()
+        self._dead_letter_keys = set()
+
+    def _save_state(self):
+        """Atomically write checkpoint.json"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.state['updated_at'] = datetime.now().isoformat()
+        tmp_path = self.state_path.with_suffix(self.state_path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+    def close(self):
+        if self._written_file is not None:
+            self._written_file.close()
+            self._written_file = None
+
+    # ------------------------------------------------------------------
+    # Stages and batches
+    # ------------------------------------------------------------------
+
+    def stage_done(self, stage: str) -> bool:
+        return stage in self.state['stages']
+
+    def completed_stages(self) -> List[str]:
+        return list(self.state['stages'])
+
+    def mark_stage(self, stage: str, items: int = 0):
+        """Record a stage as complete"""
+        self.state['stages'][stage] = {'items': items, 'finished_at': datetime.now().isoformat()}
+        self._save_state()
+
+    def position(self, source_name: str) -> int:
+        """Sequence number of the adapter's last committed raw record (-1 if none)"""
+        return self.state['adapters'].get(source_name, {}).get('position', -1)
+
+    def is_written(self, eli_uri: str) -> bool:
+        return eli_uri in self.written
+
+    def commit(self, eli_uris: Iterable[str], positions: Optional[Dict[str, int]] = None):
+        """
+        Record a batch as written
+
+        Args:
+            eli_uris: URIs of the documents and articles the batch wrote
+            positions: Adapter → sequence number of its last raw record
+                       whose items are all written (streaming mode)
+        """
+        new_uris = [uri for uri in eli_uris if uri not in self.written]
+        if new_uris:
+            if self._written_file is None:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                self._written_file = open(self.written_path, 'a', encoding='utf-8')
+            self._written_file.write(''.join(f"{uri}\n" for uri in new_uris))
+            self._written_file.flush()
+            os.fsync(self._written_file.fileno())
+            self.written.update(new_uris)
+
+        adapters = self.state['adapters']
+        for source_name, position in (positions or {}).items():
+            entry = adapters.setdefault(source_name, {'position': -1, 'batches': 0})
+            if position > entry['position']:
+                entry['position'] = position
+                entry['batches'] += 1
+        self._save_state()
+
+    # ------------------------------------------------------------------
+    # Dead letters
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _dead_letter_key(entry: Dict) -> Tuple:
+        return entry['stage'], entry.get('source'), entry.get('sequence'), entry.get('eli_uri')
+
+    def add_dead_letter(self, stage: str, error: str, record: Any = None,
+                        source: Optional[str] = None, eli_uri: Optional[str] = None,
+                        sequence: Optional[int] = None, attempts: int = 1) -> bool:
+        """
+        Append a failed record to dead_letters.jsonl
+
+        A resumed run parses and validates again; failures already on
+        file are not recorded twice.
+
+        Args:
+            stage: parse, validate or write
+            error: Error message or validation issues
+            record: The failed item (document dict, article record or raw
+                    record, bytes included); dropped if it is not
+                    JSON-serializable
+            source: Adapter source_name
+            eli_uri: URI of the failed document or article
+            sequence: Position of the raw record in its adapter's output
+            attempts: How often the record has failed so far
+
+        Returns:
+            False if the failure was already recorded
+        """
+        entry = {
+            'stage': stage,
+            'source': source,
+            'sequence': sequence,
+            'eli_uri': eli_uri,
+            'error': error,
+            'attempts': attempts,
+            'failed_at': datetime.now().isoformat(),
+        }
+        key = self._dead_letter_key(entry)
+        if key in self._dead_letter_keys:
+            return False
+        self._dead_letter_keys.add(key)
+        if record is not None:
+            try:
+                json.dumps(record, default=_json_default)
+                entry['record'] = record
+            except (TypeError, ValueError):
+                entry['record'] = None
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.dead_letter_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False, default=_json_default) + '\n')
+        return True
+
+    @staticmethod
+    def _read_jsonl(path: Path) -> Iterator[Dict]:
+        if not path.exists():
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line, object_hook=_decode_bytes)
+
+    def iter_dead_letters(self, stage: Optional[str] = None) -> Iterator[Dict]:
+        """Dead letters in the order they were recorded"""
+        for entry in self._read_jsonl(self.dead_letter_path):
+            if stage is None or entry['stage'] == stage:
+                yield entry
+
+    def take_dead_letters(self) -> List[Dict]:
+        """
+        Move the dead letters aside for a replay
+
+        Records that fail again during the replay are appended to a fresh
+        dead_letters.jsonl. If an earlier replay crashed, its leftover
+        entries are returned instead and the current file waits for the
+        next replay.
+        """
+        if not self.replay_path.exists():
+            if not self.dead_letter_path.exists():
+                return []
+            os.replace(self.dead_letter_path, self.replay_path)
+            self._dead_letter_keys = set()
+        return list(self._read_jsonl(self.replay_path))
+
+    def finish_replay(self):
+        """Drop the replayed dead letters"""
+        if self.replay_path.exists():
+            self.replay_path.unlink()
+
+    def summary(self) -> Dict[str, Any]:
+        """Stages, adapter positions and dead letter counts per stage"""
+        dead_letters: Dict[str, int] = {}
+        for entry in self.iter_dead_letters():
+            dead_letters[entry['stage']] = dead_letters.get(entry['stage'], 0) + 1
+        return {
+            'stages': self.state['stages'],
+            'adapters': self.state['adapters'],
+            'written': len(self.written),
+            'dead_letters': dead_letters,
+            'updated_at': self.state.get('updated_at'),
+        }
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray)):
+        return {'__bytes__': base64.b64encode(value).decode('ascii')}
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _decode_bytes(obj: Dict) -> Any:
+    if len(obj) == 1 and '__bytes__' in obj:
+        return base64.b64decode(obj['__bytes__'])
+    return obj
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect EU_GraphRAG pipeline checkpoints")
+    parser.add_argument("command", choices=("status", "dead-letters", "reset"))
+    parser.add_argument("--dir", default=DEFAULT_CHECKPOINT_DIR, help="Checkpoint directory")
+    parser.add_argument("--stage", help="Only list dead letters of this stage")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    store = CheckpointStore(args.dir)
+    if args.command == "status":
+        print(json.dumps(store.load().summary(), indent=2))
+    elif args.command == "dead-letters":
+        for entry in store.iter_dead_letters(args.stage):
+            print(f"{entry['stage']:<9} {entry.get('source') or '-':<20} "
+                  f"{entry.get('eli_uri') or '-'}  {entry['error']}")
+    else:
+        store.reset()
+        logger.info(f"✓ Checkpoint in {store.directory} reset")
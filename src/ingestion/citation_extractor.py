@@ -0,0 +1,366 @@
+"""
+Legal Citation Extractor for EU_GraphRAG
+
+Finds cross-references in article text with one precompiled combined
+pattern and resolves them against an in-memory IdentifierIndex:
+
+  § / Art. references   "§ 5 Abs. 2 BGB", "§§ 3 und 4 SGB VI", "Art. 3 GG", "§ 7" (same law)
+  CELEX numbers         "32016L0680"
+  EU act citations      "Richtlinie (EU) 2016/680", "Verordnung (EG) Nr. 883/2004",
+                        "Richtlinie 95/46/EG", "Directive (EU) 2019/1152"
+  ECLI identifiers      "ECLI:EU:C:2014:317"
+
+Resolved citations become CITES edges from the citing article (to an
+Article, law or CourtDecision); a directive cited in a transposition
+context ("zur Umsetzung der Richtlinie ...") additionally yields
+IMPLEMENTS from the citing law. Edges use the tuple shape accepted by
+Neo4jClient.create_relationships_batch. Extraction runs in worker
+processes, each receiving the index once.
+"""
+
+import os
+import re
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.graph.labels import ELI_WORK_LABELS, node_label
+from src.ingestion.batching import iter_batches
+
+logger = logging.getLogger(__name__)
+
+# Law abbreviations: one word with at least two capitals ("BGB", "EStG",
+# "SGB VI"), so capitalized sentence words are not taken for a law
+_LAW_ABBREVIATION = (
+    r"(?=[A-Za-zÄÖÜäöüß]*[A-ZÄÖÜ][a-zäöüß]*[A-ZÄÖÜ])[A-ZÄÖÜ][A-Za-zÄÖÜäöüß]{1,12}"
+    r"(?:\s+[IVX]{1,4}\b)?"
+)
+
+CITATION_PATTERN = re.compile(
+    r"(?P<ecli>\bECLI:[A-Z]{2}:[A-Z0-9.]{1,7}:\d{4}:[A-Z0-9.]{1,25}[A-Z0-9])"
+    r"|(?P<celex>\b[1-9CE]\d{4}[A-Z]{1,2}\d{4,}\b)"
+    r"|(?P<act_kind>\b(?:Richtlinie|Verordnung|Beschluss|Directive|Regulation|Decision))"
+    r"\s+(?:\((?P<act_org>EU|EG|EWG|EC|EEC|Euratom)\)\s+)?(?P<act_nr>(?:Nr\.|No\.?)\s*)?"
+    r"(?P<act_a>\d{1,4})/(?P<act_b>\d{1,4})(?:/(?:EU|EG|EWG|EC|EEC|Euratom)\b)?"
+    r"|(?P<para_sign>§§?|\bArt\.|\bArtikel)\s*"
+    r"(?P<para_nums>\d+[a-z]?\b(?:\s*(?:,|und|oder|bis)\s*\d+[a-z]?\b)*)"
+    r"(?:\s*(?:Abs\.|Absatz|S\.|Satz|Nr\.|Nummer|Buchst\.|Buchstabe|Halbsatz|Alt\.)\s*\d*[a-z]?\b)*"
+    rf"(?:\s+(?P<para_law>{_LAW_ABBREVIATION}))?"
+)
+
+# Text before an EU act citation that marks the citing law as transposing it
+IMPLEMENTATION_CONTEXT = re.compile(
+    r"(?:Umsetzung|umgesetzt|umzusetzen|transpos\w*|implementing)\W+(?:\w+\W+){0,6}$",
+    re.IGNORECASE,
+)
+IMPLEMENTATION_WINDOW = 120
+
+_ACT_TYPES = {
+    'richtlinie': 'L', 'directive': 'L',
+    'verordnung': 'R', 'regulation': 'R',
+    'beschluss': 'D', 'decision': 'D',
+}
+
+# Largest § range ("§§ 3 bis 8") expanded into single references
+MAX_RANGE_EXPANSION = 20
+
+
+def law_slug(abbreviation: str) -> str:
+    """Abbreviation → ELI slug as built by GesetzImInternetAdapter ("SGB VI" → "sgbvi")"""
+    return re.sub(r'\W+', '', abbreviation.lower())
+
+
+def _full_year(year: int) -> int:
+    if year >= 100:
+        return year
+    return 1900 + year if year >= 50 else 2000 + year
+
+
+def act_celex(kind: str, first: str, second: str, numbered: bool) -> Optional[str]:
+    """
+    CELEX number of a cited EU act
+
+    Since 2015 acts are cited year first ("(EU) 2016/680"); older
+    regulations cite the number first ("Nr. 883/2004"), older directives
+    the year first ("95/46/EG").
+    """
+    act_type = _ACT_TYPES.get(kind.lower())
+    if act_type is None:
+        return None
+    a, b = int(first), int(second)
+    if numbered or (len(second) == 4 and len(first) != 4):
+        number, year = a, b
+    else:
+        year, number = a, b
+    return f"3{_full_year(year)}{act_type}{number:04d}"
+
+
+def _expand_numbers(text: str) -> List[str]:
+    """"3, 4 und 6" → [3, 4, 6]; "3 bis 6" → [3, 4, 5, 6]"""
+    numbers: List[str] = []
+    tokens = re.findall(r"\d+[a-z]?|bis", text)
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token == 'bis' and numbers and i + 1 < len(tokens):
+            end = tokens[i + 1]
+            if numbers[-1].isdigit() and end.isdigit() and 0 < int(end) - int(numbers[-1]) <= MAX_RANGE_EXPANSION:
+                numbers.extend(str(n) for n in range(int(numbers[-1]) + 1, int(end) + 1))
+            else:
+                numbers.append(end)
+            i += 2
+            continue
+        if token != 'bis':
+            numbers.append(token)
+        i += 1
+    return numbers
+
+
+class IdentifierIndex:
+    """In-memory lookup of citable identifiers → node eli_uri and label"""
+
+    def __init__(self):
+        self.laws: Dict[str, Tuple[str, str]] = {}      # slug → (eli_uri, date part)
+        self.celex: Dict[str, str] = {}
+        self.ecli: Dict[str, str] = {}
+        self.labels: Dict[str, str] = {}
+        self.articles: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.labels) + len(self.articles)
+
+    def add_document(self, eli_uri: str, source_type: Optional[str] = None,
+                     celex_number: Optional[str] = None, ecli: Optional[str] = None):
+        """Register a document (German laws are also indexed by ELI slug, newest version wins)"""
+        label = node_label(source_type) if source_type else 'LegalDocument'
+        self.labels[eli_uri] = 'ELIWork' if label in ELI_WORK_LABELS else label
+        if celex_number:
+            self.celex[celex_number] = eli_uri
+        if ecli:
+            self.ecli[ecli] = eli_uri
+        parts = eli_uri.split(':')
+        if len(parts) >= 3 and parts[1] == 'bund':
+            date_part = ':'.join(parts[3:])
+            current = self.laws.get(parts[2])
+            if current is None or date_part > current[1]:
+                self.laws[parts[2]] = (eli_uri, date_part)
+
+    def add_article(self, eli_uri: str):
+        self.articles.add(eli_uri)
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[Any], articles: Iterable[Dict] = ()) -> "IdentifierIndex":
+        """Build from LegalDocuments and article records"""
+        index = cls()
+        for doc in documents:
+            index.add_document(doc.eli_uri, doc.source_type.value, doc.celex_number, doc.ecli)
+        for article in articles:
+            index.add_article(article['eli_uri'])
+        return index
+
+    @classmethod
+    def from_neo4j(cls, client) -> "IdentifierIndex":
+        """Build from the documents and articles stored in Neo4j"""
+        index = cls()
+        cypher = """
+        MATCH (n)
+        WHERE n.eli_uri IS NOT NULL AND NOT n:Article
+        RETURN n.eli_uri AS eli_uri, n.source_type AS source_type,
+               n.celex_number AS celex_number, n.ecli AS ecli
+        """
+        for row in client.stream_query(cypher):
+            index.add_document(row['eli_uri'], row['source_type'], row['celex_number'], row['ecli'])
+        for row in client.stream_query("MATCH (a:Article) RETURN a.eli_uri AS eli_uri"):
+            index.add_article(row['eli_uri'])
+        logger.info(f"✓ Identifier index: {len(index.labels)} documents, {len(index.articles)} articles")
+        return index
+
+
+@dataclass(slots=True)
+class Citation:
+    """One resolved reference found in a text"""
+    kind: str                  # paragraph, celex, eu_act, ecli
+    target_uri: str
+    target_label: str
+    start: int
+    implementing: bool = False
+
+
+class CitationExtractor:
+    """Extracts and resolves citations against an IdentifierIndex"""
+
+    def __init__(self, index: IdentifierIndex):
+        self.index = index
+        self.unresolved = 0
+
+    def extract(self, text: str, law_uri: Optional[str] = None) -> List[Citation]:
+        """
+        Resolved citations in text
+
+        Args:
+            text: Article text
+            law_uri: Law of the article (target of § references without
+                     a law abbreviation)
+        """
+        index = self.index
+        citations: List[Citation] = []
+        for match in CITATION_PATTERN.finditer(text):
+            group = match.lastgroup
+            if group == 'ecli':
+                uri = index.ecli.get(match.group('ecli'))
+                if uri:
+                    citations.append(Citation('ecli', uri, index.labels[uri], match.start()))
+                else:
+                    self.unresolved += 1
+            elif group == 'celex':
+                self._add_act(citations, 'celex', match.group('celex'), match.start(), text)
+            elif match.group('act_kind'):
+                celex = act_celex(match.group('act_kind'), match.group('act_a'),
+                                  match.group('act_b'), bool(match.group('act_nr')))
+                self._add_act(citations, 'eu_act', celex, match.start(), text)
+            else:
+                self._add_paragraphs(citations, match, law_uri)
+        return citations
+
+    def _add_act(self, citations: List[Citation], kind: str, celex: Optional[str],
+                 start: int, text: str):
+        uri = self.index.celex.get(celex) if celex else None
+        if uri is None:
+            self.unresolved += 1
+            return
+        implementing = (celex[5] == 'L' and IMPLEMENTATION_CONTEXT.search(
+            text, max(0, start - IMPLEMENTATION_WINDOW), start) is not None)
+        citations.append(Citation(kind, uri, self.index.labels[uri], start, implementing))
+
+    def _add_paragraphs(self, citations: List[Citation], match: re.Match, law_uri: Optional[str]):
+        abbreviation = match.group('para_law')
+        if abbreviation:
+            entry = self.index.laws.get(law_slug(abbreviation))
+            target_law = entry[0] if entry else None
+        else:
+            target_law = law_uri
+        if target_law is None:
+            self.unresolved += 1
+            return
+
+        resolved_article = False
+        for number in _expand_numbers(match.group('para_nums')):
+            article_uri = f"{target_law}:art:{number}"
+            if article_uri in self.index.articles:
+                citations.append(Citation('paragraph', article_uri, 'Article', match.start()))
+                resolved_article = True
+        if not resolved_article and abbreviation:
+            citations.append(Citation('paragraph', target_law, self.index.labels[target_law], match.start()))
+
+    def extract_edges(self, article_uri: str, law_uri: Optional[str], text: str) -> List[Tuple]:
+        """
+        CITES / IMPLEMENTS relationship tuples for one article
+
+        Repeated citations of one target are merged into one edge with
+        citation_count; self-references are dropped.
+        """
+        cites: Dict[str, List] = {}
+        implements: Set[str] = set()
+        for citation in self.extract(text, law_uri):
+            if citation.target_uri in (article_uri, law_uri):
+                continue
+            entry = cites.setdefault(citation.target_uri, [citation.kind, citation.target_label, 0])
+            entry[2] += 1
+            if citation.implementing and law_uri:
+                implements.add(citation.target_uri)
+
+        edges = [
+            (article_uri, target, 'CITES', {'reference_type': kind, 'citation_count': count},
+             'Article', label)
+            for target, (kind, label, count) in cites.items()
+        ]
+        edges.extend(
+            (law_uri, target, 'IMPLEMENTS', {'source_article': article_uri, 'detected_by': 'citation'},
+             'ELIWork', 'ELIWork')
+            for target in implements
+        )
+        return edges
+
+
+# Per-process extractor for parallel extraction
+_WORKER_EXTRACTOR: Optional[CitationExtractor] = None
+
+
+def _init_citation_worker(index: IdentifierIndex):
+    """Process pool initializer: ship the identifier index to the worker once"""
+    global _WORKER_EXTRACTOR
+    _WORKER_EXTRACTOR = CitationExtractor(index)
+
+
+def _extract_chunk(chunk: List[Tuple[str, Optional[str], str]]) -> Tuple[List[Tuple], int]:
+    """Extract edges for (article_uri, law_uri, text) rows in a worker process"""
+    extractor = _WORKER_EXTRACTOR
+    before = extractor.unresolved
+    edges = []
+    for article_uri, law_uri, text in chunk:
+        edges.extend(extractor.extract_edges(article_uri, law_uri, text))
+    return edges, extractor.unresolved - before
+
+
+def _article_rows(articles: Iterable[Dict]) -> Iterator[Tuple[str, Optional[str], str]]:
+    for article in articles:
+        text = article.get('text_content')
+        if text:
+            yield article['eli_uri'], article.get('law_uri'), text
+
+
+def iter_citation_edges(articles: Iterable[Dict], index: IdentifierIndex,
+                        processes: Optional[int] = None, chunk_size: int = 256,
+                        stats: Optional[Dict] = None) -> Iterator[List[Tuple]]:
+    """
+    Extract citation edges from articles, in parallel
+
+    Chunks of articles are processed in worker processes with at most
+    two chunks in flight per worker, so input is consumed lazily and
+    results come back in input order.
+
+    Args:
+        articles: Article records (eli_uri, law_uri, text_content)
+        index: Identifier index shipped once to every worker
+        processes: Worker processes (None = one per core, 1 = in-process)
+        chunk_size: Articles per worker task
+        stats: Optional dict receiving 'articles' and 'unresolved' counts
+
+    Yields:
+        Lists of relationship tuples, one per chunk
+    """
+    stats = stats if stats is not None else {}
+    stats.setdefault('articles', 0)
+    stats.setdefault('unresolved', 0)
+    chunks = iter_batches(_article_rows(articles), chunk_size)
+
+    if processes == 1:
+        _init_citation_worker(index)
+        for chunk in chunks:
+            edges, unresolved = _extract_chunk(chunk)
+            stats['articles'] += len(chunk)
+            stats['unresolved'] += unresolved
+            yield edges
+        return
+
+    workers = processes or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_citation_worker,
+                             initargs=(index,)) as pool:
+        window = 2 * workers
+        pending = deque()
+        for chunk in chunks:
+            pending.append((len(chunk), pool.submit(_extract_chunk, chunk)))
+            if len(pending) >= window:
+                yield _collect(pending.popleft(), stats)
+        while pending:
+            yield _collect(pending.popleft(), stats)
+
+
+def _collect(entry: Tuple[int, Any], stats: Dict) -> List[Tuple]:
+    size, future = entry
+    edges, unresolved = future.result()
+    stats['articles'] += size
+    stats['unresolved'] += unresolved
+    return edges
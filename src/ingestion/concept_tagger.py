@@ -0,0 +1,269 @@
+"""
+EuroVoc Concept Tagger for EU_GraphRAG
+
+Compiles every preferred and alternative label of the EuroVoc concepts
+into one Aho-Corasick automaton over word tokens and scans article text
+in a single linear pass, independent of the number of labels. Matches become
+CONCERNS edges (Article → LegalConcept) with relevance scores, in the
+tuple shape accepted by Neo4jClient.create_relationships_batch.
+
+Usage:
+    tagger = ConceptTagger.from_neo4j(client)
+    for batch in tagger.iter_concern_batches(articles, batch_size=1000):
+        client.create_relationships_batch(batch)
+"""
+
+import logging
+import re
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Weight of a match on a preferred vs. an alternative label
+PREF_LABEL_WEIGHT = 1.0
+ALT_LABEL_WEIGHT = 0.8
+
+CONCEPTS_QUERY = """
+MATCH (c:LegalConcept)
+WHERE coalesce(c.status, 'current') <> 'deprecated'
+RETURN c.eurovoc_id AS eurovoc_id, properties(c) AS properties
+"""
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Case-folded word tokens (labels and text share this form)"""
+    return _TOKEN_RE.findall(text.casefold())
+
+
+class AhoCorasick:
+    """
+    Multi-pattern matcher over any sequence (characters or tokens)
+
+    States are trie nodes held in parallel lists (transition dicts,
+    failure links, outputs); outputs are merged along failure links at
+    build time, so search is one pass over the text plus the matches.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[Sequence, object]] = ()):
+        """
+        Args:
+            patterns: (pattern, value) pairs; a pattern may carry several values
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple] = [()]
+        self.pattern_count = 0
+        for pattern, value in patterns:
+            self.add(pattern, value)
+        self._built = False
+
+    def add(self, pattern: Sequence, value: object):
+        """Add a pattern (before the first search)"""
+        if not pattern:
+            return
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + ((len(pattern), value),)
+        self.pattern_count += 1
+        self._built = False
+
+    def build(self):
+        """Compute failure links breadth-first and merge outputs"""
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque()
+        for nxt in goto[0].values():
+            fail[nxt] = 0
+            queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[nxt] = target if target != nxt else 0
+                if out[fail[nxt]]:
+                    out[nxt] = out[nxt] + out[fail[nxt]]
+        self._built = True
+
+    @property
+    def state_count(self) -> int:
+        return len(self._goto)
+
+    def iter_matches(self, text: Sequence) -> Iterator[Tuple[int, int, object]]:
+        """
+        Yield (start, end, value) for every pattern occurrence
+
+        Offsets index into text; overlapping and nested occurrences are
+        all reported.
+        """
+        if not self._built:
+            self.build()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = nxt or 0
+            if out[state]:
+                end = i + 1
+                for length, value in out[state]:
+                    yield end - length, end, value
+
+
+class ConceptTagger:
+    """Tags text with EuroVoc concepts by label matching"""
+
+    def __init__(self, concepts: Iterable[Dict], languages: Sequence[str] = ('de', 'en'),
+                 min_label_length: int = 3, pref_weight: float = PREF_LABEL_WEIGHT,
+                 alt_weight: float = ALT_LABEL_WEIGHT):
+        """
+        Compile the concepts' labels into one automaton
+
+        Args:
+            concepts: Concept dicts with eurovoc_id, pref_label_<lang> and
+                      alt_labels_<lang> (deprecated concepts are skipped)
+            languages: Label languages to match
+            min_label_length: Ignore shorter labels (abbreviations are too ambiguous)
+            pref_weight: Certainty of a preferred-label match
+            alt_weight: Certainty of an alternative-label match
+        """
+        self.automaton = AhoCorasick()
+        self.labels: Dict[str, str] = {}
+        weights: Dict[Tuple[str, ...], Dict[str, float]] = {}
+
+        for concept in concepts:
+            if concept.get('status') == 'deprecated':
+                continue
+            concept_id = concept['eurovoc_id']
+            for lang in languages:
+                candidates = [(concept.get(f'pref_label_{lang}'), pref_weight)]
+                candidates += [(label, alt_weight) for label in concept.get(f'alt_labels_{lang}') or ()]
+                for label, weight in candidates:
+                    if not label:
+                        continue
+                    key = tuple(tokenize(label))
+                    if not key or len(' '.join(key)) < min_label_length:
+                        continue
+                    # One automaton entry per distinct (label, concept), best weight wins
+                    by_concept = weights.setdefault(key, {})
+                    by_concept[concept_id] = max(weight, by_concept.get(concept_id, 0.0))
+            self.labels[concept_id] = concept.get('pref_label_de') or concept.get('pref_label_en') or concept_id
+
+        for key, by_concept in weights.items():
+            for concept_id, weight in by_concept.items():
+                self.automaton.add(key, (concept_id, weight))
+        self.automaton.build()
+        logger.info(f"✓ Concept tagger compiled {self.automaton.pattern_count} labels of "
+                    f"{len(self.labels)} concepts ({self.automaton.state_count} states)")
+
+    @classmethod
+    def from_neo4j(cls, client, **kwargs) -> "ConceptTagger":
+        """Build from the LegalConcept nodes in Neo4j"""
+        concepts = (dict(row['properties'], eurovoc_id=row['eurovoc_id'])
+                    for row in client.stream_query(CONCEPTS_QUERY))
+        return cls(concepts, **kwargs)
+
+    def _matches(self, tokens: List[str]) -> List[Tuple[int, int, str, float]]:
+        """
+        Label matches (token spans), longest-leftmost, without overlaps
+
+        A longer label (e.g. "soziale Sicherheit") shadows labels nested
+        in it ("Sicherheit"); several concepts sharing one label all match.
+        """
+        candidates = [(start, end, concept_id, weight)
+                      for start, end, (concept_id, weight) in self.automaton.iter_matches(tokens)]
+        candidates.sort(key=lambda m: (m[0], m[0] - m[1]))
+        selected = []
+        covered_until = -1
+        span = None
+        for start, end, concept_id, weight in candidates:
+            if (start, end) == span:
+                selected.append((start, end, concept_id, weight))
+            elif start >= covered_until:
+                selected.append((start, end, concept_id, weight))
+                covered_until = end
+                span = (start, end)
+        return selected
+
+    def tag(self, text: str, max_concepts: Optional[int] = 20) -> List[Dict]:
+        """
+        Concepts mentioned in text
+
+        relevance_score grows with the number of mentions (1 - 0.5^n,
+        scaled by certainty); certainty is the best label weight matched.
+
+        Returns:
+            Dicts with eurovoc_id, relevance_score, certainty and mentions,
+            best first
+        """
+        if not text:
+            return []
+        stats: Dict[str, List[float]] = {}
+        for _, _, concept_id, weight in self._matches(tokenize(text)):
+            entry = stats.setdefault(concept_id, [0, 0.0])
+            entry[0] += 1
+            entry[1] = max(entry[1], weight)
+
+        tags = [
+            {
+                'eurovoc_id': concept_id,
+                'relevance_score': round(certainty * (1.0 - 0.5 ** mentions), 3),
+                'certainty': certainty,
+                'mentions': mentions,
+            }
+            for concept_id, (mentions, certainty) in stats.items()
+        ]
+        tags.sort(key=lambda t: (-t['relevance_score'], t['eurovoc_id']))
+        return tags[:max_concepts] if max_concepts else tags
+
+    @staticmethod
+    def _article_text(article: Dict) -> str:
+        return f"{article.get('title') or ''}\n{article.get('text_content') or ''}"
+
+    def tag_article(self, article: Dict, min_relevance: float = 0.0,
+                    max_concepts: Optional[int] = 20) -> List[Tuple]:
+        """CONCERNS relationship tuples for one article record"""
+        return [
+            (article['eli_uri'], tag['eurovoc_id'], 'CONCERNS',
+             {'relevance_score': tag['relevance_score'], 'certainty': tag['certainty']},
+             'Article', 'LegalConcept')
+            for tag in self.tag(self._article_text(article), max_concepts=max_concepts)
+            if tag['relevance_score'] >= min_relevance
+        ]
+
+    def iter_concern_batches(self, articles: Iterable[Dict], batch_size: int = 1000,
+                             min_relevance: float = 0.0,
+                             max_concepts: Optional[int] = 20) -> Iterator[List[Tuple]]:
+        """
+        Tag articles and yield CONCERNS tuples in batches of batch_size
+
+        Args:
+            articles: Article records (eli_uri, title, text_content)
+            batch_size: Relationships per yielded batch
+            min_relevance: Drop weaker tags
+            max_concepts: Tags kept per article
+        """
+        batch: List[Tuple] = []
+        for article in articles:
+            batch.extend(self.tag_article(article, min_relevance, max_concepts))
+            while len(batch) >= batch_size:
+                yield batch[:batch_size]
+                batch = batch[batch_size:]
+        if batch:
+            yield batch
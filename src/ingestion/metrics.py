@@ -0,0 +1,314 @@
+"""
+Pipeline Metrics for EU_GraphRAG
+
+Collects per-stage and per-adapter timings, throughput, Neo4j write
+batch latency histograms and peak RSS for DataIngestionPipeline, with
+optional cProfile capture per stage.
+
+Reports:
+  metrics.json   structured report (see PipelineMetrics.report)
+  metrics.prom   Prometheus text exposition format (node_exporter textfile collector)
+"""
+
+import os
+import io
+import json
+import math
+import time
+import logging
+import cProfile
+import pstats
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "eu_graphrag"
+
+# Upper bounds (seconds) of the write batch latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process (None where unsupported)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense"""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        """Record one observation"""
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def cumulative(self) -> List[int]:
+        """Observations <= each bucket bound"""
+        total, result = 0, []
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bucket bound containing the q-quantile (max if beyond the last bucket)"""
+        if not self.count:
+            return None
+        rank = math.ceil(q * self.count)
+        for bound, cumulative in zip(self.buckets, self.cumulative()):
+            if cumulative >= rank:
+                return bound
+        return self.max
+
+    def to_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else None,
+            'max': round(self.max, 6),
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'buckets': {str(b): c for b, c in zip(self.buckets, self.cumulative())},
+        }
+
+
+def _label_value(value) -> str:
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+class PipelineMetrics:
+    """Timings, throughput, write latencies and memory of one pipeline run"""
+
+    def __init__(self, profile_stages: Iterable[str] = (),
+                 profile_dir: str = "data/processed/profiles",
+                 latency_buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initialize metrics
+
+        Args:
+            profile_stages: Stage names to run under cProfile ('*' = all stages)
+            profile_dir: Directory for <stage>.prof files
+            latency_buckets: Histogram bucket bounds for Neo4j write batches
+        """
+        self.profile_stages = set(profile_stages)
+        self.profile_dir = Path(profile_dir)
+        self.latency_buckets = tuple(latency_buckets)
+
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self.duration: Optional[float] = None
+        self.stages: Dict[str, Dict] = {}
+        self.adapters: Dict[str, Dict] = {}
+        self.write_latency: Dict[str, Histogram] = {}
+        self.write_rows: Dict[str, int] = {}
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._profiling: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # Collection
+    # ------------------------------------------------------------------
+
+    def _profiled(self, name: str) -> bool:
+        return '*' in self.profile_stages or name in self.profile_stages
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Time a stage (repeated entries accumulate, e.g. per streaming batch)
+
+        Yields the stage record; set record['items'] to the number of
+        documents the stage handled to get a docs/sec figure. A stage
+        nested in a stage that is already being profiled is timed but not
+        profiled on its own (only one cProfile can be active); its calls
+        show up in the outer stage's profile.
+        """
+        record = self.stages.setdefault(name, {'seconds': 0.0, 'calls': 0, 'items': 0})
+        profiler = None
+        if self._profiled(name) and self._profiling is None:
+            profiler = self._profiles.setdefault(name, cProfile.Profile())
+            profiler.enable()
+            self._profiling = name
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] += time.perf_counter() - started
+            record['calls'] += 1
+            if profiler is not None:
+                profiler.disable()
+                self._profiling = None
+            record['peak_rss_bytes'] = peak_rss_bytes()
+
+    def record_adapters(self, timings: Dict[str, Dict]):
+        """Record per-adapter fetch timings ({source: {'records', 'seconds', ...}})"""
+        for source_name, timing in timings.items():
+            self.adapters[source_name] = dict(timing)
+
+    def observe_batches(self, batch_stats: Iterable[Dict]):
+        """Record Neo4j write batches (Neo4jClient.last_batch_stats entries)"""
+        for batch in batch_stats:
+            label = batch.get('label', 'unknown')
+            histogram = self.write_latency.get(label)
+            if histogram is None:
+                histogram = self.write_latency[label] = Histogram(self.latency_buckets)
+            histogram.observe(batch['seconds'])
+            self.write_rows[label] = self.write_rows.get(label, 0) + batch.get('written', 0)
+
+    def finish(self):
+        """Freeze the run duration"""
+        self.duration = time.perf_counter() - self._start
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def profile_summary(self, name: str, limit: int = 20) -> Optional[str]:
+        """Top functions by cumulative time for a profiled stage"""
+        profiler = self._profiles.get(name)
+        if profiler is None:
+            return None
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(limit)
+        return out.getvalue()
+
+    def report(self, results: Optional[Dict] = None) -> Dict:
+        """
+        Structured metrics report
+
+        Args:
+            results: Pipeline counters (DataIngestionPipeline.results)
+        """
+        duration = self.duration if self.duration is not None else time.perf_counter() - self._start
+        results = results or {}
+        ingested = results.get('total_ingested', 0) + results.get('articles_ingested', 0)
+
+        stages = {}
+        for name, record in self.stages.items():
+            seconds = record['seconds']
+            stages[name] = {
+                **record,
+                'seconds': round(seconds, 6),
+                'docs_per_sec': round(record['items'] / seconds, 2) if seconds and record['items'] else None,
+            }
+
+        adapters = {}
+        for source_name, timing in self.adapters.items():
+            seconds = timing.get('seconds') or 0.0
+            records = timing.get('records', 0)
+            adapters[source_name] = {
+                **timing,
+                'records_per_sec': round(records / seconds, 2) if seconds else None,
+            }
+
+        return {
+            'started_at': self.started_at.isoformat(),
+            'duration_seconds': round(duration, 6),
+            'docs_per_sec': round(ingested / duration, 2) if duration else None,
+            'peak_rss_bytes': peak_rss_bytes(),
+            'stages': stages,
+            'adapters': adapters,
+            'neo4j_writes': {
+                label: {**histogram.to_dict(), 'rows': self.write_rows.get(label, 0)}
+                for label, histogram in self.write_latency.items()
+            },
+            'results': {k: v for k, v in results.items() if isinstance(v, (int, float))},
+            'profiles': sorted(self._profiles),
+        }
+
+    def to_prometheus(self, results: Optional[Dict] = None) -> str:
+        """Metrics in Prometheus text exposition format"""
+        report = self.report(results)
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples: List):
+            full_name = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            for suffix, labels, value in samples:
+                if value is None:
+                    continue
+                label_str = ",".join(f'{k}="{_label_value(v)}"' for k, v in labels.items())
+                lines.append(f"{full_name}{suffix}{{{label_str}}} {value}" if label_str
+                             else f"{full_name}{suffix} {value}")
+
+        metric('run_duration_seconds', 'gauge', "Wall time of the last pipeline run",
+               [('', {}, report['duration_seconds'])])
+        metric('docs_per_second', 'gauge', "Documents and articles ingested per second",
+               [('', {}, report['docs_per_sec'])])
+        metric('peak_rss_bytes', 'gauge', "Peak resident set size of the pipeline process",
+               [('', {}, report['peak_rss_bytes'])])
+        metric('stage_seconds', 'gauge', "Wall time per pipeline stage",
+               [('', {'stage': n}, s['seconds']) for n, s in report['stages'].items()])
+        metric('stage_items', 'gauge', "Documents handled per pipeline stage",
+               [('', {'stage': n}, s['items']) for n, s in report['stages'].items()])
+        metric('adapter_seconds', 'gauge', "Fetch wall time per source adapter",
+               [('', {'source': n}, a.get('seconds')) for n, a in report['adapters'].items()])
+        metric('adapter_records', 'gauge', "Records fetched per source adapter",
+               [('', {'source': n}, a.get('records')) for n, a in report['adapters'].items()])
+        metric('result', 'gauge', "Pipeline result counters",
+               [('', {'counter': k}, v) for k, v in report['results'].items()])
+
+        samples = []
+        for label, histogram in self.write_latency.items():
+            for bound, cumulative in zip(histogram.buckets, histogram.cumulative()):
+                samples.append(('_bucket', {'label': label, 'le': bound}, cumulative))
+            samples.append(('_bucket', {'label': label, 'le': '+Inf'}, histogram.count))
+            samples.append(('_sum', {'label': label}, round(histogram.sum, 6)))
+            samples.append(('_count', {'label': label}, histogram.count))
+        metric('neo4j_write_batch_seconds', 'histogram', "Latency of Neo4j UNWIND write batches", samples)
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _atomic_write(path: Path, text: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def write(self, directory: str = "data/processed/metrics",
+              results: Optional[Dict] = None) -> Dict[str, Path]:
+        """
+        Write metrics.json, metrics.prom and <stage>.prof profiles
+
+        Returns:
+            Paths written, by kind
+        """
+        directory = Path(directory)
+        paths = {'json': directory / "metrics.json", 'prometheus': directory / "metrics.prom"}
+        self._atomic_write(paths['json'], json.dumps(self.report(results), indent=2))
+        self._atomic_write(paths['prometheus'], self.to_prometheus(results))
+
+        for name, profiler in self._profiles.items():
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            paths[f'profile:{name}'] = self.profile_dir / f"{name}.prof"
+            profiler.dump_stats(str(paths[f'profile:{name}']))
+
+        logger.info(f"✓ Wrote pipeline metrics to {directory}")
+        return paths
@@ -10,14 +10,29 @@ Architecture:
 """
 
 import os
+import sys
 import json
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from enum import Enum
 import hashlib
+import io
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+from src.ingestion.batching import iter_batches
+from src.ingestion.checkpoint import DEFAULT_CHECKPOINT_DIR, CheckpointStore
+from src.ingestion.metrics import PipelineMetrics, peak_rss_bytes
+from src.ingestion.raw_cache import DEFAULT_SPARQL_MAX_AGE, RawFetchCache
 
 # Configure logging
 logging.basicConfig(
@@ -64,7 +79,44 @@ class MetadataField:
         return True, None
 
 
-@dataclass
+# Fields that change on every run and must not affect the content hash
+HASH_EXCLUDED_FIELDS = frozenset({
+    'created_at', 'last_updated', 'document_hash',
+    'completeness_score', 'validation_status', 'data_quality_issues',
+})
+
+
+# Fields counted by the completeness score, per source type
+COMPLETENESS_BASE_FIELDS = (
+    'eli_uri', 'title_de', 'date_document', 'first_date_entry_in_force', 'policy_area',
+)
+COMPLETENESS_TYPE_FIELDS = {
+    LawSourceType.GERMAN_LAW: ('bgbl_reference', 'responsible_authority'),
+    LawSourceType.EU_REGULATION: ('celex_number', 'ojeu_reference'),
+    LawSourceType.EU_DIRECTIVE: ('celex_number', 'ojeu_reference'),
+}
+
+# Minimum ELI shape: eli:jurisdiction:type:...
+ELI_URI_PATTERN = re.compile(r"eli(?::[^:]*){3}")
+
+
+# Low-cardinality string fields interned so large corpora share one copy
+_INTERNED_FIELDS = (
+    'policy_area', 'transposition_status', 'responsible_authority',
+    'sponsoring_ministry', 'source_reliability', 'version_status', 'ingestion_source',
+)
+
+_DATETIME_FIELDS = frozenset({
+    'date_document', 'first_date_entry_in_force', 'last_amended',
+    'transposition_deadline', 'created_at', 'last_updated',
+})
+
+# Classification containers left as None until a source fills them; most
+# documents carry none, so the empty dict/list is only built on output
+_LAZY_CONTAINERS = {'subject_matter': dict, 'eurovoc_descriptors': list}
+
+
+@dataclass(slots=True)
 class LegalDocument:
     """Unified legal document representation"""
     # Identification
@@ -87,10 +139,10 @@ class LegalDocument:
     transposition_deadline: Optional[datetime] = None
     transposition_status: Optional[str] = None
     
-    # Classification
+    # Classification (None means empty, see _LAZY_CONTAINERS)
     policy_area: str = ""
-    subject_matter: Dict[str, str] = None
-    eurovoc_descriptors: List[Dict] = None
+    subject_matter: Optional[Dict[str, str]] = None
+    eurovoc_descriptors: Optional[List[Dict]] = None
     
     # Authority
     responsible_authority: Optional[str] = None
@@ -114,61 +166,135 @@ class LegalDocument:
     document_hash: Optional[str] = None
     
     def __post_init__(self):
-        if self.subject_matter is None:
-            self.subject_matter = {}
-        if self.eurovoc_descriptors is None:
-            self.eurovoc_descriptors = []
         if self.data_quality_issues is None:
             self.data_quality_issues = []
-        if self.created_at is None:
-            self.created_at = datetime.now()
-        if self.last_updated is None:
-            self.last_updated = datetime.now()
+        if self.created_at is None or self.last_updated is None:
+            now = datetime.now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.last_updated is None:
+                self.last_updated = now
+        for name in _INTERNED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
     
     def calculate_completeness_score(self) -> float:
         """Calculate metadata completeness score (0.0-1.0)"""
-        mandatory_fields = {
-            'eli_uri': self.eli_uri,
-            'title_de': self.title_de,
-            'date_document': self.date_document,
-            'first_date_entry_in_force': self.first_date_entry_in_force,
-            'policy_area': self.policy_area,
-        }
-        
-        eu_specific_fields = {
-            'celex_number': self.celex_number,
-            'ojeu_reference': self.ojeu_reference,
-        } if self.source_type in [LawSourceType.EU_REGULATION, LawSourceType.EU_DIRECTIVE] else {}
-        
-        german_specific_fields = {
-            'bgbl_reference': self.bgbl_reference,
-            'responsible_authority': self.responsible_authority,
-        } if self.source_type == LawSourceType.GERMAN_LAW else {}
-        
-        all_fields = {**mandatory_fields, **eu_specific_fields, **german_specific_fields}
-        filled_fields = sum(1 for v in all_fields.values() if v is not None)
+        fields = COMPLETENESS_BASE_FIELDS + COMPLETENESS_TYPE_FIELDS.get(self.source_type, ())
+        filled_fields = sum(1 for name in fields if getattr(self, name) is not None)
         
-        self.completeness_score = filled_fields / len(all_fields) if all_fields else 0.0
+        self.completeness_score = filled_fields / len(fields)
         return self.completeness_score
     
     def generate_document_hash(self) -> str:
-        """Generate unique hash for document content"""
-        content = f"{self.eli_uri}{self.title_de}{self.date_document}"
-        self.document_hash = hashlib.sha256(content.encode()).hexdigest()
+        """
+        Generate hash over the full document content.
+        
+        Bookkeeping fields (timestamps, validation results and the hash
+        itself) are excluded so re-ingesting unchanged content yields the
+        same hash.
+        """
+        content = self._as_dict(exclude=HASH_EXCLUDED_FIELDS)
+        serialized = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+        self.document_hash = hashlib.sha256(serialized.encode()).hexdigest()
         return self.document_hash
     
+    def _as_dict(self, exclude: frozenset = frozenset()) -> Dict:
+        """
+        Flat field dict with enums as values and datetimes as ISO strings
+        
+        Nested dicts/lists are shared with the document, not copied; callers
+        that hand the result out must copy them. Unset classification
+        containers are emitted empty, so the output (and document_hash)
+        does not depend on whether they were ever built.
+        """
+        data = {}
+        for name in _LEGAL_DOCUMENT_FIELDS:
+            if name in exclude:
+                continue
+            value = getattr(self, name)
+            if value is not None:
+                if name in _DATETIME_FIELDS:
+                    value = value.isoformat()
+                elif isinstance(value, Enum):
+                    value = value.value
+            elif name in _LAZY_CONTAINERS:
+                value = _LAZY_CONTAINERS[name]()
+            data[name] = value
+        return data
+    
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
-        data = asdict(self)
-        data['source_type'] = self.source_type.value
-        data['validation_status'] = self.validation_status.value
-        data['date_document'] = self.date_document.isoformat() if self.date_document else None
-        data['first_date_entry_in_force'] = self.first_date_entry_in_force.isoformat() if self.first_date_entry_in_force else None
-        data['last_amended'] = self.last_amended.isoformat() if self.last_amended else None
-        data['transposition_deadline'] = self.transposition_deadline.isoformat() if self.transposition_deadline else None
-        data['created_at'] = self.created_at.isoformat() if self.created_at else None
-        data['last_updated'] = self.last_updated.isoformat() if self.last_updated else None
+        data = self._as_dict()
+        data['subject_matter'] = dict(self.subject_matter or {})
+        data['eurovoc_descriptors'] = [dict(d) if isinstance(d, dict) else d
+                                       for d in self.eurovoc_descriptors or ()]
+        data['data_quality_issues'] = list(self.data_quality_issues)
         return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LegalDocument":
+        """Inverse of to_dict (ISO strings back to datetimes, values back to enums)"""
+        kwargs = {name: data[name] for name in _LEGAL_DOCUMENT_FIELDS if name in data}
+        for name in _DATETIME_FIELDS:
+            if isinstance(kwargs.get(name), str):
+                kwargs[name] = datetime.fromisoformat(kwargs[name])
+        if 'source_type' in kwargs:
+            kwargs['source_type'] = LawSourceType(kwargs['source_type'])
+        if 'validation_status' in kwargs:
+            kwargs['validation_status'] = ValidationStatus(kwargs['validation_status'])
+        return cls(**kwargs)
+    
+    def to_neo4j_params(self) -> Dict:
+        """
+        Convert to Neo4j-storable properties
+        
+        Neo4j properties cannot hold maps, so nested dicts and lists of
+        dicts are stored as JSON strings.
+        """
+        params = self._as_dict()
+        for key, value in params.items():
+            if isinstance(value, dict) or (isinstance(value, list) and any(isinstance(v, dict) for v in value)):
+                params[key] = json.dumps(value, ensure_ascii=False)
+        return params
+    
+    def to_json_line(self) -> str:
+        """Serialize to one line of JSON (for .jsonl exports)"""
+        return json.dumps(self._as_dict(), ensure_ascii=False, default=str)
+
+
+_LEGAL_DOCUMENT_FIELDS = tuple(f.name for f in fields(LegalDocument))
+
+
+@dataclass
+class BatchValidationResult:
+    """Aggregated outcome of DocumentValidator.validate_batch"""
+    total: int = 0
+    passed: int = 0
+    failed: int = 0
+    issue_counts: Dict[str, int] = field(default_factory=dict)
+    failed_uris: List[str] = field(default_factory=list)
+    
+    def summary(self, limit: int = 5) -> str:
+        """One-line summary of the most frequent issues"""
+        top = sorted(self.issue_counts.items(), key=lambda kv: kv[1], reverse=True)[:limit]
+        return ", ".join(f"{issue}: {count}" for issue, count in top)
+
+
+class _CompiledRule:
+    """Validation rule for one source type, resolved once per validator"""
+    
+    __slots__ = ('mandatory', 'completeness_fields', 'min_completeness', 'columns')
+    
+    def __init__(self, mandatory: Tuple[str, ...], completeness_fields: Tuple[str, ...],
+                 min_completeness: float):
+        self.mandatory = mandatory
+        self.completeness_fields = completeness_fields
+        self.min_completeness = min_completeness
+        self.columns = tuple(dict.fromkeys(
+            mandatory + completeness_fields
+            + ('eli_uri', 'date_document', 'first_date_entry_in_force')))
 
 
 class DocumentValidator:
@@ -189,6 +315,20 @@ class DocumentValidator:
                 'min_completeness': 0.85,
             },
         }
+        self._compiled: Dict[Any, _CompiledRule] = {}
+    
+    def _rule_for(self, source_type) -> _CompiledRule:
+        """Compile (once) the rule for a source type"""
+        rule = self._compiled.get(source_type)
+        if rule is None:
+            rules = self.validation_rules.get(source_type)
+            rule = _CompiledRule(
+                tuple(rules['mandatory']) if rules else (),
+                COMPLETENESS_BASE_FIELDS + COMPLETENESS_TYPE_FIELDS.get(source_type, ()),
+                rules['min_completeness'] if rules else 0.80,
+            )
+            self._compiled[source_type] = rule
+        return rule
     
     def validate(self, document: LegalDocument) -> tuple[bool, List[str]]:
         """
@@ -230,118 +370,821 @@ class DocumentValidator:
         
         return len(issues) == 0, issues
     
+    def validate_batch(self, documents: Iterable[LegalDocument]) -> BatchValidationResult:
+        """
+        Validate many documents in one columnar pass per source type
+        
+        Applies the same checks as validate() and sets completeness_score,
+        validation_status and data_quality_issues on every document, but
+        reads each field once per batch column and builds issue messages
+        only for failing documents.
+        
+        Returns:
+            Aggregated counts per issue kind (e.g. "missing:celex_number")
+        """
+        result = BatchValidationResult()
+        groups: Dict[Any, List[LegalDocument]] = {}
+        for doc in documents:
+            groups.setdefault(doc.source_type, []).append(doc)
+        
+        match_eli = ELI_URI_PATTERN.match
+        counts = result.issue_counts
+        
+        for source_type, docs in groups.items():
+            rule = self._rule_for(source_type)
+            columns = {name: [getattr(doc, name) for doc in docs] for name in rule.columns}
+            
+            n_fields = len(rule.completeness_fields)
+            scores = [
+                (n_fields - row.count(None)) / n_fields
+                for row in zip(*(columns[name] for name in rule.completeness_fields))
+            ]
+            missing = [
+                (name, [value is None or value == "" for value in columns[name]])
+                for name in rule.mandatory
+            ]
+            eli_ok = [isinstance(uri, str) and match_eli(uri) is not None
+                      for uri in columns['eli_uri']]
+            date_bad = [
+                bool(issued and in_force and issued > in_force)
+                for issued, in_force in zip(columns['date_document'],
+                                            columns['first_date_entry_in_force'])
+            ]
+            
+            min_completeness = rule.min_completeness
+            failing = [score < min_completeness or not ok or bad
+                       for score, ok, bad in zip(scores, eli_ok, date_bad)]
+            for _, flags in missing:
+                failing = [f or m for f, m in zip(failing, flags)]
+            
+            for i, doc in enumerate(docs):
+                score = scores[i]
+                doc.completeness_score = score
+                if not failing[i]:
+                    doc.validation_status = ValidationStatus.PASSED
+                    doc.data_quality_issues = []
+                    result.passed += 1
+                    continue
+                
+                issues, kinds = [], []
+                for name, flags in missing:
+                    if flags[i]:
+                        issues.append(f"Missing mandatory field: {name}")
+                        kinds.append(f"missing:{name}")
+                if score < min_completeness:
+                    issues.append(f"Completeness score {score:.2%} < {min_completeness:.2%}")
+                    kinds.append("completeness")
+                if not eli_ok[i]:
+                    issues.append(f"Invalid ELI URI format: {doc.eli_uri}")
+                    kinds.append("eli_uri")
+                if date_bad[i]:
+                    issues.append("date_document cannot be after first_date_entry_in_force")
+                    kinds.append("date_order")
+                
+                doc.validation_status = ValidationStatus.FAILED
+                doc.data_quality_issues = issues
+                result.failed += 1
+                result.failed_uris.append(doc.eli_uri)
+                for kind in kinds:
+                    counts[kind] = counts.get(kind, 0) + 1
+            result.total += len(docs)
+        
+        return result
+    
     def _validate_eli_uri(self, eli_uri: str) -> bool:
         """Validate ELI URI format"""
-        parts = eli_uri.split(':')
-        if len(parts) < 4:  # Minimum: eli:jurisdiction:type:...
-            return False
-        if parts[0] != 'eli':
-            return False
-        return True
+        return isinstance(eli_uri, str) and ELI_URI_PATTERN.match(eli_uri) is not None
+
+
+class DocumentHashManifest:
+    """Local eli_uri → document_hash map persisted under data/processed"""
+    
+    def __init__(self, path: str = "data/processed/document_hashes.json"):
+        self.path = Path(path)
+        self.hashes: Dict[str, str] = {}
+    
+    def load(self) -> Dict[str, str]:
+        """Load manifest from disk (empty if it does not exist yet)"""
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.hashes = json.load(f)
+        logger.info(f"Loaded {len(self.hashes)} document hashes from {self.path}")
+        return self.hashes
+    
+    def save(self):
+        """Atomically write manifest to disk"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.hashes, f, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        logger.info(f"Saved {len(self.hashes)} document hashes to {self.path}")
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls at least 1/rate seconds apart"""
+    
+    def __init__(self, rate: Optional[float] = None):
+        """
+        Args:
+            rate: Maximum calls per second (None = unlimited)
+        """
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until the next call slot is available"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def __getstate__(self):
+        # Locks cannot be pickled into parse worker processes
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
 
 class DataSourceAdapter:
     """Base class for data source adapters"""
     
-    def __init__(self, source_name: str):
+    def __init__(self, source_name: str, rate_limit: Optional[float] = None,
+                 max_concurrency: int = 1, max_retries: int = 3,
+                 retry_backoff: float = 1.0,
+                 sparql_max_age: Optional[float] = DEFAULT_SPARQL_MAX_AGE):
+        """
+        Args:
+            source_name: Human-readable source name
+            rate_limit: Maximum requests per second against this source
+            max_concurrency: Fetch jobs allowed to run at once
+            max_retries: Retries per fetch job before giving up
+            retry_backoff: Base delay in seconds (doubles per retry)
+            sparql_max_age: Seconds a cached SPARQL result is reused before
+                            the query runs again (None = never expires)
+        """
         self.source_name = source_name
         self.documents = []
+        self.rate_limiter = RateLimiter(rate_limit)
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.sparql_max_age = sparql_max_age
+        self.cache: Optional[RawFetchCache] = None
+    
+    def throttle(self):
+        """Wait for this source's rate limit; call before each request"""
+        self.rate_limiter.acquire()
+    
+    def http_get(self, url: str, params: Optional[Dict] = None, timeout: float = 30.0) -> bytes:
+        """
+        GET a resource through the shared raw cache (if attached).
+        
+        The rate limit only applies when the network is actually hit;
+        cached copies are revalidated rather than re-downloaded.
+        """
+        if self.cache is not None:
+            return self.cache.fetch(url, params=params, timeout=timeout,
+                                    before_request=self.throttle)
+        
+        import requests
+        self.throttle()
+        response = requests.get(url, params=params, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+    
+    def sparql_query(self, endpoint: str, query: str, timeout: float = 120.0) -> Dict:
+        """Run a SPARQL query through the shared raw cache (if attached)"""
+        if self.cache is not None:
+            body = self.cache.fetch_sparql(endpoint, query, max_age=self.sparql_max_age,
+                                           timeout=timeout, before_request=self.throttle)
+        else:
+            import requests
+            self.throttle()
+            response = requests.post(
+                endpoint,
+                data={'query': query},
+                headers={'Accept': 'application/sparql-results+json'},
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            body = response.content
+        return json.loads(body)
+    
+    def fetch_jobs(self) -> List[Dict]:
+        """
+        Keyword arguments for each independent fetch() call.
+        
+        Override to split a source into pages or queries that the
+        FetchScheduler can run concurrently (up to max_concurrency).
+        """
+        return [{}]
     
     def fetch(self, **kwargs) -> List[Dict]:
         """Fetch documents from source. Override in subclasses."""
         raise NotImplementedError
     
+    def iter_fetch(self, **kwargs) -> Iterator[Any]:
+        """
+        Yield raw records one at a time for streaming runs.
+        
+        Defaults to iterating over fetch(); adapters that page through
+        their source should override this so records flow before the
+        whole source has been downloaded.
+        """
+        yield from self.fetch(**kwargs)
+    
     def parse(self, raw_data: Dict) -> LegalDocument:
         """Parse raw data into LegalDocument. Override in subclasses."""
         raise NotImplementedError
+    
+    def iter_parse(self, raw_data: Any) -> Iterator[Any]:
+        """
+        Yield everything parsed from one raw record.
+        
+        Yields the LegalDocument first, followed by any article records
+        (dicts carrying eli_uri and law_uri). Defaults to parse().
+        """
+        yield self.parse(raw_data)
+
+
+def is_article_record(item: Any) -> bool:
+    """True for article dicts emitted by DataSourceAdapter.iter_parse"""
+    return isinstance(item, dict) and 'law_uri' in item
 
 
 class GesetzImInternetAdapter(DataSourceAdapter):
     """Adapter for gesetze-im-internet.de (German laws)"""
     
-    def __init__(self):
-        super().__init__("gesetze-im-internet.de")
+    # Enacting body named in the Eingangsformel ("... verordnet das
+    # Bundesministerium für ...:", "Der Bundestag hat ... beschlossen")
+    ENACTING_BODY_PATTERN = re.compile(
+        r"verordne[nt]\s+(?:das\s+|die\s+)?"
+        r"(Bundesregierung|Bundesministeri\w*(?:(?:\s+(?:der|des|für|und))+(?:\s+[A-ZÄÖÜ][\w-]*)+)*)"
+        r"|(Der Bundestag) hat"
+    )
+    
+    def __init__(self, limit: int = 100, laws_per_job: int = 10):
+        """
+        Args:
+            limit: Laws of the gii-toc fetched per run
+            laws_per_job: Laws downloaded by one fetch job; the FetchScheduler
+                          runs up to max_concurrency jobs at once
+        """
+        super().__init__("gesetze-im-internet.de", rate_limit=5.0, max_concurrency=4)
         self.base_url = "https://www.gesetze-im-internet.de"
+        self.limit = limit
+        self.laws_per_job = laws_per_job
+    
+    def list_laws(self) -> List[Dict]:
+        """Read the table of contents (gii-toc.xml) listing every law"""
+        root = ET.fromstring(self.http_get(f"{self.base_url}/gii-toc.xml"))
+        return [
+            {'title': item.findtext('title'), 'url': item.findtext('link')}
+            for item in root.iter('item')
+        ]
+    
+    def fetch_jobs(self) -> List[Dict]:
+        """One job per laws_per_job entries of the gii-toc"""
+        try:
+            urls = [entry['url'] for entry in self.list_laws()[:self.limit]]
+        except Exception as e:
+            # Leave the table of contents to a single retried job
+            logger.warning(f"⚠ Could not read gii-toc.xml ({e}); fetching in one job")
+            return [{}]
+        return [{'urls': urls[i:i+self.laws_per_job]}
+                for i in range(0, len(urls), self.laws_per_job)]
     
-    def fetch(self, law_id: str = None, limit: int = 100) -> List[Dict]:
+    def fetch(self, law_id: str = None, limit: Optional[int] = None,
+              urls: Optional[List[str]] = None) -> List[Dict]:
         """
         Fetch German laws from gesetze-im-internet.de
         
-        TODO: Implement actual web scraping
+        Args:
+            law_id: Fetch only this law (its gesetze-im-internet path)
+            limit: Laws of the gii-toc to fetch (default self.limit)
+            urls: xml.zip URLs to fetch instead of reading the gii-toc
+        
+        Returns:
+            Raw records {'law_id', 'url', 'xml'} with the law's XML bytes
         """
-        logger.info(f"Fetching German laws from {self.source_name} (limit: {limit})")
-        # Placeholder implementation
-        return []
+        if urls is not None:
+            logger.info(f"Fetching {len(urls)} German laws from {self.source_name}")
+        else:
+            logger.info(f"Fetching German laws from {self.source_name} (limit: {limit or self.limit})")
+        return list(self.iter_fetch(law_id=law_id, limit=limit, urls=urls))
+    
+    def iter_fetch(self, law_id: str = None, limit: Optional[int] = None,
+                   urls: Optional[List[str]] = None) -> Iterator[Dict]:
+        """Yield raw law records one download at a time"""
+        if law_id:
+            urls = [f"{self.base_url}/{law_id}/xml.zip"]
+        elif urls is None:
+            urls = [entry['url'] for entry in self.list_laws()[:limit or self.limit]]
+        
+        for url in urls:
+            archive = zipfile.ZipFile(io.BytesIO(self.http_get(url)))
+            xml_name = next(n for n in archive.namelist() if n.endswith('.xml'))
+            yield {
+                'law_id': url.rstrip('/').split('/')[-2],
+                'url': url,
+                'xml': archive.read(xml_name),
+            }
     
-    def parse(self, raw_html: str) -> LegalDocument:
+    def parse(self, raw_data: Any) -> LegalDocument:
+        """Parse a law record into its LegalDocument (articles are discarded)"""
+        return next(iter(self.iter_parse(raw_data)))
+    
+    def iter_parse(self, raw_data: Any) -> Iterator[Any]:
         """
-        Parse HTML from gesetze-im-internet.de into LegalDocument
+        Stream-parse a law's XML from gesetze-im-internet.de
         
-        TODO: Implement HTML parsing with BeautifulSoup
+        Args:
+            raw_data: Raw record from fetch(), XML bytes, or a file path
         """
-        # Placeholder implementation
-        document = LegalDocument(
-            eli_uri="eli:de:placeholder",
+        xml = raw_data['xml'] if isinstance(raw_data, dict) else raw_data
+        if isinstance(xml, bytes):
+            # Every § / Art. norm has exactly one <enbez>; the law-level norm has none
+            yield from self.iter_parse_xml(io.BytesIO(xml), article_count=xml.count(b'<enbez>'),
+                                           enacting_body=self.enacting_body(xml))
+        else:
+            yield from self.iter_parse_xml(xml)
+    
+    @classmethod
+    def enacting_body(cls, xml: bytes) -> Optional[str]:
+        """
+        Body that enacted the law, read from its Eingangsformel
+        
+        The Eingangsformel is a norm of its own after the law-level
+        metadata, so it is scanned for before the streaming parse.
+        """
+        start = xml.find(b'<enbez>Eingangsformel</enbez>')
+        if start < 0:
+            return None
+        end = xml.find(b'</norm>', start)
+        norm = xml[start:end if end >= 0 else start + 8192]
+        text = re.sub(r'<[^>]+>', ' ', norm.decode('utf-8', errors='replace'))
+        match = cls.ENACTING_BODY_PATTERN.search(text)
+        if match is None:
+            return None
+        if match.group(2):
+            return "Deutscher Bundestag"
+        return ' '.join(match.group(1).split())
+    
+    def iter_parse_xml(self, source, article_count: int = 0,
+                       enacting_body: Optional[str] = None) -> Iterator[Any]:
+        """
+        Incrementally parse gesetze-im-internet XML without building a DOM
+        
+        The first <norm> carries the law's metadata and becomes the
+        LegalDocument; every following <norm> with an <enbez> (§/Art.)
+        becomes an article dict. Each <norm> is cleared once emitted, so
+        memory stays bounded by the largest single norm.
+        
+        Args:
+            source: File path or binary file object
+            article_count: Stored on the LegalDocument, which is emitted
+                           before its articles are parsed
+            enacting_body: responsible_authority from the Eingangsformel
+                           (see enacting_body); derived from the title and
+                           the gazette otherwise
+            
+        Yields:
+            LegalDocument, then article dicts
+        """
+        context = ET.iterparse(source, events=('start', 'end'))
+        _, root = next(context)
+        document = None
+        
+        for event, elem in context:
+            if event != 'end' or elem.tag != 'norm':
+                continue
+            
+            metadata = elem.find('metadaten')
+            if metadata is not None:
+                if document is None:
+                    document = self._document_from_metadata(metadata, enacting_body)
+                    document.article_count = article_count
+                    yield document
+                else:
+                    article = self._article_from_norm(document, elem, metadata)
+                    if article:
+                        yield article
+            root.clear()
+    
+    def _document_from_metadata(self, metadata: ET.Element,
+                                enacting_body: Optional[str] = None) -> LegalDocument:
+        """Build LegalDocument from the law-level <metadaten> block"""
+        abbreviation = metadata.findtext('jurabk') or metadata.findtext('amtabk') or 'unknown'
+        slug = re.sub(r'\W+', '', abbreviation.lower()) or 'unknown'
+        
+        date_text = metadata.findtext('ausfertigung-datum')
+        date_document = datetime.strptime(date_text.strip(), '%Y-%m-%d') if date_text else None
+        date_part = date_document.strftime('%Y:%m:%d') if date_document else 'undated'
+        
+        bgbl_reference = None
+        fundstelle = metadata.find('fundstelle')
+        if fundstelle is not None:
+            parts = [fundstelle.findtext('periodikum'), fundstelle.findtext('zitstelle')]
+            bgbl_reference = ' '.join(p.strip() for p in parts if p) or None
+        
+        title = (metadata.findtext('langue') or abbreviation).strip()
+        if enacting_body is None and 'gesetz' in title.lower() and fundstelle is not None:
+            # A formal statute is passed by the parliament of its gazette
+            enacting_body = {'BGBl': "Deutscher Bundestag", 'RGBl': "Reichstag"}.get(
+                (fundstelle.findtext('periodikum') or '').strip())
+        
+        return LegalDocument(
+            eli_uri=f"eli:bund:{slug}:{date_part}",
             source_type=LawSourceType.GERMAN_LAW,
-            title_de="Placeholder",
-            date_document=datetime.now(),
+            title_de=title,
+            bgbl_reference=bgbl_reference,
+            responsible_authority=enacting_body,
+            date_document=date_document,
             ingestion_source=self.source_name,
         )
-        return document
+    
+    @staticmethod
+    def _article_from_norm(document: LegalDocument, norm: ET.Element,
+                           metadata: ET.Element) -> Optional[Dict]:
+        """Build an article record from a single § / Art. <norm>"""
+        designation = metadata.findtext('enbez')
+        if not designation:
+            return None  # headings (gliederungseinheit), preamble, etc.
+        
+        number = re.sub(r'^(§+|Art(ikel|\.)?)\s*', '', designation.strip())
+        number = re.sub(r'\s+', '_', number) or designation.strip()
+        text_elem = norm.find('textdaten/text')
+        text = ' '.join(' '.join(text_elem.itertext()).split()) if text_elem is not None else ''
+        title = (metadata.findtext('titel') or '').strip()
+        
+        article = {
+            'eli_uri': f"{document.eli_uri}:art:{number}",
+            'law_uri': document.eli_uri,
+            'article_number': number,
+            'designation': designation.strip(),
+            'title': title,
+            'text_content': text,
+        }
+        content = json.dumps([number, title, text], ensure_ascii=False)
+        article['document_hash'] = hashlib.sha256(content.encode()).hexdigest()
+        return article
 
 
 class EURLexAdapter(DataSourceAdapter):
     """Adapter for EUR-Lex (EU legislation via SPARQL)"""
     
+    # One row per act: titles of the German and English expressions, the
+    # Official Journal issue it was published in, entry into force and
+    # (directives) the earliest transposition deadline
+    DEFAULT_QUERY = """
+    PREFIX cdm: <http://publications.europa.eu/ontology/cdm#>
+    PREFIX lang: <http://publications.europa.eu/resource/authority/language/>
+    SELECT ?work ?celex (SAMPLE(?date_) AS ?date)
+           (SAMPLE(?title_de_) AS ?title_de) (SAMPLE(?title_en_) AS ?title_en)
+           (SAMPLE(?oj_) AS ?oj) (MIN(?in_force_) AS ?in_force)
+           (MIN(?deadline_) AS ?deadline)
+    WHERE {
+        ?work cdm:resource_legal_id_celex ?celex ;
+              cdm:work_date_document ?date_ .
+        FILTER(REGEX(STR(?celex), "^3[0-9]{4}[LR][0-9]{4}$"))
+        OPTIONAL {
+            ?work cdm:work_has_expression ?expression_de .
+            ?expression_de cdm:expression_uses_language lang:DEU ;
+                           cdm:expression_title ?title_de_ .
+        }
+        OPTIONAL {
+            ?work cdm:work_has_expression ?expression_en .
+            ?expression_en cdm:expression_uses_language lang:ENG ;
+                           cdm:expression_title ?title_en_ .
+        }
+        OPTIONAL { ?work cdm:resource_legal_published_in_official-journal ?oj_ . }
+        OPTIONAL { ?work cdm:resource_legal_date_entry-into-force ?in_force_ . }
+        OPTIONAL { ?work cdm:directive_date_transposition ?deadline_ . }
+    }
+    GROUP BY ?work ?celex
+    """
+    
+    # CELEX sector 3 (legislation): year, act type, number
+    CELEX_PATTERN = re.compile(r"^3(\d{4})([LR])(\d{4})$")
+    # Official Journal issue resource, e.g. .../resource/oj/JOL_2016_119_R
+    OJ_ISSUE_PATTERN = re.compile(r"JO([LC])_(\d{4})_(\d+)")
+    CELEX_TYPES = {
+        'L': ('dir', LawSourceType.EU_DIRECTIVE),
+        'R': ('reg', LawSourceType.EU_REGULATION),
+    }
+    
     def __init__(self):
-        super().__init__("EUR-Lex SPARQL")
+        super().__init__("EUR-Lex SPARQL", rate_limit=2.0, max_concurrency=2)
         self.sparql_endpoint = "https://data.europa.eu/sparql"
     
-    def fetch(self, query: str, limit: int = 100) -> List[Dict]:
+    def fetch(self, query: str = None, limit: int = 100) -> List[Dict]:
         """
         Fetch EU legislation using SPARQL query
         
-        TODO: Implement SPARQL querying
+        Returns:
+            SPARQL result bindings
         """
         logger.info(f"Fetching EU legislation from {self.source_name} (limit: {limit})")
-        # Placeholder implementation
-        return []
+        query = f"{(query or self.DEFAULT_QUERY).strip()}\nLIMIT {limit}"
+        return self.sparql_query(self.sparql_endpoint, query)['results']['bindings']
     
     def parse(self, sparql_result: Dict) -> LegalDocument:
         """
-        Parse SPARQL result into LegalDocument
+        Parse one DEFAULT_QUERY binding into a LegalDocument
+        
+        The ELI is derived from the CELEX number (32016L0680 →
+        eli:eu:dir:2016:680) and the OJ reference from the issue the act
+        was published in (JOL_2016_119_R → "OJ L 119/2016"). Bindings
+        missing from the result are left empty for validation to report.
         
-        TODO: Implement SPARQL result parsing
+        Raises:
+            ValueError: For CELEX numbers other than directives and regulations
         """
-        # Placeholder implementation
-        document = LegalDocument(
-            eli_uri="eli:eu:placeholder",
-            source_type=LawSourceType.EU_REGULATION,
-            celex_number="32000R0000",
-            title_en="Placeholder",
-            date_document=datetime.now(),
+        celex = sparql_result['celex']['value'].strip()
+        match = self.CELEX_PATTERN.match(celex)
+        if not match:
+            raise ValueError(f"Unsupported CELEX number: {celex}")
+        year, act_type, number = match.groups()
+        eli_type, source_type = self.CELEX_TYPES[act_type]
+        
+        def value(name: str) -> Optional[str]:
+            binding = sparql_result.get(name)
+            return (binding['value'].strip() or None) if binding else None
+        
+        def date_value(name: str) -> Optional[datetime]:
+            text = value(name)
+            return datetime.fromisoformat(text[:10]) if text else None
+        
+        ojeu_reference = None
+        oj = value('oj')
+        if oj:
+            issue = self.OJ_ISSUE_PATTERN.search(oj)
+            ojeu_reference = (f"OJ {issue.group(1)} {int(issue.group(3))}/{issue.group(2)}"
+                              if issue else oj.rstrip('/').rsplit('/', 1)[-1])
+        
+        return LegalDocument(
+            eli_uri=f"eli:eu:{eli_type}:{year}:{int(number)}",
+            source_type=source_type,
+            celex_number=celex,
+            title_de=value('title_de'),
+            title_en=value('title_en'),
+            date_document=date_value('date'),
+            first_date_entry_in_force=date_value('in_force'),
+            ojeu_reference=ojeu_reference,
+            transposition_deadline=date_value('deadline') if source_type is LawSourceType.EU_DIRECTIVE else None,
             ingestion_source=self.source_name,
         )
-        return document
+
+
+SKOS_NS = "http://www.w3.org/2004/02/skos/core#"
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+OWL_NS = "http://www.w3.org/2002/07/owl#"
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+_SKOS_CONCEPT_URI = f"{SKOS_NS}Concept"
+_SKOS_CONCEPT = f"{{{SKOS_NS}}}Concept"
+_RDF_TYPE = f"{{{RDF_NS}}}type"
+_RDF_DESCRIPTION = f"{{{RDF_NS}}}Description"
+_RDF_ABOUT = f"{{{RDF_NS}}}about"
+_RDF_RESOURCE = f"{{{RDF_NS}}}resource"
 
 
 class EuroVocAdapter(DataSourceAdapter):
     """Adapter for EuroVoc thesaurus concept mapping"""
     
-    def __init__(self):
-        super().__init__("EuroVoc API")
+    def __init__(self, dump_path: Optional[str] = None, languages: Tuple[str, ...] = ('de', 'en')):
+        """
+        Args:
+            dump_path: Local EuroVoc SKOS/RDF-XML dump (e.g. eurovoc_in_skos_core_concepts.rdf)
+            languages: Languages whose labels and scope notes are kept
+        """
+        super().__init__("EuroVoc API", rate_limit=2.0, max_concurrency=1)
         self.api_url = "https://publications.europa.eu/resource/authority/eurovoc"
+        self.dump_path = dump_path
+        self.languages = tuple(languages)
+    
+    def fetch_jobs(self) -> List[Dict]:
+        return [{'dump_path': self.dump_path}] if self.dump_path else [{}]
     
-    def fetch(self, concept_uri: str = None) -> List[Dict]:
+    def fetch(self, concept_uri: str = None, dump_path: str = None) -> List[Dict]:
         """Fetch EuroVoc concepts"""
-        logger.info(f"Fetching EuroVoc concepts from {self.source_name}")
+        logger.info(f"Fetching EuroVoc concepts from {dump_path or self.source_name}")
+        if dump_path:
+            return list(self.iter_skos_concepts(dump_path))
         # Placeholder implementation
         return []
     
+    def iter_fetch(self, concept_uri: str = None, dump_path: str = None) -> Iterator[Dict]:
+        """Stream concepts from the local dump"""
+        if dump_path:
+            yield from self.iter_skos_concepts(dump_path)
+        else:
+            yield from self.fetch(concept_uri=concept_uri)
+    
     def parse(self, rdf_data: Dict) -> Dict:
-        """Parse RDF/SKOS EuroVoc data"""
-        # Placeholder implementation
-        return {}
+        """Parse RDF/SKOS EuroVoc data (concept dicts pass through)"""
+        return rdf_data
+    
+    def iter_skos_concepts(self, source) -> Iterator[Dict]:
+        """
+        Incrementally parse a SKOS RDF/XML dump into concept dicts
+        
+        Top-level skos:Concept elements and rdf:Description elements typed
+        skos:Concept are converted and then cleared, so memory stays flat
+        for the full thesaurus.
+        
+        Args:
+            source: File path or binary file object
+            
+        Yields:
+            Dicts with eurovoc_id, uri, pref_label_<lang>, alt_labels_<lang>,
+            scope_note_<lang>, status, has_broader/has_narrower/has_related
+            and broader/narrower/related eurovoc_id lists
+        """
+        context = ET.iterparse(source, events=('start', 'end'))
+        _, root = next(context)
+        depth = 0
+        count = 0
+        
+        for event, elem in context:
+            if event == 'start':
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 0:
+                continue
+            if elem.tag in (_SKOS_CONCEPT, _RDF_DESCRIPTION):
+                concept = self._concept_from_element(elem)
+                if concept:
+                    count += 1
+                    yield concept
+            root.clear()
+        
+        logger.info(f"✓ Parsed {count} EuroVoc concepts")
+    
+    @staticmethod
+    def _concept_id(uri: str) -> str:
+        return uri.rstrip('/').rsplit('/', 1)[-1]
+    
+    def _concept_from_element(self, elem: ET.Element) -> Optional[Dict]:
+        """Concept dict from a top-level SKOS element (None if not a concept)"""
+        about = elem.get(_RDF_ABOUT)
+        if not about:
+            return None
+        if elem.tag == _RDF_DESCRIPTION and not any(
+                child.get(_RDF_RESOURCE) == _SKOS_CONCEPT_URI for child in elem.findall(_RDF_TYPE)):
+            return None
+        
+        concept = {'eurovoc_id': self._concept_id(about), 'uri': about}
+        for lang in self.languages:
+            concept[f'pref_label_{lang}'] = None
+            concept[f'alt_labels_{lang}'] = []
+            concept[f'scope_note_{lang}'] = None
+        relations = {'broader': [], 'narrower': [], 'related': []}
+        deprecated = False
+        
+        for child in elem:
+            tag = child.tag
+            if tag.startswith(f"{{{SKOS_NS}}}"):
+                name = tag[len(SKOS_NS) + 2:]
+                if name in relations:
+                    resource = child.get(_RDF_RESOURCE)
+                    if resource:
+                        relations[name].append(self._concept_id(resource))
+                    continue
+                lang = child.get(XML_LANG)
+                text = (child.text or '').strip()
+                if lang not in self.languages or not text:
+                    continue
+                if name == 'prefLabel':
+                    concept[f'pref_label_{lang}'] = text
+                elif name == 'altLabel':
+                    concept[f'alt_labels_{lang}'].append(text)
+                elif name == 'scopeNote':
+                    concept[f'scope_note_{lang}'] = text
+            elif tag == f"{{{OWL_NS}}}deprecated":
+                deprecated = (child.text or '').strip().lower() == 'true'
+        
+        concept['status'] = 'deprecated' if deprecated else 'current'
+        for name, ids in relations.items():
+            concept[f'has_{name}'] = bool(ids)
+        concept.update(relations)
+        return concept
+
+
+class FetchScheduler:
+    """
+    Runs fetch jobs of several adapters concurrently.
+    
+    Every adapter keeps its own rate limit (applied per request by
+    http_get/sparql_query), its own concurrency cap and its own retry
+    policy, so a slow or flaky source only delays itself.
+    """
+    
+    # Errors that indicate a programming/config problem, not a transient one
+    NON_RETRYABLE = (NotImplementedError, TypeError, ValueError)
+    
+    def __init__(self, adapters: List[DataSourceAdapter], max_workers: Optional[int] = None):
+        self.adapters = adapters
+        self.max_workers = max_workers or max(1, sum(a.max_concurrency for a in adapters))
+        self._slots = {a.source_name: threading.Semaphore(a.max_concurrency) for a in adapters}
+    
+    def _run_job(self, adapter: DataSourceAdapter, kwargs: Dict) -> Tuple[List, int]:
+        """Run one fetch job with retry and exponential backoff"""
+        with self._slots[adapter.source_name]:
+            attempt = 0
+            while True:
+                try:
+                    return adapter.fetch(**kwargs), attempt
+                except self.NON_RETRYABLE:
+                    raise
+                except Exception as e:
+                    if attempt >= adapter.max_retries:
+                        raise
+                    delay = adapter.retry_backoff * (2 ** attempt)
+                    attempt += 1
+                    logger.warning(f"⚠ {adapter.source_name} fetch failed ({e}); "
+                                   f"retry {attempt}/{adapter.max_retries} in {delay:.1f}s")
+                    time.sleep(delay)
+    
+    def run(self) -> Dict[str, Dict]:
+        """
+        Fetch from all adapters concurrently.
+        
+        Returns:
+            Dict of source_name to {'records', 'seconds', 'jobs', 'retries', 'errors'}
+        """
+        report = {
+            a.source_name: {'records': [], 'seconds': 0.0, 'jobs': 0, 'retries': 0, 'errors': 0}
+            for a in self.adapters
+        }
+        started = {}
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fetch") as pool:
+            futures = {}
+            for adapter in self.adapters:
+                started[adapter.source_name] = time.perf_counter()
+                for kwargs in adapter.fetch_jobs():
+                    futures[pool.submit(self._run_job, adapter, kwargs)] = adapter
+                    report[adapter.source_name]['jobs'] += 1
+            
+            for future in as_completed(futures):
+                adapter = futures[future]
+                entry = report[adapter.source_name]
+                try:
+                    records, retries = future.result()
+                    entry['records'].extend(records)
+                    entry['retries'] += retries
+                except Exception as e:
+                    entry['errors'] += 1
+                    logger.error(f"✗ Error fetching from {adapter.source_name}: {e}")
+                entry['seconds'] = time.perf_counter() - started[adapter.source_name]
+        
+        return report
+
+
+# Adapters available inside parse worker processes, keyed by source_name
+_WORKER_ADAPTERS: Dict[str, DataSourceAdapter] = {}
+
+
+def _init_parse_worker(adapters: List[DataSourceAdapter]):
+    """Process pool initializer: ship adapters to the worker once"""
+    _WORKER_ADAPTERS.clear()
+    _WORKER_ADAPTERS.update({adapter.source_name: adapter for adapter in adapters})
+
+
+def _parse_chunk(source_name: str, chunk: List[Tuple[int, Any]]) -> List[Tuple[int, Any, Optional[str]]]:
+    """
+    Parse one chunk of raw records in a worker process.
+    
+    Errors are caught per record so one bad document does not lose the
+    rest of its chunk.
+    
+    Returns:
+        (index, parsed items or None, error message or None) per record
+    """
+    adapter = _WORKER_ADAPTERS[source_name]
+    results = []
+    for index, raw in chunk:
+        try:
+            results.append((index, list(adapter.iter_parse(raw)), None))
+        except Exception as e:
+            results.append((index, None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+# Sentinel put on the raw-record queue when an adapter is exhausted
+_STREAM_END = object()
 
 
 class DataIngestionPipeline:
@@ -349,24 +1192,100 @@ class DataIngestionPipeline:
     
     def __init__(self, neo4j_uri: str = "bolt://localhost:7687", 
                  neo4j_user: str = "neo4j", 
-                 neo4j_password: str = "password"):
+                 neo4j_password: str = "password",
+                 client=None,
+                 incremental: bool = False,
+                 manifest_path: Optional[str] = None,
+                 batch_size: int = 500,
+                 raw_cache: Optional[RawFetchCache] = None,
+                 parse_processes: Optional[int] = None,
+                 parse_chunk_size: int = 64,
+                 embedder=None,
+                 embedding_batch_size: int = 64,
+                 metrics_dir: Optional[str] = None,
+                 profile_stages: Iterable[str] = (),
+                 concept_tagger=None,
+                 extract_citations: bool = False,
+                 checkpoint: Optional[CheckpointStore] = None):
+        """
+        Args:
+            neo4j_uri / neo4j_user / neo4j_password: Connection settings
+            client: Existing Neo4jClient (created lazily if omitted)
+            incremental: Only write documents whose document_hash changed
+            manifest_path: Local hash manifest; if omitted, stored hashes
+                           are preloaded from Neo4j
+            batch_size: Documents per Neo4j write
+            raw_cache: Raw response cache shared by all adapters
+                       (use RawFetchCache(offline=True) to replay without network)
+            parse_processes: Worker processes for parse_stage
+                             (None = one per core, 1 = parse in-process)
+            parse_chunk_size: Raw records per worker task
+            embedder: Embedder (src.llm.embedding_generator) for article
+                      vectors; no embeddings are written if omitted
+            embedding_batch_size: Articles per embed() call
+            metrics_dir: Write metrics.json / metrics.prom here after each run
+            profile_stages: Stages to run under cProfile ('*' = all)
+            concept_tagger: ConceptTagger (src.ingestion.concept_tagger); written
+                            articles are tagged with CONCERNS edges if set
+            extract_citations: Run citation_stage after ingest (CITES / IMPLEMENTS
+                               edges from article text, using parse_processes workers);
+                               run_streaming extracts them from every written batch
+            checkpoint: CheckpointStore recording written batches, completed
+                        stages and dead letters; required for resume=True
+        """
         self.neo4j_uri = neo4j_uri
         self.neo4j_user = neo4j_user
         self.neo4j_password = neo4j_password
+        self.client = client
+        self.incremental = incremental
+        self.manifest = DocumentHashManifest(manifest_path) if manifest_path else None
+        self.batch_size = batch_size
+        self.raw_cache = raw_cache
+        self.parse_processes = parse_processes
+        self.parse_chunk_size = parse_chunk_size
+        self.embedder = embedder
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_hashes: Optional[Dict[str, str]] = None
+        self.known_hashes: Optional[Dict[str, str]] = None
+        self.metrics_dir = metrics_dir
+        self.profile_stages = tuple(profile_stages)
+        self.concept_tagger = concept_tagger
+        self.extract_citations = extract_citations
+        self.checkpoint = checkpoint
+        self._stream_positions: Optional[Dict[str, int]] = None
+        self._replay_attempts: Dict[Any, int] = {}
+        self.metrics = self._new_metrics()
         
         self.adapters: List[DataSourceAdapter] = []
         self.validator = DocumentValidator()
         self.documents: List[LegalDocument] = []
+        self.articles: List[Dict] = []
+        self.raw_data: Dict[str, List] = {}
         self.results = {
             'total_fetched': 0,
             'total_validated': 0,
             'total_ingested': 0,
+            'articles_ingested': 0,
+            'articles_embedded': 0,
+            'embeddings_unchanged': 0,
+            'concepts_ingested': 0,
+            'concepts_tagged': 0,
+            'citations_found': 0,
+            'citations_written': 0,
+            'citations_unresolved': 0,
+            'skipped_checkpointed': 0,
+            'dead_letters': 0,
             'failed': 0,
             'warnings': 0,
+            'skipped_unchanged': 0,
+            'validation_issues': {},
+            'adapter_timings': {},
         }
     
     def register_adapter(self, adapter: DataSourceAdapter):
         """Register a data source adapter"""
+        if adapter.cache is None:
+            adapter.cache = self.raw_cache
         self.adapters.append(adapter)
         logger.info(f"Registered adapter: {adapter.source_name}")
     
@@ -376,14 +1295,17 @@ class DataIngestionPipeline:
         logger.info("STAGE 1: FETCH - Retrieving data from sources")
         logger.info("=" * 60)
         
-        for adapter in self.adapters:
-            try:
-                logger.info(f"Fetching from {adapter.source_name}...")
-                raw_data = adapter.fetch()
-                self.results['total_fetched'] += len(raw_data)
-                logger.info(f"✓ Fetched {len(raw_data)} items from {adapter.source_name}")
-            except Exception as e:
-                logger.error(f"✗ Error fetching from {adapter.source_name}: {e}")
+        report = FetchScheduler(self.adapters).run()
+        if self.raw_cache:
+            self.raw_cache.flush()
+        
+        for source_name, entry in report.items():
+            records = entry.pop('records')
+            self.raw_data[source_name] = records
+            self.results['total_fetched'] += len(records)
+            self.results['adapter_timings'][source_name] = {**entry, 'records': len(records)}
+            logger.info(f"✓ Fetched {len(records)} items from {source_name} "
+                        f"in {entry['seconds']:.2f}s")
     
     def parse_stage(self):
         """Stage 2: Parse data into unified format"""
@@ -391,14 +1313,47 @@ class DataIngestionPipeline:
         logger.info("STAGE 2: PARSE - Converting to unified format")
         logger.info("=" * 60)
         
+        tasks = []
         for adapter in self.adapters:
-            try:
-                logger.info(f"Parsing data from {adapter.source_name}...")
-                # TODO: Implement actual parsing from fetched data
-                parsed_count = 0
-                logger.info(f"✓ Parsed {parsed_count} documents from {adapter.source_name}")
-            except Exception as e:
-                logger.error(f"✗ Error parsing data from {adapter.source_name}: {e}")
+            records = list(enumerate(self.raw_data.get(adapter.source_name, [])))
+            for i in range(0, len(records), self.parse_chunk_size):
+                tasks.append((adapter.source_name, records[i:i+self.parse_chunk_size]))
+        
+        if not tasks:
+            logger.info("✓ Nothing to parse")
+            return
+        
+        if self.parse_processes == 1 or len(tasks) == 1:
+            _init_parse_worker(self.adapters)
+            chunk_results = (_parse_chunk(name, chunk) for name, chunk in tasks)
+            self._collect_parsed(tasks, chunk_results)
+        else:
+            with ProcessPoolExecutor(max_workers=self.parse_processes,
+                                     initializer=_init_parse_worker,
+                                     initargs=(self.adapters,)) as pool:
+                names, chunks = zip(*tasks)
+                self._collect_parsed(tasks, pool.map(_parse_chunk, names, chunks))
+    
+    def _collect_parsed(self, tasks: List[Tuple[str, List]], chunk_results: Iterable[List]):
+        """Append parsed documents/articles in input order and count per-record failures"""
+        counts: Dict[str, int] = {}
+        for (source_name, chunk), results in zip(tasks, chunk_results):
+            for index, items, error in results:
+                if error:
+                    self.results['failed'] += 1
+                    logger.error(f"✗ Error parsing record {index} from {source_name}: {error}")
+                    self._dead_letter('parse', error, record=dict(chunk).get(index),
+                                      source=source_name, sequence=index)
+                    continue
+                for item in items:
+                    if isinstance(item, LegalDocument):
+                        self.documents.append(item)
+                        counts[source_name] = counts.get(source_name, 0) + 1
+                    elif is_article_record(item):
+                        self.articles.append(item)
+        
+        for adapter in self.adapters:
+            logger.info(f"✓ Parsed {counts.get(adapter.source_name, 0)} documents from {adapter.source_name}")
     
     def validate_stage(self):
         """Stage 3: Validate documents against schema"""
@@ -406,44 +1361,741 @@ class DataIngestionPipeline:
         logger.info("STAGE 3: VALIDATE - Checking data quality")
         logger.info("=" * 60)
         
+        batch = self.validator.validate_batch(self.documents)
+        self.results['total_validated'] += batch.passed
+        self.results['failed'] += batch.failed
+        for issue, count in batch.issue_counts.items():
+            self.results['validation_issues'][issue] = self.results['validation_issues'].get(issue, 0) + count
+        if batch.failed:
+            logger.warning(f"✗ {batch.failed} documents failed validation ({batch.summary()})")
+        
         for doc in self.documents:
+            doc.generate_document_hash()
+            if doc.validation_status == ValidationStatus.FAILED:
+                self._dead_letter('validate', '; '.join(doc.data_quality_issues), record=doc.to_dict(),
+                                  source=doc.ingestion_source or None, eli_uri=doc.eli_uri)
+        
+        logger.info(f"✓ Validated {self.results['total_validated']} / {len(self.documents)} documents")
+    
+    def ingest_stage(self):
+        """Stage 4: Write to Neo4j database"""
+        logger.info("=" * 60)
+        logger.info("STAGE 4: INGEST - Writing to Neo4j")
+        logger.info("=" * 60)
+        
+        documents = [d for d in self.documents if d.validation_status == ValidationStatus.PASSED]
+        passed_uris = {d.eli_uri for d in documents}
+        items = documents + [a for a in self.articles if a['law_uri'] in passed_uris]
+        if self.checkpoint is not None:
+            items = list(self.iter_unwritten(items))
+        if self.incremental:
+            items = list(self.iter_changed(items))
+        
+        for batch in iter_batches(items, self.batch_size):
+            self.write_batch(batch)
+        
+        if self.incremental:
+            self._save_known_hashes()
+        
+        logger.info(f"✓ Ingested {self.results['total_ingested']} documents")
+    
+    def iter_unwritten(self, items: Iterable[Any]) -> Iterator[Any]:
+        """Skip documents and articles the checkpoint records as written"""
+        written = self.checkpoint.written
+        for item in items:
+            eli_uri = item.eli_uri if isinstance(item, LegalDocument) else item['eli_uri']
+            if eli_uri in written:
+                self.results['skipped_checkpointed'] += 1
+                continue
+            yield item
+    
+    def _dead_letter(self, stage: str, error: str, record: Any = None,
+                     source: Optional[str] = None, eli_uri: Optional[str] = None,
+                     sequence: Optional[int] = None):
+        """Record a failed item in the checkpoint's dead-letter file"""
+        if self.checkpoint is None:
+            return
+        attempts = self._replay_attempts.get(eli_uri or (source, sequence), 0) + 1
+        if self.checkpoint.add_dead_letter(stage, str(error), record=record, source=source,
+                                           eli_uri=eli_uri, sequence=sequence, attempts=attempts):
+            self.results['dead_letters'] += 1
+    
+    def _get_client(self):
+        """Return the Neo4j client, connecting lazily on first write"""
+        if self.client is None:
+            from src.graph.neo4j_client import Neo4jClient
+            self.client = Neo4jClient(self.neo4j_uri, self.neo4j_user, self.neo4j_password)
+        return self.client
+    
+    # ------------------------------------------------------------------
+    # Streaming mode
+    # ------------------------------------------------------------------
+    
+    def _produce_raw(self, adapter: DataSourceAdapter, raw_queue: queue.Queue,
+                     stop: threading.Event):
+        """Producer thread: push an adapter's raw records onto the bounded queue"""
+        try:
+            for raw in adapter.iter_fetch():
+                while not stop.is_set():
+                    try:
+                        raw_queue.put((adapter, raw), timeout=0.5)
+                        break
+                    except queue.Full:
+                        continue
+                if stop.is_set():
+                    return
+        except Exception as e:
+            logger.error(f"✗ Error fetching from {adapter.source_name}: {e}")
+        finally:
+            raw_queue.put((adapter, _STREAM_END))
+    
+    def iter_raw_records(self, queue_size: int = 1000) -> Iterator[Tuple[DataSourceAdapter, Any]]:
+        """
+        Yield (adapter, raw_record) pairs while all adapters fetch concurrently.
+        
+        Each adapter runs in its own producer thread and blocks once
+        queue_size records are waiting, so fetching never runs further
+        ahead of parsing than the queue allows.
+        """
+        raw_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+        producers = [
+            threading.Thread(target=self._produce_raw, args=(adapter, raw_queue, stop),
+                             name=f"fetch-{adapter.source_name}", daemon=True)
+            for adapter in self.adapters
+        ]
+        for thread in producers:
+            thread.start()
+        
+        remaining = len(producers)
+        try:
+            while remaining:
+                adapter, raw = raw_queue.get()
+                if raw is _STREAM_END:
+                    remaining -= 1
+                    continue
+                self.results['total_fetched'] += 1
+                yield adapter, raw
+        finally:
+            stop.set()
+            # Drain so blocked producers can observe the stop flag
+            while any(thread.is_alive() for thread in producers):
+                try:
+                    raw_queue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+    
+    def iter_parse(self, records: Iterable[Tuple[DataSourceAdapter, Any]]) -> Iterator[Any]:
+        """
+        Generator stage: parse raw records into LegalDocuments and articles
+        
+        Articles of a law are yielded right after its LegalDocument, as
+        the adapter emits them. With a checkpoint, raw records up to the
+        adapter's committed position are skipped, and the position of
+        each fully parsed record is tracked in _stream_positions.
+        """
+        sequences: Dict[str, int] = {}
+        for adapter, raw in records:
+            source_name = adapter.source_name
+            sequence = sequences.get(source_name, -1) + 1
+            sequences[source_name] = sequence
+            if self.checkpoint is not None and sequence <= self.checkpoint.position(source_name):
+                self.results['skipped_checkpointed'] += 1
+                continue
+            try:
+                for item in adapter.iter_parse(raw):
+                    if isinstance(item, LegalDocument) or is_article_record(item):
+                        yield item
+            except Exception as e:
+                self.results['failed'] += 1
+                logger.error(f"✗ Error parsing record from {source_name}: {e}")
+                self._dead_letter('parse', e, record=raw, source=source_name, sequence=sequence)
+            if self._stream_positions is not None:
+                self._stream_positions[source_name] = sequence
+    
+    def iter_validate(self, documents: Iterable[Any]) -> Iterator[Any]:
+        """
+        Generator stage: yield only documents that pass validation
+        
+        Article records pass through unless their law was rejected.
+        """
+        rejected_law = None
+        for doc in documents:
+            if is_article_record(doc):
+                if doc['law_uri'] != rejected_law:
+                    yield doc
+                continue
+            
             is_valid, issues = self.validator.validate(doc)
+            doc.generate_document_hash()
             if is_valid:
                 self.results['total_validated'] += 1
+                yield doc
             else:
+                rejected_law = doc.eli_uri
                 self.results['failed'] += 1
                 logger.warning(f"✗ Validation failed for {doc.eli_uri}: {issues}")
+                self._dead_letter('validate', '; '.join(issues), record=doc.to_dict(),
+                                  source=doc.ingestion_source or None, eli_uri=doc.eli_uri)
+    
+    def _load_known_hashes(self) -> Dict[str, str]:
+        """Preload stored eli_uri → document_hash map in a single read"""
+        if self.known_hashes is None:
+            if self.manifest:
+                self.known_hashes = self.manifest.load()
+            else:
+                self.known_hashes = self._get_client().get_document_hashes()
+        return self.known_hashes
+    
+    def _save_known_hashes(self):
+        """Persist the hash map when a local manifest is used"""
+        if self.manifest and self.known_hashes is not None:
+            self.manifest.hashes = self.known_hashes
+            self.manifest.save()
+    
+    def iter_changed(self, documents: Iterable[Any]) -> Iterator[Any]:
+        """Generator stage: drop documents/articles whose content hash is already stored"""
+        known = self._load_known_hashes()
+        for doc in documents:
+            if is_article_record(doc):
+                if known.get(doc['eli_uri']) == doc['document_hash']:
+                    self.results['skipped_unchanged'] += 1
+                    continue
+                yield doc
+                continue
             
-            doc.generate_document_hash()
+            doc_hash = doc.document_hash or doc.generate_document_hash()
+            if known.get(doc.eli_uri) == doc_hash:
+                self.results['skipped_unchanged'] += 1
+                continue
+            yield doc
+    
+    def write_batch(self, items: List[Any]) -> Tuple[int, int]:
+        """Write one micro-batch of validated documents and articles to Neo4j"""
+        client = self._get_client()
+        documents = [item for item in items if isinstance(item, LegalDocument)]
+        articles = [item for item in items if is_article_record(item)]
+        success = failed = 0
+        written_uris: List[str] = []
         
-        logger.info(f"✓ Validated {self.results['total_validated']} / {len(self.documents)} documents")
+        if documents:
+            params = [doc.to_neo4j_params() for doc in documents]
+            written, doc_failed = client.ingest_documents_bulk(params, batch_size=len(params))
+            self.metrics.observe_batches(client.last_batch_stats)
+            self.results['total_ingested'] += written
+            success, failed = success + written, failed + doc_failed
+            if self.known_hashes is not None and not doc_failed:
+                for doc in documents:
+                    self.known_hashes[doc.eli_uri] = doc.document_hash
+            if doc_failed:
+                for doc in documents:
+                    self._dead_letter('write', f"document batch of {len(documents)} failed after retries",
+                                      record=doc.to_dict(), source=doc.ingestion_source or None,
+                                      eli_uri=doc.eli_uri)
+            else:
+                written_uris.extend(doc.eli_uri for doc in documents)
+        
+        if articles:
+            written, art_failed = client.ingest_articles_bulk(articles, batch_size=len(articles))
+            self.metrics.observe_batches(client.last_batch_stats)
+            self.results['articles_ingested'] += written
+            success, failed = success + written, failed + art_failed
+            if self.known_hashes is not None and not art_failed:
+                for article in articles:
+                    self.known_hashes[article['eli_uri']] = article['document_hash']
+            if art_failed:
+                for article in articles:
+                    self._dead_letter('write', f"article batch of {len(articles)} failed after retries",
+                                      record=article, eli_uri=article['eli_uri'])
+            else:
+                written_uris.extend(article['eli_uri'] for article in articles)
+            if self.concept_tagger is not None:
+                self.tag_articles(articles)
+        
+        self.results['failed'] += failed
+        if self.checkpoint is not None:
+            self.checkpoint.commit(written_uris, positions=self._stream_positions)
+        return success, failed
     
-    def ingest_stage(self):
-        """Stage 4: Write to Neo4j database"""
+    def tag_articles(self, articles: List[Dict]) -> int:
+        """
+        Write CONCERNS edges from the concept tagger for written articles
+        
+        Returns:
+            Number of edges written
+        """
+        client = self._get_client()
+        written_total = 0
+        for batch in self.concept_tagger.iter_concern_batches(articles, batch_size=self.batch_size):
+            written, _, failed = client.create_relationships_batch(batch, batch_size=len(batch))
+            self.metrics.observe_batches(client.last_batch_stats)
+            written_total += written
+            self.results['failed'] += failed
+        self.results['concepts_tagged'] += written_total
+        return written_total
+    
+    def citation_stage(self):
+        """Stage 6: Extract citations from validated articles and write CITES / IMPLEMENTS edges"""
+        from src.ingestion.citation_extractor import IdentifierIndex, iter_citation_edges
+        
+        documents = [d for d in self.documents if d.validation_status == ValidationStatus.PASSED]
+        passed_uris = {d.eli_uri for d in documents}
+        articles = [a for a in self.articles if a['law_uri'] in passed_uris]
+        if not articles:
+            logger.info("No articles to extract citations from")
+            return
+        
+        index = IdentifierIndex.from_documents(documents, articles)
+        stats: Dict[str, int] = {}
+        self._write_citations(iter_citation_edges(articles, index, processes=self.parse_processes,
+                                                  stats=stats))
+        self.results['citations_unresolved'] += stats['unresolved']
+        
+        logger.info(f"✓ Citations: {self.results['citations_written']} edges written from "
+                    f"{stats['articles']} articles ({stats['unresolved']} unresolved references)")
+    
+    def _write_citations(self, edge_lists: Iterable[List[Tuple]]) -> int:
+        """Write CITES / IMPLEMENTS edge lists in groups of batch_size, returns edges written"""
+        client = self._get_client()
+        pending: List[Tuple] = []
+        written_total = 0
+        
+        def flush():
+            nonlocal written_total
+            written, missing, failed = client.create_relationships_batch(pending, batch_size=self.batch_size)
+            self.metrics.observe_batches(client.last_batch_stats)
+            self.results['citations_written'] += written
+            self.results['failed'] += failed
+            written_total += written
+            pending.clear()
+        
+        for edges in edge_lists:
+            self.results['citations_found'] += len(edges)
+            pending.extend(edges)
+            if len(pending) >= self.batch_size:
+                flush()
+        if pending:
+            flush()
+        return written_total
+    
+    def stream_citations(self, batch: List[Any], index) -> int:
+        """
+        Extract and write citations of one written streaming batch
+        
+        The batch's documents and articles are added to index first, so
+        references between them resolve. References to a law that the
+        stream has not written yet stay unresolved; run citation_stage
+        (or run()) over the full corpus to pick those up.
+        
+        Args:
+            batch: Items passed to write_batch
+            index: IdentifierIndex kept for the whole stream
+            
+        Returns:
+            Edges written
+        """
+        from src.ingestion.citation_extractor import iter_citation_edges
+        
+        articles = [item for item in batch if is_article_record(item)]
+        for item in batch:
+            if isinstance(item, LegalDocument):
+                index.add_document(item.eli_uri, item.source_type.value, item.celex_number, item.ecli)
+        for article in articles:
+            index.add_article(article['eli_uri'])
+        if not articles:
+            return 0
+        
+        # One micro-batch is too small to amortize a process pool
+        stats: Dict[str, int] = {}
+        written = self._write_citations(iter_citation_edges(articles, index, processes=1, stats=stats))
+        self.results['citations_unresolved'] += stats['unresolved']
+        return written
+    
+    def load_eurovoc(self, dump_path: str, languages: Tuple[str, ...] = ('de', 'en'),
+                     batch_size: int = 1000) -> Tuple[int, int]:
+        """
+        Bulk-load EuroVoc concepts and their hierarchy from a local SKOS dump
+        
+        Args:
+            dump_path: SKOS RDF/XML file
+            languages: Label languages to keep
+            batch_size: Concepts per UNWIND statement
+            
+        Returns:
+            (concepts ingested, failed)
+        """
+        client = self._get_client()
+        adapter = EuroVocAdapter(dump_path, languages=languages)
+        with self.metrics.stage('concepts') as stage:
+            written, failed = client.ingest_concepts_bulk(
+                adapter.iter_skos_concepts(dump_path), batch_size=batch_size)
+            stage['items'] += written
+        self.metrics.observe_batches(client.last_batch_stats)
+        self.results['concepts_ingested'] += written
+        self.results['failed'] += failed
+        return written, failed
+    
+    @staticmethod
+    def _embedding_text(article: Dict) -> str:
+        """Text that is embedded for an article"""
+        return f"{article.get('title') or ''}\n{article.get('text_content') or ''}".strip()
+    
+    def embed_articles(self, articles: List[Dict]) -> int:
+        """
+        Embed articles whose text changed and write the vectors in bulk
+        
+        The stored embedding_text_hash map is loaded once per run, so
+        articles with unchanged text are skipped without calling the
+        embedder.
+        
+        Returns:
+            Number of vectors written
+        """
+        from src.llm.embedding_generator import text_hash
+        
+        client = self._get_client()
+        if self.embedding_hashes is None:
+            self.embedding_hashes = client.get_embedding_hashes('Article')
+        
+        pending = []
+        for article in articles:
+            text = self._embedding_text(article)
+            digest = text_hash(text)
+            if self.embedding_hashes.get(article['eli_uri']) == digest:
+                self.results['embeddings_unchanged'] += 1
+                continue
+            pending.append((article['eli_uri'], text, digest))
+        
+        written_total = 0
+        for batch in iter_batches(pending, self.embedding_batch_size):
+            vectors = self.embedder.embed([text for _, text, _ in batch])
+            rows = [
+                {'eli_uri': uri, 'embedding': vector.tolist(), 'text_hash': digest}
+                for (uri, _, digest), vector in zip(batch, vectors)
+            ]
+            written, failed = client.write_embeddings_bulk(rows, batch_size=len(rows))
+            self.metrics.observe_batches(client.last_batch_stats)
+            written_total += written
+            self.results['failed'] += failed
+            if not failed:
+                for uri, _, digest in batch:
+                    self.embedding_hashes[uri] = digest
+        
+        self.results['articles_embedded'] += written_total
+        return written_total
+    
+    def embedding_stage(self):
+        """Stage 5: Embed article text for the article_embeddings vector index"""
+        if self.embedder is None:
+            return
+        
         logger.info("=" * 60)
-        logger.info("STAGE 4: INGEST - Writing to Neo4j")
+        logger.info("STAGE 5: EMBED - Writing article vectors")
         logger.info("=" * 60)
         
-        # TODO: Implement Neo4j connection and bulk insert
-        logger.info(f"✓ Ingested {self.results['total_validated']} documents")
+        passed_uris = {d.eli_uri for d in self.documents
+                       if d.validation_status == ValidationStatus.PASSED}
+        articles = [a for a in self.articles if a['law_uri'] in passed_uris]
+        written = self.embed_articles(articles)
+        logger.info(f"✓ Embedded {written} articles "
+                    f"({self.results['embeddings_unchanged']} unchanged)")
+    
+    def run_streaming(self, batch_size: Optional[int] = None, queue_size: int = 1000,
+                      resume: bool = False):
+        """
+        Execute the pipeline as a stream of bounded micro-batches.
+        
+        fetch → parse → validate are chained generators, so at most
+        queue_size raw records and one batch of documents are held in
+        memory, and the first batch reaches Neo4j while adapters are
+        still fetching. self.documents is not populated in this mode.
+        
+        With a checkpoint, every written batch also commits each adapter's
+        position (its last fully parsed raw record); a resumed run skips
+        raw records up to that position without parsing them and skips
+        already written items of the partially committed record.
+        
+        With extract_citations, citations of each written batch are
+        extracted right after it (see stream_citations).
+        
+        Args:
+            batch_size: Documents per Neo4j write (defaults to self.batch_size)
+            queue_size: Raw records buffered between fetch and parse
+            resume: Continue from self.checkpoint
+        """
+        logger.info("\n" + "=" * 60)
+        logger.info("EU_GraphRAG DATA INGESTION PIPELINE (streaming)")
+        logger.info("=" * 60 + "\n")
+        
+        self.metrics = self._new_metrics()
+        self._open_checkpoint(resume)
+        if self.checkpoint is not None:
+            self._stream_positions = {}
+        
+        records = self.iter_raw_records(queue_size=queue_size)
+        documents = self.iter_validate(self.iter_parse(records))
+        if self.checkpoint is not None:
+            documents = self.iter_unwritten(documents)
+        if self.incremental:
+            documents = self.iter_changed(documents)
+        
+        # Seeded with what is already in the graph and extended by every
+        # written batch; holds identifiers only, never article texts
+        citation_index = None
+        if self.extract_citations:
+            from src.ingestion.citation_extractor import IdentifierIndex
+            citation_index = IdentifierIndex.from_neo4j(self._get_client())
+        
+        # fetch/parse/validate run interleaved inside the generator chain,
+        # so only time spent writing is attributed to a stage of its own
+        with self.metrics.stage('stream') as stream:
+            for batch in iter_batches(documents, batch_size or self.batch_size):
+                with self.metrics.stage('write') as stage:
+                    self.write_batch(batch)
+                    stage['items'] += len(batch)
+                if self.embedder is not None:
+                    articles = [item for item in batch if is_article_record(item)]
+                    with self.metrics.stage('embed') as stage:
+                        self.embed_articles(articles)
+                        stage['items'] += len(articles)
+                if citation_index is not None:
+                    with self.metrics.stage('citations') as stage:
+                        stage['items'] += self.stream_citations(batch, citation_index)
+            stream['items'] = self.results['total_ingested'] + self.results['articles_ingested']
+        
+        if self.incremental:
+            self._save_known_hashes()
+        if self.raw_cache:
+            self.raw_cache.flush()
+        if self.checkpoint is not None:
+            self.checkpoint.mark_stage('stream', stream['items'])
+            self._stream_positions = None
+        
+        self._close_checkpoint()
+        self._finish_metrics()
     
-    def run(self):
-        """Execute full pipeline"""
+    def replay_dead_letters(self) -> Dict[str, int]:
+        """
+        Retry the records in the checkpoint's dead-letter file
+        
+        Documents are validated again (so fixed validation rules or a
+        hand-corrected record in the file take effect) and written with
+        their articles; parse failures are re-parsed by the registered
+        adapter of their source when the raw record was stored. Records
+        that fail again go to a fresh dead-letter file with attempts
+        increased; entries that cannot be retried are carried over.
+        
+        Returns:
+            Counts of replayed, written and still failing records
+        """
+        if self.checkpoint is None:
+            raise ValueError("replay_dead_letters requires a CheckpointStore (checkpoint=...)")
+        
+        self.metrics = self._new_metrics()
+        self.checkpoint.load()
+        entries = self.checkpoint.take_dead_letters()
+        adapters = {adapter.source_name: adapter for adapter in self.adapters}
+        failed_before = self.results['dead_letters']
+        self._replay_attempts = {}
+        items: List[Any] = []
+        kept = 0
+        
+        for entry in entries:
+            record = entry.get('record')
+            attempts = entry.get('attempts', 1)
+            key = entry.get('eli_uri') or (entry.get('source'), entry.get('sequence'))
+            self._replay_attempts[key] = attempts
+            adapter = adapters.get(entry.get('source'))
+            if record is None or (entry['stage'] == 'parse' and adapter is None):
+                # Nothing to retry with: keep the entry for inspection
+                kept += 1
+                self.checkpoint.add_dead_letter(
+                    entry['stage'], entry['error'], source=entry.get('source'),
+                    eli_uri=entry.get('eli_uri'), sequence=entry.get('sequence'), attempts=attempts)
+                continue
+            try:
+                if entry['stage'] == 'parse':
+                    items.extend(item for item in adapter.iter_parse(record)
+                                 if isinstance(item, LegalDocument) or is_article_record(item))
+                elif is_article_record(record):
+                    items.append(record)
+                else:
+                    items.append(LegalDocument.from_dict(record))
+            except Exception as e:
+                self._dead_letter(
+                    entry['stage'], str(e), record=record, source=entry.get('source'),
+                    eli_uri=entry.get('eli_uri'), sequence=entry.get('sequence'))
+        
+        written_before = self.results['total_ingested'] + self.results['articles_ingested']
+        with self.metrics.stage('replay') as stage:
+            for batch in iter_batches(self.iter_validate(items), self.batch_size):
+                self.write_batch(batch)
+            stage['items'] = self.results['total_ingested'] + self.results['articles_ingested'] - written_before
+        
+        self.checkpoint.finish_replay()
+        self.checkpoint.close()
+        self._replay_attempts = {}
+        summary = {
+            'replayed': len(entries),
+            'written': stage['items'],
+            'failed_again': self.results['dead_letters'] - failed_before,
+            'kept': kept,
+        }
+        logger.info(f"✓ Replayed {summary['replayed']} dead letters: {summary['written']} items written, "
+                    f"{summary['failed_again']} failed again, {kept} kept (no record to retry)")
+        self._finish_metrics()
+        return summary
+
+    def run_bulk_export(self, output_dir: str = "data/processed/bulk_import",
+                        concepts: Iterable[Dict] = (), relationships: Iterable[Tuple] = (),
+                        rows_per_file: int = 1_000_000, queue_size: int = 1000) -> Dict:
+        """
+        Stream validated documents into neo4j-admin import CSV files
+        instead of writing them to Neo4j.
+
+        Intended for the first load into an empty database or a full
+        rebuild; run the generated neo4j-admin-import.sh against the
+        stopped database afterwards, then apply the schema and run
+        Neo4jClient.rebuild_transposition_index().
+
+        Args:
+            output_dir: Directory for the CSV files and import script
+            concepts: EuroVoc concept dicts (keyed by eurovoc_id, e.g. from
+                      EuroVocAdapter.iter_skos_concepts)
+            relationships: Tuples as accepted by Neo4jClient.create_relationships_batch
+            rows_per_file: Rows per data file before rotating
+            queue_size: Raw records buffered between fetch and parse
+
+        Returns:
+            Row counts per label and relationship type, rows the import
+            will skip, and the import command
+        """
+        from src.ingestion.bulk_export import BulkImportExporter
+
+        logger.info("\n" + "=" * 60)
+        logger.info("EU_GraphRAG DATA INGESTION PIPELINE (bulk export)")
+        logger.info("=" * 60 + "\n")
+
+        self.metrics = self._new_metrics()
+        exporter = BulkImportExporter(output_dir, rows_per_file=rows_per_file)
+
+        records = self.iter_raw_records(queue_size=queue_size)
+        with exporter, self.metrics.stage('export') as stage:
+            for item in self.iter_validate(self.iter_parse(records)):
+                exporter.add(item)
+                stage['items'] += 1
+                if self.concept_tagger is not None and is_article_record(item):
+                    for relationship in self.concept_tagger.tag_article(item):
+                        exporter.add_relationship(relationship)
+            for concept in concepts:
+                exporter.add_concept(concept)
+            for relationship in relationships:
+                exporter.add_relationship(relationship)
+            summary = exporter.close()
+
+        if self.raw_cache:
+            self.raw_cache.flush()
+        self._finish_metrics()
+        for label, count in summary['nodes'].items():
+            logger.info(f"  nodes {label}: {count}")
+        for rel_type, count in summary['relationships'].items():
+            logger.info(f"  relationships {rel_type}: {count}")
+        if summary['skipped']['duplicate_nodes']:
+            logger.info(f"  skipped duplicate nodes: {summary['skipped']['duplicate_nodes']}")
+        for rel_type, count in summary['skipped']['relationships'].items():
+            logger.info(f"  skipped relationships {rel_type}: {count}")
+        return summary
+
+    def run(self, resume: bool = False):
+        """
+        Execute full pipeline
+        
+        Args:
+            resume: Continue from self.checkpoint. Fetch, parse and validate
+                    run again (served from raw_cache when one is set), written
+                    documents and articles are skipped and completed stages
+                    after ingest are not repeated.
+        """
         logger.info("\n" + "=" * 60)
         logger.info("EU_GraphRAG DATA INGESTION PIPELINE")
         logger.info("=" * 60 + "\n")
         
-        start_time = datetime.now()
+        self.metrics = self._new_metrics()
+        self._open_checkpoint(resume)
         
-        self.fetch_stage()
-        self.parse_stage()
-        self.validate_stage()
-        self.ingest_stage()
+        with self.metrics.stage('fetch') as stage:
+            self.fetch_stage()
+            stage['items'] = self.results['total_fetched']
+        with self.metrics.stage('parse') as stage:
+            self.parse_stage()
+            stage['items'] = len(self.documents) + len(self.articles)
+        with self.metrics.stage('validate') as stage:
+            self.validate_stage()
+            stage['items'] = len(self.documents)
+        with self._checkpointed_stage('ingest') as stage:
+            if stage is not None:
+                self.ingest_stage()
+                stage['items'] = self.results['total_ingested'] + self.results['articles_ingested']
+        with self._checkpointed_stage('embed') as stage:
+            if stage is not None:
+                self.embedding_stage()
+                stage['items'] = self.results['articles_embedded']
+        if self.extract_citations:
+            with self._checkpointed_stage('citations') as stage:
+                if stage is not None:
+                    self.citation_stage()
+                    stage['items'] = self.results['citations_written']
         
-        end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+        self._close_checkpoint()
+        self._finish_metrics()
+    
+    def _open_checkpoint(self, resume: bool):
+        """Load the checkpoint to resume from, or clear it for a fresh run"""
+        if self.checkpoint is None:
+            if resume:
+                raise ValueError("resume=True requires a CheckpointStore (checkpoint=...)")
+            return
+        if resume:
+            self.checkpoint.load()
+        else:
+            self.checkpoint.reset()
+    
+    def _close_checkpoint(self):
+        if self.checkpoint is not None:
+            self.checkpoint.close()
+            if self.results['skipped_checkpointed']:
+                logger.info(f"✓ Resumed: {self.results['skipped_checkpointed']} items "
+                            f"already written before the checkpoint")
+    
+    @contextmanager
+    def _checkpointed_stage(self, name: str):
+        """
+        Metrics stage that is skipped when the checkpoint marks it complete
         
-        self._print_summary(duration)
+        Yields the stage dict, or None if the stage was already completed;
+        a stage that finishes without raising is marked complete.
+        """
+        if self.checkpoint is not None and self.checkpoint.stage_done(name):
+            logger.info(f"✓ Stage {name} already completed (checkpoint), skipping")
+            yield None
+            return
+        with self.metrics.stage(name) as stage:
+            yield stage
+        if self.checkpoint is not None:
+            self.checkpoint.mark_stage(name, stage['items'])
+    
+    def _new_metrics(self) -> PipelineMetrics:
+        """Fresh metrics for one run (profiles go next to the reports)"""
+        profile_dir = Path(self.metrics_dir or "data/processed/metrics") / "profiles"
+        return PipelineMetrics(self.profile_stages, profile_dir=str(profile_dir))
+    
+    def _finish_metrics(self):
+        """Close the run's metrics, print the summary and write reports"""
+        self.metrics.record_adapters(self.results['adapter_timings'])
+        self.metrics.finish()
+        self._print_summary(self.metrics.duration)
+        if self.metrics_dir:
+            self.metrics.write(self.metrics_dir, self.results)
     
     def _print_summary(self, duration: float):
         """Print execution summary"""
@@ -453,26 +2105,71 @@ class DataIngestionPipeline:
         logger.info(f"Total fetched:     {self.results['total_fetched']}")
         logger.info(f"Total validated:   {self.results['total_validated']}")
         logger.info(f"Total ingested:    {self.results['total_ingested']}")
+        logger.info(f"Articles ingested: {self.results['articles_ingested']}")
+        logger.info(f"Articles embedded: {self.results['articles_embedded']}")
+        logger.info(f"Concepts ingested: {self.results['concepts_ingested']}")
+        logger.info(f"Concepts tagged:   {self.results['concepts_tagged']}")
+        logger.info(f"Citations written: {self.results['citations_written']} "
+                    f"/ {self.results['citations_found']} found "
+                    f"({self.results['citations_unresolved']} unresolved)")
+        logger.info(f"Skipped unchanged: {self.results['skipped_unchanged']}")
+        if self.checkpoint is not None:
+            logger.info(f"Skipped (resumed): {self.results['skipped_checkpointed']}")
+            logger.info(f"Dead letters:      {self.results['dead_letters']} "
+                        f"({self.checkpoint.dead_letter_path})")
         logger.info(f"Failed:            {self.results['failed']}")
         logger.info(f"Warnings:          {self.results['warnings']}")
+        for issue, count in sorted(self.results['validation_issues'].items()):
+            logger.info(f"  {issue}: {count}")
+        for source_name, timing in self.results['adapter_timings'].items():
+            logger.info(f"  {source_name}: {timing['records']} records in {timing['seconds']:.2f}s")
+        for name, stage in self.metrics.stages.items():
+            rate = f" ({stage['items'] / stage['seconds']:.0f}/s)" if stage['seconds'] and stage['items'] else ""
+            logger.info(f"  stage {name}: {stage['seconds']:.2f}s{rate}")
+        peak_rss = peak_rss_bytes()
+        if peak_rss:
+            logger.info(f"Peak RSS:          {peak_rss / 1024 ** 2:.0f} MB")
         logger.info(f"Duration:          {duration:.2f} seconds")
         logger.info("=" * 60 + "\n")
 
 
 # Example usage
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="EU_GraphRAG data ingestion pipeline")
+    parser.add_argument("mode", nargs="?", default="info",
+                        choices=("info", "run", "resume", "replay-dead-letters"),
+                        help="resume continues the last checkpointed run; "
+                             "replay-dead-letters retries failed records")
+    parser.add_argument("--streaming", action="store_true", help="Use run_streaming")
+    parser.add_argument("--checkpoint-dir", default=DEFAULT_CHECKPOINT_DIR)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--uri", default=os.environ.get("NEO4J_URI", "bolt://localhost:7687"))
+    parser.add_argument("--user", default=os.environ.get("NEO4J_USER", "neo4j"))
+    parser.add_argument("--password", default=os.environ.get("NEO4J_PASSWORD", "password"))
+    args = parser.parse_args()
+    
     # Initialize pipeline
-    pipeline = DataIngestionPipeline()
+    pipeline = DataIngestionPipeline(
+        neo4j_uri=args.uri, neo4j_user=args.user, neo4j_password=args.password,
+        batch_size=args.batch_size, raw_cache=RawFetchCache(),
+        checkpoint=CheckpointStore(args.checkpoint_dir),
+    )
     
     # Register adapters
     pipeline.register_adapter(GesetzImInternetAdapter())
     pipeline.register_adapter(EURLexAdapter())
     pipeline.register_adapter(EuroVocAdapter())
     
-    # Run pipeline
-    # pipeline.run()
-    
-    # For now, just show the structure
-    logger.info("Pipeline initialized with 3 adapters")
-    logger.info("To run: python src/ingestion/pipeline.py")
-
+    if args.mode == "replay-dead-letters":
+        pipeline.replay_dead_letters()
+    elif args.mode in ("run", "resume"):
+        resume = args.mode == "resume"
+        if args.streaming:
+            pipeline.run_streaming(resume=resume)
+        else:
+            pipeline.run(resume=resume)
+    else:
+        logger.info("Pipeline initialized with 3 adapters")
+        logger.info("To run: python -m src.ingestion.pipeline run [--streaming]")
@@ -0,0 +1,335 @@
+"""
+Raw Fetch Cache for EU_GraphRAG source adapters
+
+Content-addressed on-disk cache under data/raw shared by every
+DataSourceAdapter. Response bodies are stored once per SHA-256 of their
+content; an index maps request keys to bodies together with their
+validators (ETag, Last-Modified or a SPARQL query hash).
+
+Layout:
+  data/raw/index.json           request key → entry metadata
+  data/raw/objects/ab/abcd...   response bodies by content hash
+"""
+
+import os
+import json
+import hashlib
+import logging
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# SPARQL results carry no validators; re-run a query once its result is
+# older than this (short enough that every nightly run sees new acts)
+DEFAULT_SPARQL_MAX_AGE = 12 * 3600.0
+
+
+class CacheMiss(Exception):
+    """Raised in offline mode when a request is not in the cache"""
+
+
+class RawFetchCache:
+    """Size-bounded, content-addressed cache for raw source responses"""
+
+    def __init__(self, root: str = "data/raw", max_bytes: int = 5 * 1024 ** 3,
+                 offline: bool = False, flush_every: int = 100):
+        """
+        Initialize cache
+
+        Args:
+            root: Cache directory
+            max_bytes: Total body size before least-recently-used entries are evicted
+            offline: Never touch the network; serve from cache or raise CacheMiss
+            flush_every: Persist the index after this many writes
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.index_path = self.root / "index.json"
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.flush_every = flush_every
+
+        self.index: Dict[str, Dict] = {}
+        self._refs: Dict[str, int] = {}  # body_hash → number of index entries
+        self._total_bytes = 0
+        self.stats = {'hits': 0, 'revalidated': 0, 'downloaded': 0, 'misses': 0, 'evicted': 0}
+        self._dirty = 0
+        self._lock = threading.RLock()
+        self._session = None
+
+        self._load_index()
+
+    def __getstate__(self):
+        # Locks and HTTP sessions cannot cross process boundaries
+        state = self.__dict__.copy()
+        state['_lock'] = None
+        state['_session'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Index and object store
+    # ------------------------------------------------------------------
+
+    def _load_index(self):
+        """Load index from disk (empty if the cache is new)"""
+        if self.index_path.exists():
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+            logger.info(f"Loaded raw cache index ({len(self.index)} entries) from {self.root}")
+        for entry in self.index.values():
+            self._add_ref(entry)
+
+    def _add_ref(self, entry: Dict):
+        body_hash = entry['body_hash']
+        if body_hash not in self._refs:
+            self._refs[body_hash] = 0
+            self._total_bytes += entry['size']
+        self._refs[body_hash] += 1
+
+    def _drop_ref(self, entry: Dict):
+        """Release an entry's body, deleting it once nothing references it"""
+        body_hash = entry['body_hash']
+        self._refs[body_hash] -= 1
+        if self._refs[body_hash] == 0:
+            del self._refs[body_hash]
+            self._total_bytes -= entry['size']
+            try:
+                self._object_path(body_hash).unlink()
+            except FileNotFoundError:
+                pass
+
+    def flush(self):
+        """Atomically persist the index"""
+        with self._lock:
+            if not self._dirty:
+                return
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f)
+            os.replace(tmp_path, self.index_path)
+            self._dirty = 0
+
+    @staticmethod
+    def key_for(url: str, params: Optional[Dict] = None, body: Optional[str] = None) -> str:
+        """Build request key from URL, query parameters and request body"""
+        canonical = json.dumps([url, sorted((params or {}).items()), body], default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _object_path(self, body_hash: str) -> Path:
+        return self.objects_dir / body_hash[:2] / body_hash
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return index entry for key, or None"""
+        with self._lock:
+            return self.index.get(key)
+
+    def read(self, key: str, entry: Dict) -> Optional[bytes]:
+        """
+        Read a cached body and mark its entry as recently used
+
+        Returns:
+            The body, or None if it was evicted concurrently (the entry is
+            then dropped and the request counts as a miss)
+        """
+        try:
+            with open(self._object_path(entry['body_hash']), 'rb') as f:
+                body = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                if self.index.get(key) is entry:
+                    del self.index[key]
+                    self._drop_ref(entry)
+                    self._dirty += 1
+                self.stats['misses'] += 1
+            return None
+        with self._lock:
+            entry['last_access'] = time.time()
+            self._dirty += 1
+        return body
+
+    def store(self, key: str, body: bytes, url: str, etag: Optional[str] = None,
+              last_modified: Optional[str] = None, validator: Optional[str] = None) -> Dict:
+        """Store a response body under its content hash"""
+        body_hash = hashlib.sha256(body).hexdigest()
+        path = self._object_path(body_hash)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique temp name: concurrent fetches may store the same body
+            with tempfile.NamedTemporaryFile(dir=path.parent, prefix=body_hash[:8],
+                                             suffix='.tmp', delete=False) as f:
+                f.write(body)
+            os.replace(f.name, path)
+
+        now = time.time()
+        entry = {
+            'url': url,
+            'body_hash': body_hash,
+            'size': len(body),
+            'etag': etag,
+            'last_modified': last_modified,
+            'validator': validator,
+            'stored_at': now,
+            'last_access': now,
+        }
+        with self._lock:
+            previous = self.index.get(key)
+            self.index[key] = entry
+            self._add_ref(entry)
+            if previous:
+                self._drop_ref(previous)
+            self._dirty += 1
+            self._evict()
+            if self._dirty >= self.flush_every:
+                self.flush()
+        return entry
+
+    def total_bytes(self) -> int:
+        """Total size of distinct cached bodies"""
+        return self._total_bytes
+
+    def _evict(self):
+        """Drop least-recently-used entries until the cache fits max_bytes"""
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        for key, entry in sorted(self.index.items(), key=lambda kv: kv[1]['last_access']):
+            if self._total_bytes <= self.max_bytes:
+                break
+            del self.index[key]
+            self._drop_ref(entry)
+            self.stats['evicted'] += 1
+        self._dirty += 1
+
+    # ------------------------------------------------------------------
+    # Network access with revalidation
+    # ------------------------------------------------------------------
+
+    def _http(self):
+        if self._session is None:
+            try:
+                import requests
+            except ImportError:
+                raise ImportError("requests package required. Install: pip install requests")
+            self._session = requests.Session()
+        return self._session
+
+    def _offline_read(self, key: str, url: str) -> bytes:
+        entry = self.get(key)
+        body = self.read(key, entry) if entry is not None else None
+        if body is None:
+            if entry is None:
+                self.stats['misses'] += 1
+            raise CacheMiss(f"Not cached (offline mode): {url}")
+        self.stats['hits'] += 1
+        return body
+
+    def fetch(self, url: str, params: Optional[Dict] = None, timeout: float = 30.0,
+              before_request: Optional[Callable[[], None]] = None) -> bytes:
+        """
+        GET a URL, revalidating a cached copy with ETag/Last-Modified
+
+        Args:
+            url: Resource URL
+            params: Query parameters
+            timeout: Request timeout in seconds
+            before_request: Called right before a network request (e.g. rate limiting)
+
+        Returns:
+            Response body
+        """
+        key = self.key_for(url, params)
+        if self.offline:
+            return self._offline_read(key, url)
+
+        entry = self.get(key)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        if before_request:
+            before_request()
+        try:
+            response = self._http().get(url, params=params, headers=headers, timeout=timeout)
+        except Exception as e:
+            body = self.read(key, entry) if entry else None
+            if body is not None:
+                logger.warning(f"⚠ Revalidation failed for {url} ({e}); serving cached copy")
+                self.stats['hits'] += 1
+                return body
+            raise
+
+        if response.status_code == 304 and entry:
+            body = self.read(key, entry)
+            if body is None:
+                # Evicted meanwhile; the entry is gone, so this is a plain GET
+                return self.fetch(url, params, timeout, before_request)
+            self.stats['revalidated'] += 1
+            return body
+
+        response.raise_for_status()
+        body = response.content
+        self.store(key, body, url,
+                   etag=response.headers.get('ETag'),
+                   last_modified=response.headers.get('Last-Modified'))
+        self.stats['downloaded'] += 1
+        return body
+
+    def fetch_sparql(self, endpoint: str, query: str,
+                     max_age: Optional[float] = DEFAULT_SPARQL_MAX_AGE,
+                     timeout: float = 120.0,
+                     before_request: Optional[Callable[[], None]] = None) -> bytes:
+        """
+        Run a SPARQL query, keyed and validated by the query hash
+
+        SPARQL endpoints rarely send validators, so an identical query is
+        served from cache until it is older than max_age seconds
+        (default DEFAULT_SPARQL_MAX_AGE, None = never expires).
+
+        Args:
+            endpoint: SPARQL endpoint URL
+            query: SPARQL query string
+            max_age: Maximum age of a cached result in seconds
+            timeout: Request timeout in seconds
+            before_request: Called right before a network request
+
+        Returns:
+            Response body (SPARQL JSON results)
+        """
+        validator = hashlib.sha256(query.encode()).hexdigest()
+        key = self.key_for(endpoint, body=query)
+        if self.offline:
+            return self._offline_read(key, endpoint)
+
+        entry = self.get(key)
+        if entry and entry.get('validator') == validator:
+            if max_age is None or time.time() - entry['stored_at'] < max_age:
+                body = self.read(key, entry)
+                if body is not None:
+                    self.stats['hits'] += 1
+                    return body
+
+        if before_request:
+            before_request()
+        response = self._http().post(
+            endpoint,
+            data={'query': query},
+            headers={'Accept': 'application/sparql-results+json'},
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        body = response.content
+        self.store(key, body, endpoint, validator=validator)
+        self.stats['downloaded'] += 1
+        return body
@@ -0,0 +1,97 @@
+"""
+Embedding Generator for EU_GraphRAG
+
+Pluggable text embedders producing float32 vectors for the
+article_embeddings and concept_embeddings vector indexes
+(see ontologies/graph-schema.cypher, 1536 dimensions, cosine).
+"""
+
+import hashlib
+import logging
+import re
+from typing import List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("numpy package required. Install: pip install numpy")
+
+logger = logging.getLogger(__name__)
+
+# Must match `vector.dimensions` of the vector indexes
+EMBEDDING_DIMENSIONS = 1536
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def text_hash(text: str) -> str:
+    """SHA-256 of the embedded text, stored next to the vector"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class Embedder:
+    """Base class for text embedders"""
+    
+    dimensions: int = EMBEDDING_DIMENSIONS
+    
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed a batch of texts
+        
+        Returns:
+            float32 array of shape (len(texts), dimensions), L2-normalized
+        """
+        raise NotImplementedError
+    
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (vectors / norms).astype(np.float32, copy=False)
+
+
+class HashingEmbedder(Embedder):
+    """
+    Deterministic local embedder based on signed feature hashing
+    
+    Needs no model or network, so offline tests and benchmarks get stable
+    vectors; texts sharing tokens get a positive cosine similarity.
+    """
+    
+    def __init__(self, dimensions: int = EMBEDDING_DIMENSIONS):
+        self.dimensions = dimensions
+    
+    def _token_slot(self, token: str):
+        digest = hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest()
+        value = int.from_bytes(digest, 'little')
+        return value % self.dimensions, 1.0 if value >> 63 else -1.0
+    
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            slots = [self._token_slot(t) for t in _TOKEN_PATTERN.findall(text.lower())]
+            if slots:
+                indices, signs = zip(*slots)
+                np.add.at(vectors[row], list(indices), signs)
+        return self._normalize(vectors)
+
+
+class OpenAIEmbedder(Embedder):
+    """Embedder backed by the OpenAI embeddings API"""
+    
+    def __init__(self, model: str = "text-embedding-3-small",
+                 dimensions: int = EMBEDDING_DIMENSIONS, api_key: Optional[str] = None):
+        try:
+            from openai import OpenAI
+        except ImportError:
+            raise ImportError("openai package required. Install: pip install openai")
+        
+        self.model = model
+        self.dimensions = dimensions
+        self.client = OpenAI(api_key=api_key)
+    
+    def embed(self, texts: List[str]) -> np.ndarray:
+        response = self.client.embeddings.create(model=self.model, input=texts,
+                                                 dimensions=self.dimensions)
+        vectors = np.array([item.embedding for item in response.data], dtype=np.float32)
+        return self._normalize(vectors)
@@ -0,0 +1,343 @@
+"""
+Local Vector Search for EU_GraphRAG
+
+Exact cosine top-k search over embeddings stored under data/embeddings,
+used for offline evaluation and for nodes the Neo4j vector indexes do
+not cover. Scores use the scale of Neo4j's cosine vector indexes,
+(1 + cosine) / 2 in [0, 1], so hits of both backends are comparable.
+Plugs into Neo4jClient.vector_search / hybrid_search via
+Neo4jClient.set_vector_backend().
+
+Layout (per index name):
+  data/embeddings/<name>.f32        float32 matrix, one L2-normalized row per node
+  data/embeddings/<name>.ids.json   dimensions, eli_uri ids and filter columns
+"""
+
+import os
+import json
+import logging
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("numpy package required. Install: pip install numpy")
+
+logger = logging.getLogger(__name__)
+
+# Rows scored per matrix multiplication; bounds memory of the score block
+DEFAULT_CHUNK_ROWS = 65536
+
+EMBEDDINGS_EXPORT_QUERY = """
+MATCH (n:{label})
+WHERE n.{property} IS NOT NULL
+OPTIONAL MATCH (n)-[:BELONGS_TO]->(law)
+WITH n, head(collect(law)) AS law
+RETURN
+    n.eli_uri as uri,
+    coalesce(n.title_de, n.title, n.pref_label_de) as title,
+    coalesce(n.source_type, law.source_type) as doc_type,
+    toString(coalesce(n.date_document, law.date_document)) as doc_date,
+    n.{property} as embedding
+"""
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _iso(value: Union[str, date, None]) -> Optional[str]:
+    return value.isoformat() if isinstance(value, date) else value
+
+
+class VectorIndexWriter:
+    """
+    Append embeddings to a local index without holding them in memory
+
+    Rows are normalized and written to the matrix file as they arrive;
+    the id table is written on close().
+    """
+
+    def __init__(self, root: str = "data/embeddings", name: str = "article_embeddings"):
+        self.root = Path(root)
+        self.name = name
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.matrix_path = self.root / f"{name}.f32"
+        self.table_path = self.root / f"{name}.ids.json"
+        self._tmp_path = self.matrix_path.with_suffix('.f32.tmp')
+        self._file = open(self._tmp_path, 'wb')
+        self.dimensions: Optional[int] = None
+        self.ids: List[str] = []
+        self.titles: List[Optional[str]] = []
+        self.doc_types: List[Optional[str]] = []
+        self.doc_dates: List[Optional[str]] = []
+
+    def add(self, ids: Sequence[str], vectors, titles: Optional[Sequence] = None,
+            doc_types: Optional[Sequence] = None, doc_dates: Optional[Sequence] = None):
+        """
+        Append a batch of embeddings
+
+        Args:
+            ids: ELI URIs, one per vector
+            vectors: Array-like of shape (len(ids), dimensions)
+            titles: Optional titles returned with hits
+            doc_types: Optional source_type values for filtering
+            doc_dates: Optional ISO date_document values for filtering
+        """
+        vectors = _normalize_rows(vectors)
+        if vectors.ndim != 2 or len(vectors) != len(ids):
+            raise ValueError(f"Expected {len(ids)} vectors, got shape {vectors.shape}")
+        if self.dimensions is None:
+            self.dimensions = vectors.shape[1]
+        elif vectors.shape[1] != self.dimensions:
+            raise ValueError(f"Dimension mismatch: {vectors.shape[1]} != {self.dimensions}")
+
+        self._file.write(vectors.tobytes())
+        self.ids.extend(ids)
+        self.titles.extend(titles if titles is not None else [None] * len(ids))
+        self.doc_types.extend(doc_types if doc_types is not None else [None] * len(ids))
+        self.doc_dates.extend(
+            [_iso(d) for d in doc_dates] if doc_dates is not None else [None] * len(ids))
+
+    def close(self) -> "LocalVectorIndex":
+        """Finish the matrix file, write the id table and open the index"""
+        self._file.close()
+        os.replace(self._tmp_path, self.matrix_path)
+
+        table = {
+            'dimensions': self.dimensions or 0,
+            'count': len(self.ids),
+            'ids': self.ids,
+            'titles': self.titles,
+            'doc_types': self.doc_types,
+            'doc_dates': self.doc_dates,
+        }
+        tmp_path = self.table_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(table, f)
+        os.replace(tmp_path, self.table_path)
+
+        logger.info(f"✓ Wrote {len(self.ids)} embeddings to {self.matrix_path}")
+        return LocalVectorIndex.load(self.root, self.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+            self._tmp_path.unlink(missing_ok=True)
+
+
+class LocalVectorIndex:
+    """Exact cosine top-k search over a memory-mapped embedding matrix"""
+
+    def __init__(self, matrix: np.ndarray, ids: List[str],
+                 titles: Optional[List[Optional[str]]] = None,
+                 doc_types: Optional[List[Optional[str]]] = None,
+                 doc_dates: Optional[List[Optional[str]]] = None):
+        """
+        Initialize index
+
+        Args:
+            matrix: (N, dimensions) float32 array of L2-normalized rows
+            ids: ELI URI per row
+            titles: Title per row
+            doc_types: source_type per row (used by document_types filters)
+            doc_dates: ISO date_document per row (used by date filters)
+        """
+        if len(matrix) != len(ids):
+            raise ValueError(f"{len(matrix)} vectors but {len(ids)} ids")
+        self.matrix = matrix
+        self.ids = ids
+        self.titles = titles or [None] * len(ids)
+        self._doc_types = np.array([t or '' for t in (doc_types or [None] * len(ids))], dtype=object)
+        self._doc_dates = np.array([(d or '')[:10] for d in (doc_dates or [None] * len(ids))],
+                                   dtype='U10')
+        self._positions = {uri: i for i, uri in enumerate(ids)}
+
+    @property
+    def dimensions(self) -> int:
+        return self.matrix.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def load(cls, root: str = "data/embeddings", name: str = "article_embeddings",
+             mmap: bool = True) -> "LocalVectorIndex":
+        """
+        Open an index written by VectorIndexWriter
+
+        Args:
+            root: Embeddings directory
+            name: Index name
+            mmap: Memory-map the matrix instead of reading it into RAM
+        """
+        root = Path(root)
+        with open(root / f"{name}.ids.json", 'r', encoding='utf-8') as f:
+            table = json.load(f)
+
+        count, dimensions = table['count'], table['dimensions']
+        matrix_path = root / f"{name}.f32"
+        if count == 0:
+            matrix = np.zeros((0, dimensions), dtype=np.float32)
+        elif mmap:
+            matrix = np.memmap(matrix_path, dtype=np.float32, mode='r', shape=(count, dimensions))
+        else:
+            matrix = np.fromfile(matrix_path, dtype=np.float32).reshape(count, dimensions)
+
+        logger.info(f"Loaded local vector index {name} ({count} × {dimensions})")
+        return cls(matrix, table['ids'], table.get('titles'),
+                   table.get('doc_types'), table.get('doc_dates'))
+
+    @classmethod
+    def build_from_neo4j(cls, client, root: str = "data/embeddings",
+                         name: str = "article_embeddings", label: str = "Article",
+                         property_name: str = "embedding",
+                         batch_size: int = 5000) -> "LocalVectorIndex":
+        """
+        Export node embeddings from Neo4j into a local index
+
+        Embeddings are streamed batch by batch straight into the matrix
+        file, so memory use does not grow with the number of nodes.
+
+        Args:
+            client: Connected Neo4jClient
+            root: Embeddings directory
+            name: Index name
+            label: Node label to export
+            property_name: Embedding property
+            batch_size: Records per streamed batch
+        """
+        if not (label.isidentifier() and property_name.isidentifier()):
+            raise ValueError(f"Invalid label or property: {label}.{property_name}")
+        cypher = EMBEDDINGS_EXPORT_QUERY.format(label=label, property=property_name)
+
+        logger.info(f"Exporting {label}.{property_name} embeddings to {root}/{name}")
+        with VectorIndexWriter(root, name) as writer:
+            for rows in client.stream_query(cypher, batch_size=batch_size, fetch_size=batch_size):
+                writer.add(
+                    [row['uri'] for row in rows],
+                    np.array([row['embedding'] for row in rows], dtype=np.float32),
+                    titles=[row['title'] for row in rows],
+                    doc_types=[row['doc_type'] for row in rows],
+                    doc_dates=[row['doc_date'] for row in rows],
+                )
+        return cls.load(root, name)
+
+    def vector(self, uri: str) -> Optional[np.ndarray]:
+        """Stored (normalized) embedding of a node"""
+        position = self._positions.get(uri)
+        return None if position is None else np.asarray(self.matrix[position])
+
+    def _filter_mask(self, document_types: Optional[Iterable[str]],
+                     date_from: Union[str, date, None],
+                     date_to: Union[str, date, None]) -> Optional[np.ndarray]:
+        """Boolean row mask for the filters (None = no filtering)"""
+        mask = None
+        if document_types:
+            mask = np.isin(self._doc_types, list(document_types))
+        if date_from:
+            rows = (self._doc_dates != '') & (self._doc_dates >= _iso(date_from)[:10])
+            mask = rows if mask is None else mask & rows
+        if date_to:
+            rows = (self._doc_dates != '') & (self._doc_dates <= _iso(date_to)[:10])
+            mask = rows if mask is None else mask & rows
+        return mask
+
+    def search(self, queries, top_k: int = 10,
+               document_types: Optional[Iterable[str]] = None,
+               date_from: Union[str, date, None] = None,
+               date_to: Union[str, date, None] = None,
+               chunk_rows: int = DEFAULT_CHUNK_ROWS) -> List[List[Tuple[int, float]]]:
+        """
+        Batched exact cosine top-k
+
+        The matrix is scored chunk by chunk (one matrix product per chunk
+        for all queries), keeping a running top-k per query.
+
+        Args:
+            queries: (Q, dimensions) array, or a single vector
+            top_k: Hits per query
+            document_types: Keep rows whose source_type is in this list (e.g. "german_law")
+            date_from: Keep rows dated on or after this date
+            date_to: Keep rows dated on or before this date
+            chunk_rows: Rows scored per matrix product
+
+        Returns:
+            Per query, (row, score) pairs best first; score is (1 + cosine) / 2
+            as returned by db.index.vector.queryNodes
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[None, :]
+        if queries.shape[1] != self.dimensions:
+            raise ValueError(f"Query dimension {queries.shape[1]} != index dimension {self.dimensions}")
+        queries = _normalize_rows(queries)
+
+        n_queries = len(queries)
+        k = min(top_k, len(self))
+        if k <= 0:
+            return [[] for _ in range(n_queries)]
+
+        mask = self._filter_mask(document_types, date_from, date_to)
+        best_scores = np.full((n_queries, 0), -np.inf, dtype=np.float32)
+        best_rows = np.zeros((n_queries, 0), dtype=np.int64)
+
+        for start in range(0, len(self), chunk_rows):
+            block = np.asarray(self.matrix[start:start + chunk_rows])
+            scores = queries @ block.T
+            if mask is not None:
+                scores[:, ~mask[start:start + len(block)]] = -np.inf
+
+            rows = np.broadcast_to(np.arange(start, start + len(block)), scores.shape)
+            scores = np.concatenate([best_scores, scores], axis=1)
+            rows = np.concatenate([best_rows, rows], axis=1)
+            if scores.shape[1] > k:
+                keep = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                scores = np.take_along_axis(scores, keep, axis=1)
+                rows = np.take_along_axis(rows, keep, axis=1)
+            best_scores, best_rows = scores, rows
+
+        order = np.argsort(-best_scores, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        best_rows = np.take_along_axis(best_rows, order, axis=1)
+        return [
+            [(int(row), float((1.0 + score) / 2.0)) for row, score in zip(rows, scores) if score > -np.inf]
+            for rows, scores in zip(best_rows, best_scores)
+        ]
+
+    def vector_search(self, embedding, limit: int = 10, candidates: Optional[int] = None,
+                      document_types: Optional[Iterable[str]] = None,
+                      date_from: Union[str, date, None] = None,
+                      date_to: Union[str, date, None] = None,
+                      **_) -> List[Dict]:
+        """
+        Top-k hits in the shape of Neo4jClient.vector_search
+
+        Filters are applied before ranking, so `candidates` is not needed
+        and only accepted for signature compatibility.
+
+        Returns:
+            Hits with uri, title and score ((1 + cosine) / 2), best first
+        """
+        hits = self.search(embedding, limit, document_types, date_from, date_to)[0]
+        return [
+            {'uri': self.ids[row], 'title': self.titles[row], 'score': score}
+            for row, score in hits
+        ]
+
+    def search_many(self, embeddings, limit: int = 10, **filters) -> List[List[Dict]]:
+        """vector_search for a batch of query embeddings"""
+        return [
+            [{'uri': self.ids[row], 'title': self.titles[row], 'score': score} for row, score in hits]
+            for hits in self.search(embeddings, limit, **filters)
+        ]
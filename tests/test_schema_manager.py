@@ -0,0 +1,178 @@
+"""
+Tests for src.graph.schema_manager against ontologies/graph-schema.cypher
+
+Run from the repository root:
+    python -m pytest -q tests
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, List
+
+from src.graph.schema_manager import (
+    SHOW_CONSTRAINTS_QUERY,
+    SHOW_INDEXES_QUERY,
+    SchemaMigrator,
+    load_schema_file,
+    parse_ddl,
+    split_statements,
+)
+
+GRAPH_SCHEMA = Path(__file__).resolve().parents[1] / "ontologies" / "graph-schema.cypher"
+
+DECLARED = {
+    # name: (kind, type, labels, properties)
+    'eli_work_uri': ('constraint', 'UNIQUENESS', ('ELIWork',), ('eli_uri',)),
+    'eli_expression_uri': ('constraint', 'UNIQUENESS', ('ELIExpression',), ('eli_uri',)),
+    'article_eli_uri': ('constraint', 'UNIQUENESS', ('Article',), ('eli_uri',)),
+    'ecli_identifier': ('constraint', 'UNIQUENESS', ('CourtDecision',), ('ecli',)),
+    'court_code': ('constraint', 'UNIQUENESS', ('Court',), ('country_code', 'court_code')),
+    'eurovoc_concept_id': ('constraint', 'UNIQUENESS', ('LegalConcept',), ('eurovoc_id',)),
+    'sgb_book': ('constraint', 'UNIQUENESS', ('SocialLawBook',), ('book_number',)),
+    'process_id': ('constraint', 'UNIQUENESS', ('BusinessProcess',), ('process_id',)),
+    'article_text': ('index', 'FULLTEXT', ('Article',), ('title', 'text_content')),
+    'decision_text': ('index', 'FULLTEXT', ('CourtDecision',), ('title', 'summary')),
+    'work_text': ('index', 'FULLTEXT', ('ELIWork',), ('title_de', 'title_en')),
+    'article_date': ('index', 'RANGE', ('Article',), ('effective_date',)),
+    'decision_date': ('index', 'RANGE', ('CourtDecision',), ('decision_date',)),
+    'document_type': ('index', 'RANGE', ('ELIWork',), ('type_document',)),
+    'directive_transposition': ('index', 'RANGE', ('EUDirective',),
+                                ('transposition_state', 'transposition_deadline')),
+    'article_book_number': ('index', 'RANGE', ('Article',), ('sgb_book', 'article_number')),
+    'article_embeddings': ('index', 'VECTOR', ('Article',), ('embedding',)),
+    'concept_embeddings': ('index', 'VECTOR', ('LegalConcept',), ('embedding',)),
+}
+
+
+class FakeClient:
+    """Answers SHOW CONSTRAINTS / SHOW INDEXES with canned rows"""
+
+    def __init__(self, constraints: List[Dict] = (), indexes: List[Dict] = ()):
+        self.constraints = list(constraints)
+        self.indexes = list(indexes)
+
+    def execute_query_list(self, cypher: str, parameters: Dict = None) -> List[Dict]:
+        if cypher == SHOW_CONSTRAINTS_QUERY:
+            return self.constraints
+        if cypher == SHOW_INDEXES_QUERY:
+            return self.indexes
+        raise AssertionError(f"Unexpected query: {cypher}")
+
+
+def _constraint(name, labels, properties, kind='UNIQUENESS'):
+    return {'name': name, 'type': kind, 'entityType': 'NODE',
+            'labelsOrTypes': list(labels), 'properties': list(properties)}
+
+
+def _index(name, labels, properties, kind='RANGE', owning_constraint=None):
+    return {'name': name, 'type': kind, 'entityType': 'NODE',
+            'labelsOrTypes': list(labels), 'properties': list(properties),
+            'state': 'ONLINE', 'populationPercent': 100.0,
+            'owningConstraint': owning_constraint}
+
+
+# ----------------------------------------------------------------------
+# split_statements
+# ----------------------------------------------------------------------
+
+def test_split_statements_ignores_semicolons_in_strings_identifiers_and_comments():
+    text = (
+        "CREATE (n {a: 'x;y', `b;c`: \"q\\\";\"}); // trailing; comment\n"
+        "MATCH (n) /* block; comment */ RETURN n;\n"
+        "   \n"
+    )
+    statements = list(split_statements(text))
+
+    assert len(statements) == 2
+    assert statements[0] == "CREATE (n {a: 'x;y', `b;c`: \"q\\\";\"})"
+    assert statements[1].startswith("MATCH (n)")
+    assert statements[1].endswith("RETURN n")
+    assert 'comment' not in ''.join(statements)
+
+
+def test_split_statements_keeps_last_statement_without_semicolon():
+    assert list(split_statements("RETURN 1;\nRETURN 2")) == ["RETURN 1", "RETURN 2"]
+
+
+# ----------------------------------------------------------------------
+# parse_ddl / load_schema_file
+# ----------------------------------------------------------------------
+
+def test_graph_schema_declares_expected_objects(caplog):
+    with caplog.at_level(logging.WARNING, logger='src.graph.schema_manager'):
+        objects, skipped = load_schema_file(str(GRAPH_SCHEMA))
+
+    assert not caplog.records, "every CREATE CONSTRAINT/INDEX statement must parse"
+    assert skipped > 0, "the sample data statements are skipped, not parsed"
+    parsed = {obj.name: (obj.kind, obj.type, obj.labels, obj.properties) for obj in objects}
+    assert parsed == DECLARED
+    assert all(obj.entity == 'NODE' for obj in objects)
+    assert all(obj.statement.upper().startswith('CREATE') for obj in objects)
+
+
+def test_parse_ddl_returns_none_for_data_statements():
+    assert parse_ddl("CREATE (w:ELIWork {eli_uri: 'x'})") is None
+    assert parse_ddl("MATCH (n) RETURN n") is None
+
+
+def test_parse_ddl_relationship_index_and_quoted_names():
+    obj = parse_ddl("CREATE INDEX `amends date` IF NOT EXISTS "
+                    "FOR ()-[r:AMENDS]-() ON (r.`valid from`)")
+
+    assert obj.name == 'amends date'
+    assert obj.entity == 'RELATIONSHIP'
+    assert obj.labels == ('AMENDS',)
+    assert obj.properties == ('valid from',)
+
+
+def test_signature_ignores_name():
+    a = parse_ddl("CREATE INDEX a FOR (n:Article) ON (n.effective_date)")
+    b = parse_ddl("CREATE RANGE INDEX b IF NOT EXISTS FOR (x:Article) ON (x.effective_date)")
+    c = parse_ddl("CREATE TEXT INDEX c FOR (n:Article) ON (n.effective_date)")
+
+    assert a.signature == b.signature
+    assert a.signature != c.signature
+
+
+# ----------------------------------------------------------------------
+# MigrationPlan
+# ----------------------------------------------------------------------
+
+def test_plan_against_empty_database_creates_everything():
+    plan = SchemaMigrator(FakeClient(), [str(GRAPH_SCHEMA)]).plan()
+
+    assert [obj.name for obj in plan.to_create] == list(DECLARED)
+    assert not (plan.up_to_date or plan.equivalent or plan.conflicts or plan.undeclared)
+
+
+def test_plan_classifies_existing_objects():
+    client = FakeClient(
+        constraints=[
+            _constraint('eli_work_uri', ['ELIWork'], ['eli_uri']),
+            # Renamed but identical definition
+            _constraint('constraint_ecli', ['CourtDecision'], ['ecli']),
+        ],
+        indexes=[
+            # Backing index of a constraint: managed through the constraint
+            _index('eli_work_uri', ['ELIWork'], ['eli_uri'], owning_constraint='eli_work_uri'),
+            _index('index_343aff4e', [], [], kind='LOOKUP'),
+            # Neo4j 4.x name for a range index
+            _index('article_date', ['Article'], ['effective_date'], kind='BTREE'),
+            _index('ft_work', ['ELIWork'], ['title_de', 'title_en'], kind='FULLTEXT'),
+            # Same name, different definition
+            _index('document_type', ['ELIWork'], ['source_type']),
+            _index('legacy_index', ['Article'], ['legacy']),
+        ],
+    )
+    plan = SchemaMigrator(client, [str(GRAPH_SCHEMA)]).plan()
+
+    assert sorted(plan.up_to_date) == ['article_date', 'eli_work_uri']
+    assert plan.equivalent == {'ecli_identifier': 'constraint_ecli', 'work_text': 'ft_work'}
+    assert list(plan.conflicts) == ['document_type']
+    assert 'source_type' in plan.conflicts['document_type']
+    assert plan.undeclared == ['legacy_index']
+
+    to_create = {obj.name for obj in plan.to_create}
+    handled = set(plan.up_to_date) | set(plan.equivalent) | set(plan.conflicts)
+    assert to_create == set(DECLARED) - handled
+    assert plan.summary().startswith(f"{len(to_create)} to create, 2 up to date, 2 equivalent")